@@ -0,0 +1,99 @@
+"""
+Charges table throughput on a synthetic charges set.
+
+Times the `Split` step of `split_charges()` as a per-row Python
+`re.split` apply (the previous implementation) against the native
+`str.replace_all` + `str.split` expression, checks that both give the
+same pieces, then times the full charges table.
+
+    python benchmarks/charges.py --rows 200000
+"""
+
+import os, sys, re, time, random
+
+import click
+import polars as pl
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from alacorder import alac
+
+CITE = r"[A-Z0-9]{3}\s*?-[A-Z0-9]{3}\s*?-[A-Z0-9]{3}\(*?[A-Z]*?\)*?\(*?[A-Z0-9]*?\)*?\.*?\d*?"
+
+CODES = ["TOP1", "MAN1", "ROB3", "POSS", "DUI1", "RAP2", "BUR2", "TRAF"]
+DESCS = [
+    "THEFT OF PROPERTY 1ST",
+    "MANSLAUGHTER",
+    "ROBBERY III",
+    "POSSESSION OF MARIJUANA 2ND",
+    "DUI-ALCOHOL",
+    "BURGLARY 2ND",
+]
+TYPES = ["FELONY", "MISDEMEANOR", "VIOLATION", "TRAFFIC MISDEMEANOR"]
+CATEGORIES = ["PROPERTY", "PERSONAL", "DRUG", "TRAFFIC", "OTHER"]
+ACTIONS = ["GUILTY PLEA", "DISMISSED", "NOL PROSS", "CONVICTED", "BOUND"]
+CITES = ["13A-008-003", "13A-006-004", "13A-008-043", "13A-012-214", "32-005A-191(A)"]
+
+
+def make_charges(rows, seed=0):
+    """
+    Return exploded charges DataFrame like `explode_charges()` output with `rows` filing and disposition charge lines.
+    """
+    rng = random.Random(seed)
+    charges = []
+    for i in range(rows):
+        num = f"{1 + i % 4:03d}"
+        code, desc, cite = rng.choice(CODES), rng.choice(DESCS), rng.choice(CITES)
+        kind, cat = rng.choice(TYPES), rng.choice(CATEGORIES)
+        if i % 2:
+            action = rng.choice(ACTIONS)
+            charges.append(
+                f"{num} {code} 01/02/2020 {action} {kind} {cat} {cite} {desc}"
+            )
+        else:
+            charges.append(f"{num} {code} S {desc} {cite} {kind} {cat}")
+    return pl.DataFrame(
+        {
+            "Name": [f"DOE JOHN {i // 4}" for i in range(rows)],
+            "CaseNumber": [f"01-CC-2020-{i // 4:06d}.00" for i in range(rows)],
+            "Charges": charges,
+            "TotalBalance": 0.0,
+            "TotalD999": 0.0,
+        }
+    )
+
+
+def best(f, repeat):
+    """
+    Return result and fastest wall time in seconds of `repeat` calls to `f`.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        out = f()
+        times.append(time.perf_counter() - start)
+    return out, min(times)
+
+
+@click.command()
+@click.option("--rows", "-n", default=200000, help="Synthetic charge lines")
+@click.option("--repeat", "-r", default=3, help="Best of this many runs")
+def main(rows, repeat):
+    df = make_charges(rows)
+    before = pl.col("Charges").apply(lambda x: re.split(CITE, str(x)))
+    after = pl.col("Charges").str.replace_all(CITE, "\x1f").str.split("\x1f")
+
+    old, t_old = best(lambda: df.select(before), repeat)
+    new, t_new = best(lambda: df.select(after), repeat)
+    if not old.frame_equal(new):
+        raise SystemExit("Native split differs from re.split()")
+    _, t_table = best(lambda: alac.split_charges(df), repeat)
+
+    print(f"charge lines            {rows:>12,}")
+    print(f"Split, Python apply     {rows / t_old:>12,.0f} rows/s")
+    print(f"Split, native           {rows / t_new:>12,.0f} rows/s")
+    print(f"Split speedup           {t_old / t_new:>12.1f}x")
+    print(f"split_charges() table   {rows / t_table:>12,.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+PDF download throughput and correctness against a local mock Alacourt server.
+
+Serves synthetic case detail PDFs from a threaded local HTTP server that
+adds per-request latency, fails the first request for every third PDF
+with HTTP 503 and answers the first request for every fifth with an HTML
+login page, and only serves requests carrying the session cookie. Times
+`download_pdfs()` with one worker against `--workers` workers, and
+checks that every PDF arrives intact with no partial files left behind,
+that a missing PDF raises instead of being retried, and that different
+PDFs served under the same file name (`/same/<i>`) are all kept while
+downloading one twice keeps a single copy.
+
+    python benchmarks/downloads.py --pdfs 200 --workers 8
+"""
+
+import os, sys, time, tempfile, threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import click, urllib3
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from alacorder import alac
+
+COOKIE = "ASP.NET_SessionId=mock"
+
+
+def make_pdf(i):
+    """
+    Return bytes of a minimal PDF for case `i`.
+    """
+    return b"%PDF-1.4\n" + f"% case {i:06d}\n".encode() * 2000 + b"%%EOF\n"
+
+
+def mock_server(latency=0.05):
+    """
+    Return running local HTTP server serving `/pdf/<i>` as `make_pdf(i)` to requests with `COOKIE`, with transient failures as described above.
+    """
+    seen = set()
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            time.sleep(latency)
+            i = int(self.path.rsplit("/", 1)[-1])
+            same = self.path.startswith("/same/")
+            with lock:
+                first = i not in seen
+                seen.add(i)
+            if COOKIE not in self.headers.get("Cookie", "") or i < 0:
+                return self.send_error(404)
+            if first and i % 3 == 0 and not same:
+                return self.send_error(503)
+            if first and i % 5 == 0 and not same:
+                body = b"<html>Login</html>"
+            else:
+                body = make_pdf(i)
+            name = "case.pdf" if same else f"case{i:06d}.pdf"
+            self.send_response(200)
+            self.send_header("Content-Disposition", f'attachment; filename="{name}"')
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(url, pdfs, workers, first):
+    """
+    Download `pdfs` PDFs numbered from `first` from mock server at `url` with `workers` threads to a new directory. Returns seconds taken, raising SystemExit if any PDF is wrong.
+    """
+    urls = [f"{url}/pdf/{i}" for i in range(first, first + pdfs)]
+    headers = {"Cookie": COOKIE, "User-Agent": "alacorder"}
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        paths = alac.download_pdfs(
+            alac.http_client(workers),
+            urls,
+            tmp,
+            headers=headers,
+            workers=workers,
+            backoff=0.01,
+        )
+        elapsed = time.perf_counter() - start
+        for i, path in zip(range(first, first + pdfs), paths):
+            with open(path, "rb") as f:
+                if f.read() != make_pdf(i):
+                    raise SystemExit(f"Wrong contents for PDF {i}: {path}")
+        if len(os.listdir(tmp)) != pdfs:
+            raise SystemExit(f"Expected {pdfs} files, found {os.listdir(tmp)}")
+    return elapsed
+
+
+@click.command()
+@click.option("--pdfs", "-n", default=200, help="PDFs to download per run")
+@click.option("--workers", "-w", default=8, help="Concurrent downloads")
+@click.option("--latency", default=0.05, help="Mock server seconds per request")
+def main(pdfs, workers, latency):
+    server = mock_server(latency)
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    t_one = run(url, pdfs, 1, 0)
+    t_many = run(url, pdfs, workers, pdfs)
+    headers = {"Cookie": COOKIE}
+    with tempfile.TemporaryDirectory() as tmp:
+        try:
+            alac.download_pdfs(
+                alac.http_client(), [f"{url}/pdf/-1"], tmp, headers=headers
+            )
+            raise SystemExit("Missing PDF did not raise")
+        except urllib3.exceptions.HTTPError:
+            pass
+        if os.listdir(tmp):
+            raise SystemExit(f"Partial files left behind: {os.listdir(tmp)}")
+        urls = [f"{url}/same/{i}" for i in range(pdfs)]
+        client = alac.http_client(workers)
+        paths = alac.download_pdfs(client, urls, tmp, headers=headers, workers=workers)
+        paths += alac.download_pdfs(client, urls[:1], tmp, headers=headers)
+        for i, path in zip(list(range(pdfs)) + [0], paths):
+            with open(path, "rb") as f:
+                if f.read() != make_pdf(i):
+                    raise SystemExit(f"Same name PDF {i} overwritten: {path}")
+        if len(os.listdir(tmp)) != pdfs:
+            raise SystemExit(f"Expected {pdfs} files, found {len(os.listdir(tmp))}")
+    server.shutdown()
+
+    print(f"pdfs                    {pdfs:>12,}")
+    print(f"1 worker                {pdfs / t_one:>12,.1f} pdfs/s")
+    print(f"{f'{workers} workers':<24}{pdfs / t_many:>12,.1f} pdfs/s")
+    print(f"speedup                 {t_one / t_many:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
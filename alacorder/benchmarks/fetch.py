@@ -0,0 +1,404 @@
+"""
+Multi-session fetch throughput and exactly-once row completion against a
+local stand-in Alacourt server.
+
+Serves the login page, Party Search form, search results and case detail
+PDFs under Alacourt's element names and paths from a threaded local HTTP
+server with per-request latency, pointing `ALACOURT_URL` at it. Each
+browser session is a `StandInBrowser`, a minimal WebDriver that parses
+the served pages and submits their forms over HTTP, so `login()`,
+`party_search()` and `fetch_session()` run unchanged without Chrome.
+Party names return 0-3 cases each, and the only PDF of one name fails
+with HTTP 404 on its first download.
+
+Runs `fetch()` on a `--rows` row query with one session and again with
+`--sessions` sessions, each twice. Checks that the first pass searches
+every row exactly once, marks every row but the failing one complete
+with its case count, removes the journal and downloads every PDF once,
+and that the second pass searches only the failed row and completes it.
+
+    python benchmarks/fetch.py --rows 40 --sessions 4
+"""
+
+import io, os, re, sys, time, tempfile, threading, contextlib
+from collections import Counter
+from html.parser import HTMLParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urljoin, urlsplit
+
+import click, urllib3
+import polars as pl
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from alacorder import alac
+from alacorder import fetch as alacourt
+
+USER = {"cus": "C123", "user": "U123", "pwd": "secret"}
+FIELD = "ctl00$ContentPlaceHolder1$"
+LOGIN_PAGE = """<html><body><form method="post" action="/frmlogin.aspx">
+<input type="text" name="ctl00$ContentPlaceHolder$txtCusid">
+<input type="text" name="ctl00$ContentPlaceHolder$txtUserId">
+<input type="password" name="ctl00$ContentPlaceHolder$txtPassword">
+<input type="submit" id="ContentPlaceHolder_btLogin" value="Login">
+</form></body></html>"""
+SEARCH_PAGE = """<html><body><form method="post" action="/frmIndexSearchForm.aspx">
+<input type="text" name="{f}txtName"><input type="text" name="{f}txtSSN">
+<input type="text" name="{f}txtDOB"><input type="text" name="{f}txtFrom">
+<input type="text" name="{f}txtTo">
+<select name="{f}rdlPartyType"><option value="A">ALL</option>
+<option value="D">Defendants</option><option value="P">Plaintiffs</option></select>
+<select name="{f}ddlCounties"><option value="0">All Counties</option>
+<option value="1">Calhoun</option><option value="2">Jefferson</option></select>
+<select name="{f}UcddlDivisions1$ddlDivision"><option value="ALL">All Divisions</option>
+<option value="CC">CC - CIRCUIT - CRIMINAL</option></select>
+<select name="{f}ddlCaseYear"><option value="">All</option>
+<option value="2020">2020</option></select>
+<select name="{f}ddlNumberOfRecords"><option value="100">100</option>
+<option value="1000">1000</option></select>
+<input type="submit" id="searchButton" value="Search">
+</form></body></html>""".format(
+    f=FIELD
+)
+
+
+def cases_for(name):
+    """
+    Return list of case numbers the stand-in server finds for party `name`, 0-3 of them by its row number.
+    """
+    k = int(name.split()[-1])
+    return [f"{k:04d}-{j}" for j in range(k % 4)]
+
+
+def make_pdf(case):
+    """
+    Return bytes of a minimal PDF for `case`.
+    """
+    return b"%PDF-1.4\n" + f"% case {case}\n".encode() * 200 + b"%%EOF\n"
+
+
+def stand_in_server(flaky, latency=0.02):
+    """
+    Return running local HTTP server standing in for Alacourt.com, counting Party Searches per name in `server.searches`. The first download of PDF `flaky` fails with HTTP 404.
+    """
+    lock = threading.Lock()
+    sessions = {}
+    failed = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def authed(self):
+            cookie = re.search(r"session=(\w+)", self.headers.get("Cookie", ""))
+            return cookie != None and cookie.group(1) in sessions
+
+        def page(self, body):
+            body = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def redirect(self, path, cookie=None):
+            self.send_response(302)
+            if cookie != None:
+                self.send_header("Set-Cookie", f"session={cookie}; Path=/")
+            self.send_header("Location", path)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_GET(self):
+            time.sleep(latency)
+            url = urlsplit(self.path)
+            if url.path == "/frmlogin.aspx":
+                return self.page(LOGIN_PAGE)
+            if not self.authed():
+                return self.redirect("/frmlogin.aspx")
+            if url.path == "/frmIndexSearchForm.aspx":
+                return self.page(SEARCH_PAGE)
+            if url.path == "/frmCaseDetailPDF.aspx":
+                case = parse_qs(url.query)["case"][0]
+                with lock:
+                    first = case not in failed
+                    failed[case] = True
+                if case == flaky and first:
+                    return self.send_error(404)
+                body = make_pdf(case)
+                self.send_response(200)
+                self.send_header(
+                    "Content-Disposition", f'attachment; filename="{case}.pdf"'
+                )
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                return self.wfile.write(body)
+            self.send_error(404)
+
+        def do_POST(self):
+            time.sleep(latency)
+            size = int(self.headers.get("Content-Length", 0))
+            form = {
+                k: v[0] for k, v in parse_qs(self.rfile.read(size).decode()).items()
+            }
+            if self.path == "/frmlogin.aspx":
+                login = (
+                    form.get("ctl00$ContentPlaceHolder$txtCusid"),
+                    form.get("ctl00$ContentPlaceHolder$txtUserId"),
+                    form.get("ctl00$ContentPlaceHolder$txtPassword"),
+                )
+                if login != (USER["cus"], USER["user"], USER["pwd"]):
+                    return self.page(LOGIN_PAGE)
+                with lock:
+                    cookie = f"s{len(sessions)}"
+                    sessions[cookie] = True
+                return self.redirect("/frmIndexSearchForm.aspx", cookie)
+            if not self.authed():
+                return self.redirect("/frmlogin.aspx")
+            if form.get(f"{FIELD}ddlNumberOfRecords") != "1000":
+                return self.send_error(400)
+            name = form.get(f"{FIELD}txtName", "")
+            with lock:
+                server.searches[name] += 1
+            found = cases_for(name)
+            links = "".join(
+                f'<a class="menuHover" href="/frmCaseDetailPDF.aspx?PDF=1&case={c}">'
+                f"{c}</a>"
+                for c in found
+            )
+            self.page(
+                '<html><body><span id="ContentPlaceHolder1_lblResultCount">'
+                f"Search Results: {len(found)} records returned.</span>"
+                f"{links}</body></html>"
+            )
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.searches = Counter()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class Element:
+    """
+    Element of a page parsed by `StandInBrowser`, with the WebElement methods `login()` and `party_search()` call, including those `selenium.webdriver.support.ui.Select` needs.
+    """
+
+    def __init__(self, browser, tag, attrs, parent=None):
+        self.browser = browser
+        self.tag_name = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.text = ""
+        self.options = []
+
+    def get_attribute(self, name):
+        value = self.attrs.get(name)
+        if name == "href" and value != None:
+            return urljoin(self.browser.current_url, value)
+        return value
+
+    def get_dom_attribute(self, name):
+        return self.attrs.get(name)
+
+    def value_of_css_property(self, name):
+        return ""
+
+    def is_enabled(self):
+        return True
+
+    def is_selected(self):
+        return self.parent.attrs.get("value") == self.attrs.get("value")
+
+    def send_keys(self, keys):
+        self.attrs["value"] = self.attrs.get("value", "") + keys
+
+    def click(self):
+        if self.tag_name == "option":
+            self.parent.attrs["value"] = self.attrs.get("value")
+        elif self.attrs.get("type") == "submit":
+            self.browser.submit()
+
+    def find_elements(self, by, value):
+        text = re.search(r'"(.*)"', value).group(1)  # option xpaths from Select
+        if "contains(" in value:
+            return [o for o in self.options if text in o.text]
+        return [o for o in self.options if " ".join(o.text.split()) == text]
+
+
+class StandInBrowser(HTMLParser):
+    """
+    Minimal stand-in for the selenium Chrome WebDriver `start_driver()` returns: loads pages over HTTP following redirects, keeps session cookies, and submits the page's form when its submit button is clicked.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.http = urllib3.PoolManager()
+        self.cookies = {}
+        self.current_url = ""
+        self.elements = []
+        self.action = ""
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {k: v or "" for k, v in attrs}
+        if tag == "form":
+            self.action = attrs.get("action", "")
+            return
+        select = [e for e in self.elements if e.tag_name == "select"]
+        parent = select[-1] if tag == "option" and select else None
+        el = Element(self, tag, attrs, parent)
+        if parent != None:
+            parent.options.append(el)
+            if "value" not in parent.attrs:  # first option is selected
+                parent.attrs["value"] = attrs.get("value")
+        self.elements.append(el)
+
+    def handle_data(self, data):
+        if len(self.elements) > 0:
+            self.elements[-1].text += data
+
+    def request(self, method, url, fields=None):
+        for _ in range(10):
+            cookie = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+            if method == "POST":
+                r = self.http.request_encode_body(
+                    method,
+                    url,
+                    fields=fields,
+                    headers={"Cookie": cookie},
+                    encode_multipart=False,
+                    redirect=False,
+                )
+            else:
+                r = self.http.request(
+                    method, url, headers={"Cookie": cookie}, redirect=False
+                )
+            cookies = r.headers.get("Set-Cookie", "")
+            for k, v in re.findall(r"(\w+)=(\w+); Path", cookies):
+                self.cookies[k] = v
+            if r.status not in (301, 302, 303):
+                break
+            method, fields = "GET", None
+            url = urljoin(url, r.headers["Location"])
+        self.current_url = url
+        self.elements = []
+        self.reset()
+        self.feed(r.data.decode())
+
+    def get(self, url):
+        self.request("GET", url)
+
+    def submit(self):
+        fields = {
+            e.attrs["name"]: e.attrs.get("value", "")
+            for e in self.elements
+            if "name" in e.attrs and e.tag_name in ("input", "select")
+        }
+        self.request("POST", urljoin(self.current_url, self.action), fields)
+
+    def find_elements(self, by, value):
+        from selenium.webdriver.common.by import By
+
+        if by == By.CLASS_NAME:
+            return [
+                e for e in self.elements if value in e.attrs.get("class", "").split()
+            ]
+        key = {By.NAME: "name", By.ID: "id"}[by]
+        return [e for e in self.elements if e.attrs.get(key) == value]
+
+    def find_element(self, by, value):
+        from selenium.common.exceptions import NoSuchElementException
+
+        found = self.find_elements(by, value)
+        if len(found) == 0:
+            raise NoSuchElementException(f"{by}={value} not on {self.current_url}")
+        return found[0]
+
+    def get_cookies(self):
+        return [{"name": k, "value": v} for k, v in self.cookies.items()]
+
+    def execute_script(self, script):
+        return "alacorder-benchmark"
+
+    def implicitly_wait(self, seconds):
+        pass
+
+    def quit(self):
+        self.http.clear()
+
+
+def quiet():
+    """
+    Return context manager discarding what `fetch()` prints.
+    """
+    stack = contextlib.ExitStack()
+    stack.enter_context(contextlib.redirect_stdout(io.StringIO()))
+    stack.enter_context(contextlib.redirect_stderr(io.StringIO()))
+    return stack
+
+
+def run(rows, sessions, latency):
+    """
+    Fetch a `rows` row query from a new stand-in server with `sessions` sessions twice, checking each pass as described above. Returns seconds taken by the first pass, raising SystemExit on any check that fails.
+    """
+    names = [f"PARTY {k:04d}" for k in range(rows)]
+    flaky = next(n for n in names[rows // 2 :] if len(cases_for(n)) == 1)
+    server = stand_in_server(cases_for(flaky)[0], latency)
+    alacourt.ALACOURT_URL = f"http://127.0.0.1:{server.server_address[1]}"
+    with tempfile.TemporaryDirectory() as tmp:
+        query = os.path.join(tmp, "query.csv")
+        pl.DataFrame({"NAME": names}).write_csv(query)
+        pdfs = os.path.join(tmp, "pdfs")
+        args = [query, pdfs, USER["cus"], USER["user"], USER["pwd"]]
+
+        start = time.perf_counter()
+        with quiet():
+            alac.fetch(*args, sessions=sessions)
+        elapsed = time.perf_counter() - start
+        done = pl.read_csv(query, infer_schema_length=0)  # all columns as strings
+        if "QUERY_COMPLETE" not in done.columns:
+            raise SystemExit("fetch() completed no query rows")
+        done = done.with_columns(pl.col("QUERY_COMPLETE").fill_null(""))
+        for name, complete, found in done.select(
+            ["NAME", "QUERY_COMPLETE", "CASES_FOUND"]
+        ).rows():
+            if server.searches[name] != 1:
+                raise SystemExit(f"{name} searched {server.searches[name]} times")
+            want = "" if name == flaky else "Y"
+            if complete != want:
+                raise SystemExit(f"{name} QUERY_COMPLETE {complete!r}, not {want!r}")
+            if name != flaky and found != str(len(cases_for(name))):
+                raise SystemExit(f"{name} CASES_FOUND {found}")
+        if os.path.exists(alac.query_journal(query)):
+            raise SystemExit("Journal left behind after fetch")
+        got = Counter(f for _, _, files in os.walk(pdfs) for f in files)
+        want = Counter(f"{c}.pdf" for n in names if n != flaky for c in cases_for(n))
+        if got != want:
+            raise SystemExit(f"Downloaded {got - want} extra, {want - got} missing")
+
+        with quiet():
+            alac.fetch(*args, sessions=sessions)
+        searched = {n: k for n, k in server.searches.items() if k != 1}
+        if searched != {flaky: 2}:
+            raise SystemExit(f"Second pass searched {searched}, not only {flaky}")
+        if pl.read_csv(query)["QUERY_COMPLETE"].to_list() != ["Y"] * rows:
+            raise SystemExit("Second pass left rows incomplete")
+    server.shutdown()
+    return elapsed
+
+
+@click.command()
+@click.option("--rows", "-n", default=40, help="Query rows per run")
+@click.option("--sessions", "-s", default=4, help="Concurrent browser sessions")
+@click.option("--latency", default=0.02, help="Stand-in server seconds per request")
+def main(rows, sessions, latency):
+    alacourt.start_driver = lambda path="": StandInBrowser()
+    t_one = run(rows, 1, latency)
+    t_many = run(rows, sessions, latency)
+
+    print(f"rows                    {rows:>12,}")
+    print(f"1 session               {rows / t_one:>12,.1f} rows/s")
+    print(f"{f'{sessions} sessions':<24}{rows / t_many:>12,.1f} rows/s")
+    print(f"speedup                 {t_one / t_many:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
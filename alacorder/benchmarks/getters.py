@@ -0,0 +1,116 @@
+"""
+Getter throughput and parity on a synthetic case text corpus.
+
+Times every `get*()` getter applied row by row to `AllPagesText` (one
+Python call per row per field) against `extract_fields()` in one
+vectorised pass, and checks that both give the same value for every
+field of every case. Every other case also carries the sentencing,
+appeal, warrant and bond fields the synthetic archive leaves out, so
+each getter is compared on cases with and without its field. Malformed
+and edge case texts (empty, truncated mid-field, labels without values,
+repeated fields, a Weight too long for a 64-bit integer, non-ASCII
+names) are appended to the corpus. Exits non-zero if any field differs,
+so it doubles as the getter parity check.
+
+    python benchmarks/getters.py --cases 2000
+"""
+
+import os, re, sys, time
+
+import click
+import polars as pl
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from alacorder import alac
+from synth import make_archive
+
+EXTRA_FIELDS = "\n".join(
+    [
+        "Youthful Date: 02/03/2019 Indictment Date: 03/04/2019 Inpatient Treatment Ordered: NO Probation Office #: 0-123456-00",
+        "MUNICIPAL POLICE Arresting Agency Type: Arresting Officer: JONES BOB Probation Office Name: CALH01",
+        "Traffic Citation #: TC12345 Previous DUI Convictions: 001 Case Initiation Type: ARREST Domestic Violence: N Agency ORI: CALHOUN CO SHERIFF",
+        "Driver License N°: D1234567 AL123456789 State ID:",
+        "01/05/2019 Warrant Issuance Date: Warrant Action Date: 01/06/2019 Warrant Issuance Status: A Warrant Action Status: S Warrant Location Status: L Number Of Warrants: 001 000",
+        "Surety Code: SUR1 Release Date: 01/07/2019 Failed to Appear Date: 02/07/2019 Bondsman Process Issuance: 01/08/2019 Bondsman Process Return: 01/09/2019 Number of Subponeas: 002",
+        "01/10/2020 Appeal Court: CRIMINAL APPEALS Appeal Case Number: CR-20-0001 Orgin Of Appeal: DISTRICT Appeal To Desc: CIRCUIT Appeal Status: ACTIVE Appeal To: C Appeal",
+        "LowerCourt Appeal Date: 01/11/2020 Disposition Date Of Appeal: 01/12/2020 Disposition Type Of Appeal: 12 Updated By: ABC Transfer to Admin Doc Date: 01/13/2020 Transfer Desc: TRANSFER 01/14/2020",
+        "Date Trial Began but No Verdict (TBNV1): 01/15/2020",
+        "Date Trial Began but No Verdict (TBNV2): 01/16/2020",
+        "Requrements Completed: YES Sentence Date: 01/17/2020 Probation Period: 002 Years. License Susp Period: 000 Years. Jail Credit Period: 010 Days. Sentence Provisions: Y",
+        "Sentence Start Date: 01/18/2020 Sentence End Date: 01/18/2022 Probation Begin Date: 01/19/2020 Last Update: 01/20/2020 Probation Revoke: 01/21/2021",
+    ]
+)
+
+
+def edge_cases(text):
+    """
+    Return malformed and edge case variants of case text `text`.
+    """
+    labels = re.sub(r": \S+", ": ", EXTRA_FIELDS)
+    return [
+        "",
+        " ",
+        "Case Action Summary",
+        text[: len(text) // 3],
+        text[: text.find("Weight: ") + len("Weight: ") + 1],
+        re.sub(r"Weight: \d+", "Weight: 99999999999999999999999", text, 1),
+        re.sub(r"Weight: \d+", "Weight: 9223372036854775807", text, 1),
+        re.sub(r"Weight: \d+", "Weight: 9223372036854775808", text, 1),
+        re.sub(r"Weight: \d+", "Weight: 0", text, 1),
+        EXTRA_FIELDS.replace("Subponeas: 002", "Subponeas: 99"),
+        f"{labels}\n{text}",
+        f"{EXTRA_FIELDS}\n{EXTRA_FIELDS}\n{text}",
+        re.sub(r"[A-Z]{3,}", lambda m: m[0].replace("E", "É"), text),
+        text.replace("\n", " "),
+        text.replace(": ", ":"),
+    ]
+
+
+def make_corpus(cases, seed=0):
+    """
+    Return list of `cases` synthetic case texts, every other one with `EXTRA_FIELDS` before its Case Action Summary, then `edge_cases()` of the first.
+    """
+    texts = make_archive(cases, seed=seed)["AllPagesText"].to_list()
+    texts = [
+        t.replace("Case Action Summary", f"{EXTRA_FIELDS}\nCase Action Summary", 1)
+        if i % 2
+        else t
+        for i, t in enumerate(texts)
+    ]
+    return texts + edge_cases(texts[min(1, len(texts) - 1)])
+
+
+@click.command()
+@click.option("--cases", "-n", default=2000, help="Synthetic cases")
+@click.option("--seed", default=0, help="Random seed")
+def main(cases, seed):
+    texts = make_corpus(cases, seed)
+    fields = list(alac.GETTER_EXPRS)
+
+    start = time.perf_counter()  # getters return int or "", which apply() would cast
+    scalar = {f: [alac.CASE_RECORD_FIELDS[f](t) for t in texts] for f in fields}
+    t_scalar = time.perf_counter() - start
+    start = time.perf_counter()
+    batch = alac.extract_fields(pl.Series("AllPagesText", texts), fields)
+    t_batch = time.perf_counter() - start
+
+    bad = []
+    for f in fields:  # getters return "" where number fields are null
+        got = ["" if x is None else x for x in batch[f].to_list()]
+        for i, (a, b) in enumerate(zip(got, scalar[f])):
+            if a != b:
+                bad.append(f)
+                print(f"{f}: case {i} extract_fields() {a!r}, getter {b!r}"[:200])
+                break
+    if len(bad) > 0:
+        raise SystemExit(f"extract_fields() differs from getters: {', '.join(bad)}")
+
+    print(f"cases                   {cases:>12,}")
+    print(f"fields                  {len(fields):>12,}")
+    print(f"get*() apply            {cases / t_scalar:>12,.0f} cases/s")
+    print(f"extract_fields()        {cases / t_batch:>12,.0f} cases/s")
+    print(f"speedup                 {t_scalar / t_batch:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
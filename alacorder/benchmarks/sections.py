@@ -0,0 +1,129 @@
+"""
+Case section span parity and scan volume.
+
+Parses case texts in several Alacourt layouts twice: with the section
+spans `case_sections()` finds (`CaseDetail`, `ChargesDetail`,
+`FeeSheet`), and with every span set to the full `AllPagesText`, as the
+field regexes ran before spans. Exits non-zero if any table differs,
+i.e. if a span cut off text a field needs. Layouts include the Case
+Action Summary phrase before the docket (in a charge description and a
+note), the column header printed before the heading, a text missing the
+heading, fee sheet rows before charges, and page headers and footers
+repeated on every page. Also reports how much of each case the charges,
+fees and case info regexes scan.
+
+    python benchmarks/sections.py --cases 200
+"""
+
+import os, sys
+
+import click
+import polars as pl
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from alacorder import alac
+from synth import make_case_text
+
+SPANS = ["CaseDetail", "ChargesDetail", "FeeSheet"]
+HEADING = "Case Action Summary Date: Time Code Comments"
+PAGE = "© Alacourt.com 4/14/2023 Page {} of 3\nAlabama Judicial Information System"
+
+
+def early_phrase(text):
+    """
+    Case Action Summary named in a charge description and a note before the docket.
+    """
+    note = "Note: see Case Action Summary Filing Date:"
+    text = text.replace("Filing Date:", note, 1)
+    return text.replace("Charge: ", "Charge: Case Action Summary REVIEW ", 1)
+
+
+def header_first(text):
+    """
+    Column header extracted before the heading, as PyMuPDF orders some pages.
+    """
+    return text.replace(HEADING, "Date: Time Code Comments\nCase Action Summary")
+
+
+def no_heading(text):
+    """
+    Report cut off before the docket, i.e. a partly downloaded PDF.
+    """
+    return text.split(HEADING)[0]
+
+
+def fees_first(text):
+    """
+    Fee sheet extracted before the charges.
+    """
+    lines = text.split("\n")
+    fees = [ln for ln in lines if ln.startswith(("ACTIVE", "Total:"))]
+    rest = [ln for ln in lines if ln not in fees]
+    return "\n".join(rest[:14] + fees + rest[14:])
+
+
+def paged(text):
+    """
+    Page footer and header repeated every third of the case, as on multipage reports.
+    """
+    lines = text.split("\n")
+    step = max(1, len(lines) // 3)
+    out = []
+    for i, ln in enumerate(lines):
+        if i > 0 and i % step == 0:
+            out.append(PAGE.format(i // step))
+        out.append(ln)
+    return "\n".join(out)
+
+
+LAYOUTS = {
+    "plain": lambda text: text,
+    "early phrase": early_phrase,
+    "header first": header_first,
+    "no heading": no_heading,
+    "fees first": fees_first,
+    "paged": paged,
+}
+
+
+def tables(df):
+    """
+    Return every table parsed from archive `df`, with categoricals cast to strings so tables from separate parses compare.
+    """
+    out = alac.parse_tables(df, cf={"LOG": False, "DEBUG": False})
+    plain = pl.col(pl.Categorical).cast(pl.Utf8)
+    return {name: table.with_columns(plain) for name, table in out.items()}
+
+
+@click.command()
+@click.option("--cases", "-n", default=200, help="Cases per layout")
+@click.option("--cas", default=200, help="Case action summary entries per case")
+def main(cases, cas):
+    bad = 0
+    for label, layout in LAYOUTS.items():
+        texts = [layout(make_case_text(i, cas=cas)) for i in range(cases)]
+        df = alac.read(
+            pl.DataFrame(
+                {"Timestamp": 0.0, "AllPagesText": texts, "Path": f"{label}.pdf"}
+            )
+        )
+        spans = alac.case_sections(df)
+        full = df.with_columns([pl.col("AllPagesText").alias(c) for c in SPANS])
+        got, want = tables(spans), tables(full)
+        for name in want:
+            if not got[name].frame_equal(want[name], null_equal=True):
+                bad += 1
+                print(f"{label:<14} {name} differs from full text parse")
+        size = df["AllPagesText"].str.lengths().sum()
+        scanned = [spans[c].str.lengths().sum() / size for c in SPANS]
+        print(
+            f"{label:<14} case info {scanned[0]:>6.1%}   charges {scanned[1]:>6.1%}"
+            f"   fees {scanned[2]:>6.1%} of text scanned"
+        )
+    if bad > 0:
+        raise SystemExit(f"{bad} tables differ from full text parse")
+    print("all tables match full text parse")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Parse server job latency against one `alacorder table` process per job.
+
+Writes `--jobs` small synthetic archives of `--cases` cases each, then
+times exporting the cases table from each with a fresh
+`python -m alacorder table` process (what a job scheduler shelling out
+pays), against sending the same jobs to one `alacorder serve` server
+over a Unix socket with `request_table()`, first one at a time and then
+from `--workers` client threads at once. Checks that every server
+response equals the table parsed in this process.
+
+    python benchmarks/serve.py --jobs 20 --cases 5 --workers 4
+"""
+
+import os, sys, time, tempfile, subprocess
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+import polars as pl
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, SRC)
+from alacorder import alac
+from synth import make_archive
+
+
+def python(*args, wait=True):
+    """
+    Return `python *args` subprocess with `src` on its path, completed if `wait`.
+    """
+    path = SRC + os.pathsep + os.environ.get("PYTHONPATH", "")
+    env = dict(os.environ, PYTHONPATH=path)
+    if wait:
+        return subprocess.run(
+            [sys.executable, *args], capture_output=True, env=env, check=True
+        )
+    return subprocess.Popen([sys.executable, *args], env=env)
+
+
+@click.command()
+@click.option("--jobs", "-n", default=20, help="Jobs per run")
+@click.option("--cases", "-c", default=5, help="Cases per job")
+@click.option("--workers", "-w", default=4, help="Server worker processes")
+def main(jobs, cases, workers):
+    archive = make_archive(jobs * cases)
+    quiet = {"LOG": False, "DEBUG": False}
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = []
+        for i in range(jobs):
+            paths.append(os.path.join(tmp, f"job{i}.parquet"))
+            archive[i * cases : (i + 1) * cases].write_parquet(paths[-1])
+        expected = [alac.parse_tables(alac.read(pp), cf=quiet)["cases"] for pp in paths]
+
+        start = time.perf_counter()
+        for i, pp in enumerate(paths):
+            out = os.path.join(tmp, f"job{i}.csv")
+            python("-m", "alacorder", "table", "-in", pp, "-out", out, "-t", "cases")
+        t_cli = time.perf_counter() - start
+
+        sock = os.path.join(tmp, "serve.sock")
+        args = ["serve", "--socket", sock, "--workers", str(workers), "--no-log"]
+        server = python("-m", "alacorder", *args, wait=False)
+        try:
+            start = time.perf_counter()
+            while not os.path.exists(sock):
+                if server.poll() != None or time.perf_counter() - start > 120:
+                    raise SystemExit("Server did not start")
+                time.sleep(0.05)
+            t_start = time.perf_counter() - start
+
+            def job(i):
+                texts = archive[i * cases : (i + 1) * cases]
+                return alac.request_table(texts, "cases", socket_path=sock)
+
+            start = time.perf_counter()
+            serial = [job(i) for i in range(jobs)]
+            t_serial = time.perf_counter() - start
+            start = time.perf_counter()
+            with ThreadPoolExecutor(workers) as executor:
+                parallel = list(executor.map(job, range(jobs)))
+            t_parallel = time.perf_counter() - start
+        finally:
+            server.terminate()
+            server.wait()
+
+    plain = pl.col(pl.Categorical).cast(pl.Utf8)  # server categoricals use its cache
+    for i in range(jobs):  # Retrieved is the parse time
+        want = expected[i].drop("Retrieved").with_columns(plain)
+        for got in (serial[i], parallel[i]):
+            if not got.drop("Retrieved").with_columns(plain).frame_equal(want):
+                raise SystemExit(f"Server response differs for job {i}")
+
+    print(f"jobs                    {jobs:>12,} x {cases} cases")
+    print(f"alacorder table         {t_cli / jobs * 1000:>12,.1f} ms/job")
+    print(f"server start            {t_start * 1000:>12,.1f} ms")
+    print(f"request_table()         {t_serial / jobs * 1000:>12,.1f} ms/job")
+    label = f"request_table() x{workers}"
+    print(f"{label:<24}{t_parallel / jobs * 1000:>12,.1f} ms/job")
+    print(f"speedup                 {t_cli / t_parallel:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+Import time, memory and CLI startup budget.
+
+Imports `alacorder.parse`, `alacorder.io` and `alacorder.alac` each in
+fresh interpreters with `python -X importtime` and reports cumulative
+import time, peak resident memory and the slowest direct dependencies of
+each, then times `python -m alacorder --help`. Fails if the best
+`alacorder.alac` import time is over `--budget` milliseconds, if any
+module loads one of `DEFERRED`, which only the functions that need them
+should import, or if a library module loads one of `FRONTEND`.
+
+    python benchmarks/startup.py --repeat 5 --budget 300
+"""
+
+import os, sys, json, time, subprocess
+
+import click
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+DEFERRED = ["selenium", "fitz", "pymupdf", "xlsxwriter", "urllib3", "PySimpleGUI"]
+FRONTEND = ["click"]  # loaded by alacorder.cli only
+MODULES = ["alacorder.parse", "alacorder.io", "alacorder.alac"]
+
+
+def python(*args):
+    """
+    Return completed `python *args` subprocess run with `src` on its path.
+    """
+    path = SRC + os.pathsep + os.environ.get("PYTHONPATH", "")
+    env = dict(os.environ, PYTHONPATH=path)
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def import_times(module):
+    """
+    Return cumulative import microseconds of `module` and dict of cumulative microseconds of each module it imports directly, for one fresh `import module`.
+    """
+    lines = []
+    out = python("-X", "importtime", "-c", f"import {module}").stderr
+    for line in out.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2  # two spaces per level
+        lines.append((depth, name.strip(), int(cumulative)))
+    for i, (depth, name, cumulative) in enumerate(lines):
+        if name != module:
+            continue
+        children = {}
+        for child_depth, child, us in reversed(lines[:i]):  # listed before module
+            if child_depth <= depth:
+                break
+            if child_depth == depth + 1:
+                children[child] = us
+        return cumulative, children
+    raise SystemExit(f"{module} not found in importtime output")
+
+
+def footprint(module):
+    """
+    Return peak resident kilobytes and list of `DEFERRED` and `FRONTEND` modules loaded after a fresh `import module`.
+    """
+    watch = DEFERRED + FRONTEND
+    out = python(
+        "-c",
+        f"import sys, json, resource; import {module}; "
+        f"print(json.dumps([resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, "
+        f"[m for m in {watch!r} if m in sys.modules]]))",
+    ).stdout.splitlines()[-1]
+    return json.loads(out)
+
+
+@click.command()
+@click.option("--repeat", "-r", default=5, help="Best of this many fresh imports")
+@click.option("--budget", default=300, help="Maximum alacorder.alac import ms")
+@click.option("--top", default=5, help="Slowest direct imports to list")
+def main(repeat, budget, top):
+    failures = []
+    for module in MODULES:
+        total, deps = min(
+            (import_times(module) for _ in range(repeat)), key=lambda t: t[0]
+        )
+        rss, loaded = footprint(module)
+        total /= 1000
+        print(f"import {module:<25}{total:>10.1f} ms {rss / 1024:>8.1f} MB")
+        for name, us in sorted(deps.items(), key=lambda x: -x[1])[:top]:
+            print(f"  {name:<30}{us / 1000:>10.1f} ms")
+        allowed = FRONTEND if module == "alacorder.alac" else []
+        loaded = [m for m in loaded if m not in allowed]
+        if len(loaded) > 0:
+            failures.append(f"Importing {module} loaded {', '.join(loaded)}")
+        if module == "alacorder.alac" and total > budget:
+            failures.append(f"Import time {total:.1f} ms is over budget of {budget} ms")
+    cli = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        python("-m", "alacorder", "--help")
+        cli.append(time.perf_counter() - start)
+    print(f"alacorder --help                {min(cli) * 1000:>10.1f} ms")
+    if len(failures) > 0:
+        raise SystemExit("\n".join(failures))
+
+
+if __name__ == "__main__":
+    main()
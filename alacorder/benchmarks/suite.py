@@ -0,0 +1,172 @@
+"""
+Parser and export benchmark suite on synthetic case text archives.
+
+Times `read()`, `split_cases()`, `explode_charges()` + `split_charges()`,
+`explode_fees()` + `split_fees()`, each remaining `explode_*()` table,
+a full multitable parse, and `write()` of the cases table to each export
+format, at each archive size. Every stage runs in its own process so its
+peak RSS is its own; stage inputs are built before the clock starts.
+
+    python benchmarks/suite.py --sizes 1000,10000,100000 --json run.json
+    python benchmarks/suite.py --sizes 1000 --stages split_cases,multi
+
+Compare runs by diffing the JSON outputs, which list cases/sec, wall
+seconds and peak RSS per (size, stage).
+"""
+
+import os, sys, json, time, resource, platform, subprocess, tempfile
+
+import click
+import polars as pl
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+from alacorder import alac
+from synth import make_archive
+
+STAGES = [
+    "read",
+    "split_cases",
+    "explode_charges",
+    "split_charges",
+    "explode_fees",
+    "split_fees",
+    "explode_settings",
+    "explode_case_action_summary",
+    "explode_witnesses",
+    "explode_attorneys",
+    "explode_images",
+    "multi",
+    "write_parquet",
+    "write_csv",
+    "write_json",
+    "write_xlsx",
+]
+
+
+def peak_rss_mb():
+    """
+    Return peak resident set size of this process in MB.
+    """
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def prepare(stage, archive, tmp):
+    """
+    Return zero-argument callable running `stage` on archive at `archive`, after building its inputs.
+    """
+    if stage == "read":
+        return lambda: alac.read(archive)
+    df = alac.read(archive)
+    if stage == "split_cases":
+        return lambda: alac.split_cases(df)
+    if stage == "split_charges":
+        ch = alac.explode_charges(df)
+        return lambda: alac.split_charges(ch)
+    if stage == "split_fees":
+        fs = alac.explode_fees(df)
+        return lambda: alac.split_fees(fs)
+    if stage.startswith("explode_"):
+        return lambda: getattr(alac, stage)(df)
+    if stage == "multi":
+        return lambda: alac.parse_tables(df)
+    if stage.startswith("write_"):
+        ca = alac.split_cases(df)[0]
+        path = os.path.join(tmp, f"cases.{stage[6:]}")
+        return lambda: alac.write(ca, sheet_names=["cases"], path=path)
+    raise click.BadParameter(f"Unknown stage {stage}")
+
+
+def run_stage(stage, archive, repeat):
+    """
+    Return dict of best wall and CPU seconds of `repeat` runs of `stage` and peak RSS of this process.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        f = prepare(stage, archive, tmp)
+        base = peak_rss_mb()
+        wall, cpu = [], []
+        for _ in range(repeat):
+            start, start_cpu = time.perf_counter(), time.process_time()
+            f()
+            wall.append(time.perf_counter() - start)
+            cpu.append(time.process_time() - start_cpu)
+    return {
+        "wall": min(wall),
+        "cpu": min(cpu),
+        "peak_rss_mb": peak_rss_mb(),
+        "setup_rss_mb": base,
+    }
+
+
+@click.command()
+@click.option(
+    "--sizes", default="1000,10000,100000", help="Comma-separated case counts"
+)
+@click.option("--stages", default=",".join(STAGES), help="Comma-separated stages")
+@click.option("--repeat", "-r", default=1, help="Best of this many runs per stage")
+@click.option("--json", "json_path", default=None, help="Write results to JSON file")
+@click.option("--charges", default=3, help="Mean charges per case")
+@click.option("--fees", default=4, help="Mean fee lines per case")
+@click.option("--cas", default=20, help="Mean case action summary entries per case")
+@click.option("--run-stage", "child", hidden=True, default=None)
+@click.option("--archive", hidden=True, default=None)
+def main(sizes, stages, repeat, json_path, charges, fees, cas, child, archive):
+    if child:  # child process: time one stage and report on stdout
+        print(json.dumps(run_stage(child, archive, repeat)))
+        return
+    stages = [s.strip() for s in stages.split(",") if s.strip()]
+    for s in stages:
+        if s not in STAGES:
+            raise click.BadParameter(f"Unknown stage {s}", param_hint="--stages")
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in [int(s) for s in sizes.split(",")]:
+            archive = os.path.join(tmp, f"synth-{n}.parquet")
+            make_archive(n, charges=charges, fees=fees, cas=cas).write_parquet(archive)
+            for stage in stages:
+                out = subprocess.run(
+                    [
+                        sys.executable,
+                        __file__,
+                        "--run-stage",
+                        stage,
+                        "--archive",
+                        archive,
+                        "--repeat",
+                        str(repeat),
+                    ],
+                    capture_output=True,
+                    text=True,
+                )
+                if out.returncode != 0:
+                    print(f"{n:>8,} {stage:<30} failed\n{out.stderr}", file=sys.stderr)
+                    continue
+                res = json.loads(out.stdout.strip().splitlines()[-1])
+                res.update(
+                    cases=n, stage=stage, cases_per_sec=n / max(res["wall"], 1e-9)
+                )
+                results.append(res)
+                print(
+                    f"{n:>8,} {stage:<30} {res['cases_per_sec']:>12,.0f} cases/s"
+                    f" {res['wall']:>9.3f}s {res['peak_rss_mb']:>9.1f} MB peak"
+                )
+    if json_path:
+        with open(json_path, "w") as f:
+            json.dump(
+                {
+                    "alacorder": alac.version,
+                    "polars": pl.__version__,
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "cpus": os.cpu_count(),
+                    "time": time.time(),
+                    "results": results,
+                },
+                f,
+                indent=2,
+            )
+        print(f"Wrote results to {json_path}")
+
+
+if __name__ == "__main__":
+    main()
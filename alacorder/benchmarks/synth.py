@@ -0,0 +1,162 @@
+"""
+Synthetic Alacourt case text archives.
+
+Builds `AllPagesText` documents laid out like extracted Alacourt case
+detail PDFs, with configurable charge, fee, setting, witness and case
+action summary counts, and writes them as a full text archive that
+`alac.read()` and `alac.cf()` accept.
+
+    python benchmarks/synth.py --cases 10000 --output synth.parquet
+"""
+
+import os, time, random
+
+import click
+import polars as pl
+
+FIRST = ["JOHN", "MARY", "JAMES", "PATRICIA", "ROBERT", "LINDA", "MICHAEL", "ANNA"]
+LAST = ["SMITH", "JOHNSON", "WILLIAMS", "BROWN", "JONES", "DAVIS", "MILLER", "LEE"]
+COUNTIES = ["CALHOUN", "JEFFERSON", "MOBILE", "MADISON", "MONTGOMERY", "TUSCALOOSA"]
+RACES = ["B/M", "W/M", "B/F", "W/F", "H/M"]
+CASE_TYPES = ["CC", "DC", "TR", "CV"]
+CHARGES = [
+    ("TOP1", "THEFT OF PROPERTY 1ST", "13A-008-003", "FELONY", "PROPERTY"),
+    ("MAN1", "MANSLAUGHTER", "13A-006-004", "FELONY", "PERSONAL"),
+    ("ROB3", "ROBBERY III", "13A-008-043", "FELONY", "PERSONAL"),
+    ("POSS", "POSSESSION OF MARIJUANA 2ND", "13A-012-214", "MISDEMEANOR", "DRUG"),
+    ("DUI1", "DUI-ALCOHOL", "32-005A-191(A)", "TRAFFIC MISDEMEANOR", "TRAFFIC"),
+    ("BUR2", "BURGLARY 2ND", "13A-007-006", "FELONY", "PROPERTY"),
+    ("HARA", "HARASSMENT", "13A-011-008", "VIOLATION", "PERSONAL"),
+]
+ACTIONS = ["GUILTY PLEA", "DISMISSED", "NOL PROSS", "CONVICTED", "BOUND OVER GJ"]
+FEE_CODES = ["D999", "ACAF", "ADTR", "CONV", "DAMF", "SOTF", "VCCF"]
+SETTINGS = ["ARRAIGNMENT", "PRELIMINARY HEARING", "STATUS", "TRIAL", "SENTENCING"]
+CAS_CODES = [
+    ("FILE", "CASE FILED"),
+    ("ASSJ", "ASSIGNED TO JUDGE"),
+    ("BOND", "BOND SET AT"),
+    ("SERV", "SERVICE RETURNED"),
+    ("DISP", "DISPOSITION ENTERED"),
+]
+
+
+def make_case_text(i, charges=3, fees=4, settings=2, witnesses=2, cas=20, rng=None):
+    """
+    Return synthetic `AllPagesText` for case `i` with the given number of charges, fee lines, settings, witnesses and case action summary entries.
+    """
+    rng = rng or random.Random(i)
+    county = 1 + i % 67
+    kind = rng.choice(CASE_TYPES)
+    cnum = f"{kind}-{2000 + i % 23}-{i:06d}.00"
+    name = f"{rng.choice(LAST)} {rng.choice(FIRST)} {rng.choice(FIRST)}"
+    dob = f"{1 + rng.randrange(12):02d}/{1 + rng.randrange(28):02d}/{1950 + rng.randrange(50)}"
+    lines = [
+        f"Alabama Judicial Information System Case Detail County: {county:02d} Case Number: {county:02d}-{kind} County: {rng.choice(COUNTIES)} Judge: HON JOHN SMITH",
+        f"STATE OF ALABAMA VS. {name} Case Number: {cnum}",
+        f"Court Action: {rng.choice(ACTIONS)} Court Action Date: 01/02/2020",
+        f"{dob} DOB: SSN: XXX-XX-{rng.randrange(10000):04d} Alias 1: {name.split()[1]}",
+        f"Phone: (205) 555-{rng.randrange(10000):04d}",
+        f"{rng.choice(RACES)} Height : 5'{rng.randrange(12)} Weight: {120 + rng.randrange(120)} Eyes/Hair: BRO/BLK",
+        f"Address 1: {rng.randrange(1, 9999)} MAIN ST Phone: 205555{rng.randrange(10000):04d}",
+        "Address 2: APT 4",
+        "City: ANNISTON State: AL",
+        f"Zip: {35000 + rng.randrange(2000)}-0000 Country: US",
+        "Filing Date: 01/01/2019 Case Initiation Date: 01/01/2019 Arrest Date: 12/30/2018 Offense Date: 12/29/2018",
+        f"Charge: {CHARGES[0][1]} Court Action: {rng.choice(ACTIONS)}",
+        "Jury Demand: N Trial Type: BENCH Defendant Status: JAIL Bond Type: S Bond Type Desc: SURETY 5000.00 Bond Amount:",
+        f"Alacourt.com {1 + i % 12}/14/2023",
+    ]
+    for c in range(charges):
+        code, desc, cite, level, cat = rng.choice(CHARGES)
+        lines.append(f"{c + 1:03d} {code} S {desc} {cite} {level} {cat}")
+        if rng.random() < 0.7:
+            action = rng.choice(ACTIONS)
+            lines.append(
+                f"{c + 1:03d} {code} 01/02/2020 {action} {level} {cat} {cite} {desc}"
+            )
+    entries = " ".join(
+        f"{s + 1:03d} 0{1 + s % 9}/05/2020 09:00 AM {rng.choice(SETTINGS)}"
+        for s in range(settings)
+    )
+    lines.append(f"Settings Date: Que: Time: Description: {entries} Court Action")
+    due = paid = 0
+    for f in range(fees):
+        amount = rng.choice([25, 50, 100, 250, 500])
+        part = rng.choice([0, amount // 2, amount])
+        due, paid = due + amount, paid + part
+        lines.append(
+            f"ACTIVE N 000 ${amount:.2f} ${part:.2f} ${amount - part:.2f} $0.00 {rng.choice(FEE_CODES)} {f:03d} 000 ACTIVE $0.00"
+        )
+    lines.append(f"Total: ${due:.2f} ${paid:.2f} ${due - paid:.2f} $0.00")
+    lines.append(
+        "Type of Counsel Name Phone Email Attorney Code Court Appointed SMITH JANE 2055550000 SMI001 Warrant Issuance"
+    )
+    entries = " ".join(
+        f"{w + 1:03d} 01/03/2020 SHERIFF {rng.choice(LAST)} {rng.choice(FIRST)}"
+        for w in range(witnesses)
+    )
+    lines.append(
+        f"Witness # Date Served Service Type Attorney Issued Type {entries}"
+    )
+    lines.append("Case Action Summary Date: Time Code Comments")
+    for k in range(cas):
+        code, text = rng.choice(CAS_CODES)
+        lines.append(
+            f"{1 + k % 12:02d}/{1 + k % 28:02d}/2020 10:{k % 60:02d} AM {code} {text} {k}"
+        )
+    lines.append("Images Pages 1 CASE DETAIL 2 END OF THE REPORT")
+    return "\n".join(lines)
+
+
+def make_archive(cases, charges=3, fees=4, settings=2, witnesses=2, cas=20, seed=0):
+    """
+    Return full text archive DataFrame of `cases` synthetic cases. Counts vary per case around the given means so table sizes are not uniform.
+    """
+    rng = random.Random(seed)
+    vary = lambda n: max(0, n + rng.randint(-n // 2, n // 2))
+    texts = [
+        make_case_text(
+            i,
+            charges=max(1, vary(charges)),
+            fees=vary(fees),
+            settings=vary(settings),
+            witnesses=vary(witnesses),
+            cas=vary(cas),
+            rng=rng,
+        )
+        for i in range(cases)
+    ]
+    return pl.DataFrame(
+        {
+            "Timestamp": [time.time()] * cases,
+            "AllPagesText": texts,
+            "Path": [f"synthetic/{i:06d}.pdf" for i in range(cases)],
+        }
+    )
+
+
+@click.command()
+@click.option("--cases", "-n", default=1000, help="Number of synthetic cases")
+@click.option(
+    "--output", "-o", required=True, help="Archive path (.parquet, .csv, .json)"
+)
+@click.option("--charges", default=3, help="Mean charges per case")
+@click.option("--fees", default=4, help="Mean fee lines per case")
+@click.option("--settings", default=2, help="Mean settings per case")
+@click.option("--witnesses", default=2, help="Mean witnesses per case")
+@click.option("--cas", default=20, help="Mean case action summary entries per case")
+@click.option("--seed", default=0, help="Random seed")
+def main(cases, output, charges, fees, settings, witnesses, cas, seed):
+    df = make_archive(cases, charges, fees, settings, witnesses, cas, seed)
+    ext = os.path.splitext(output)[1]
+    if ext == ".csv":
+        df.write_csv(output)
+    elif ext == ".json":
+        df.write_json(output)
+    else:
+        df.write_parquet(output)
+    print(f"Wrote {cases:,} synthetic cases to {output}")
+
+
+if __name__ == "__main__":
+    main()
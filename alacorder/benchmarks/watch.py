@@ -0,0 +1,114 @@
+"""
+Watch folder latency and idle scan cost.
+
+Starts `alacorder watch` on a directory already holding `--pdfs` case
+PDFs and waits for it to archive them, then drops `--drops` new PDFs one
+at a time (written to a `.part` file and renamed, as `fetch` does) and
+times each from landing to its row being readable in the archive.
+Checks that the archive ends with one row per PDF. Also times one
+`scan_pdfs()` pass over the unchanged directory against the
+`glob.glob()` the `archive` command runs on every call.
+
+    python benchmarks/watch.py --pdfs 200 --drops 10
+"""
+
+import os, sys, glob, time, signal, tempfile, subprocess, statistics
+
+import click
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
+sys.path.insert(0, SRC)
+from alacorder import alac
+from synth import make_case_text
+
+
+def make_pdf(i, path):
+    """
+    Write synthetic case `i` to a one page PDF at `path`.
+    """
+    import fitz
+
+    doc = fitz.open()
+    page = doc.new_page()
+    for j, line in enumerate(make_case_text(i, cas=3).split("\n")[:60]):
+        page.insert_text((10, 20 + 7 * j), line[:120], fontsize=5)
+    doc.save(path + ".part")
+    os.replace(path + ".part", path)
+
+
+def archived(path):
+    """
+    Return number of cases in archive at `path`, or 0 if it does not exist yet.
+    """
+    return alac.read(path).shape[0] if os.path.exists(path) else 0
+
+
+def wait_for(path, count, timeout=120):
+    """
+    Wait until archive at `path` has `count` cases. Returns seconds waited.
+    """
+    start = time.perf_counter()
+    while archived(path) < count:
+        if time.perf_counter() - start > timeout:
+            raise SystemExit(f"Archive did not reach {count} cases")
+        time.sleep(0.05)
+    return time.perf_counter() - start
+
+
+@click.command()
+@click.option("--pdfs", "-n", default=200, help="PDFs in directory before watching")
+@click.option("--drops", "-d", default=10, help="PDFs dropped while watching")
+@click.option("--interval", default=0.5, help="Seconds between scans")
+@click.option("--settle", default=0.5, help="Seconds a PDF must be unmodified")
+def main(pdfs, drops, interval, settle):
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = os.path.join(tmp, "drop")
+        path = os.path.join(tmp, "archive.parquet")
+        for i in range(pdfs):
+            os.makedirs(os.path.join(inputs, f"{i % 10}"), exist_ok=True)
+            make_pdf(i, os.path.join(inputs, f"{i % 10}", f"case{i:06d}.pdf"))
+
+        args = ["-in", inputs, "-out", path, "--interval", str(interval)]
+        args += ["--settle", str(settle), "--no-log"]
+        env = dict(os.environ, PYTHONPATH=SRC)
+        watcher = subprocess.Popen(
+            [sys.executable, "-m", "alacorder", "watch", *args], env=env
+        )
+        try:
+            t_initial = wait_for(path, pdfs)
+            latency = []
+            for i in range(pdfs, pdfs + drops):
+                make_pdf(i, os.path.join(inputs, f"case{i:06d}.pdf"))
+                latency.append(wait_for(path, i + 1))
+        finally:
+            watcher.send_signal(signal.SIGTERM)
+            watcher.wait()
+
+        df = alac.read(path)
+        if df.shape[0] != pdfs + drops or df["Path"].n_unique() != pdfs + drops:
+            raise SystemExit(f"Expected {pdfs + drops} cases, found {df.shape[0]}")
+        index = {
+            r[0]: r[1:]
+            for r in alac.open_watch_index(alac.watch_index_path(path)).execute(
+                "SELECT path, size, mtime, hash FROM files"
+            )
+        }
+        start = time.perf_counter()
+        changed = alac.scan_pdfs(os.path.abspath(inputs), index, settle=0)
+        t_scan = time.perf_counter() - start
+        if len(changed) > 0:
+            raise SystemExit(f"Unchanged PDFs scanned as changed: {changed[:3]}")
+        start = time.perf_counter()
+        glob.glob(inputs + "/**/*.pdf", recursive=True)
+        t_glob = time.perf_counter() - start
+
+    print(f"pdfs                    {pdfs:>12,}")
+    print(f"initial archive         {t_initial:>12.2f} s")
+    print(f"landing to row median   {statistics.median(latency):>12.2f} s")
+    print(f"landing to row max      {max(latency):>12.2f} s")
+    print(f"idle scan_pdfs()        {t_scan * 1000:>12.1f} ms")
+    print(f"glob.glob()             {t_glob * 1000:>12.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,4 +22,13 @@ FUCK YOU IF YOU DISAGREE.
 SAM
 """
 
-from alacorder import alac
\ No newline at end of file
+import importlib
+
+
+def __getattr__(name):
+    """
+    Import `alacorder.alac` on first access so `alacorder.parse` and `alacorder.io` can be imported without the fetcher, GUI and CLI.
+    """
+    if name == "alac":
+        return importlib.import_module(".alac", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,989 @@
+"""
+Command line interface (`python -m alacorder`).
+"""
+
+import os
+import click
+
+from .logs import long_version, name, plog, profile_summary, version
+from .io import (
+    EXTRACT_CACHE_MAX_BYTES,
+    append_archive,
+    archive,
+    cf,
+    charges_summary,
+    convictions_summary,
+    init,
+    is_dataset,
+    pairs,
+    set,
+    vrr_summary,
+)
+from .fetch import fetch
+from .serve import SERVE_PORT, serve
+from .watch import watch
+from .gui import loadgui
+
+print = plog
+
+autoload_graphical_user_interface = False
+
+
+CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
+
+
+@click.group(
+    invoke_without_command=autoload_graphical_user_interface,
+    context_settings=CONTEXT_SETTINGS,
+)
+@click.version_option(f"{version}", package_name=f"{name} {long_version}")
+@click.pass_context
+def main(ctx):
+    """
+    ALACORDER collects and processes case detail PDFs into data tables suitable for research purposes.
+    """
+    if autoload_graphical_user_interface and ctx.invoked_subcommand == None:
+        loadgui()
+
+
+@main.command(name="start", help="Launch graphical user interface")
+def cli_start():
+    loadgui()
+
+
+@main.command(name="append", help="Append one case text archive to another")
+@click.option(
+    "--input-path",
+    "-in",
+    "in_path",
+    required=True,
+    prompt="Path to archive / PDF directory",
+    help="Path to input archive",
+    type=click.Path(),
+)
+@click.option(
+    "--output-path",
+    "-out",
+    "out_path",
+    required=True,
+    prompt="Path to output archive",
+    type=click.Path(),
+    help="Path to output archive",
+)
+@click.option(
+    "--no-write",
+    "-n",
+    default=False,
+    is_flag=True,
+    help="Do not export to output path",
+    hidden=True,
+)
+def cli_append(in_path, out_path, no_write=False):
+    """Append one case text archive to another
+
+    Args:
+        in_path (Path|DataFrame): Path to input archive / PDF directory
+        out_path (Path): Path to output archive
+        no_write (bool, optional): Do not export to output path
+
+    Returns:
+        DataFrame: Appended archive
+    """
+    print("Appending archives...")
+    return append_archive(in_path, out_path)
+
+
+@main.command(name="fetch", help="Fetch cases from Alacourt.com")
+@click.option(
+    "--input-path",
+    "-in",
+    "listpath",
+    required=True,
+    prompt="Path to query table",
+    help="Path to query table/spreadsheet (.xls, .xlsx)",
+    type=click.Path(),
+)
+@click.option(
+    "--output-path",
+    "-out",
+    "path",
+    required=True,
+    prompt="PDF download path",
+    type=click.Path(),
+    help="Desired PDF output directory",
+)
+@click.option(
+    "--customer-id",
+    "-c",
+    "cID",
+    required=True,
+    prompt="Alacourt Customer ID",
+    help="Customer ID on Alacourt.com",
+)
+@click.option(
+    "--user-id",
+    "-u",
+    "uID",
+    required=True,
+    prompt="Alacourt User ID",
+    help="User ID on Alacourt.com",
+)
+@click.option(
+    "--password",
+    "-p",
+    "pwd",
+    required=True,
+    prompt="Alacourt Password",
+    help="Password on Alacourt.com",
+    hide_input=True,
+)
+@click.option(
+    "--max",
+    "-max",
+    "qmax",
+    required=False,
+    type=int,
+    help="Maximum queries to conduct on Alacourt.com",
+    default=0,
+)
+@click.option(
+    "--skip",
+    "-skip",
+    "qskip",
+    required=False,
+    type=int,
+    help="Skip entries at top of query file",
+    default=0,
+)
+@click.option(
+    "--no-mark",
+    "-n",
+    "no_update",
+    is_flag=True,
+    default=False,
+    help="Do not update query template after completion",
+)
+@click.option(
+    "--sessions",
+    "-s",
+    type=int,
+    default=1,
+    help="Number of browser sessions to fetch query rows concurrently",
+)
+@click.option(
+    "--rate",
+    "-r",
+    type=float,
+    default=0,
+    help="Maximum Alacourt.com page requests per second across all sessions (0 for no limit)",
+)
+@click.option(
+    "--archive",
+    "-a",
+    "archive",
+    default=None,
+    type=click.Path(),
+    help="Extract fetched cases into archive at path as they download",
+)
+@click.option(
+    "--workers",
+    "-w",
+    default=1,
+    type=int,
+    help="Number of processes to use for PDF text extraction",
+    show_default=False,
+)
+@click.option(
+    "--debug",
+    "-d",
+    is_flag=True,
+    default=False,
+    help="Print detailed runtime information to console",
+)
+def cli_fetch(
+    listpath,
+    path,
+    cID,
+    uID,
+    pwd,
+    qmax,
+    qskip,
+    no_update,
+    sessions,
+    rate,
+    archive,
+    workers,
+    debug=False,
+):
+    """
+    Fetch case PDFs from Alacourt.com.
+    Args:
+        listpath (str): Path to query table/spreadsheet (.xls, .xlsx)
+        path (str): Path to PDF output directory
+        cID (str): Customer ID on Alacourt.com
+        uID (str): User ID on Alacourt.com
+        pwd (str): Password on Alacourt.com
+        qmax (int): Maximum queries to conduct on Alacourt.com
+        qskip (int): Skip entries at top of query file
+        no_update (bool): Do not update query template after completion
+        sessions (int): Number of browser sessions to fetch query rows concurrently
+        rate (float): Maximum Alacourt.com page requests per second across all sessions
+        archive (str): Path to archive to extract fetched cases into as they download
+        workers (int): Number of processes to use for PDF text extraction
+        debug (bool): Print detailed runtime information to console
+    """
+    fetch(
+        querypath=listpath,
+        dirpath=path,
+        cID=cID,
+        uID=uID,
+        pwd=pwd,
+        qmax=qmax,
+        qskip=qskip,
+        no_update=no_update,
+        debug=debug,
+        sessions=sessions,
+        rate=rate,
+        archive=archive,
+        workers=workers,
+    )
+
+
+@main.command(name="table", help="Export data tables from archive or directory")
+@click.option(
+    "--input-path",
+    "-in",
+    required=True,
+    type=click.Path(),
+    prompt="Input Path",
+    show_choices=False,
+)
+@click.option(
+    "--output-path", "-out", required=True, type=click.Path(), prompt="Output Path"
+)
+@click.option("--table", "-t", help="Table export selection")
+@click.option(
+    "--count",
+    "-c",
+    default=0,
+    help="Total cases to pull from input",
+    show_default=False,
+)
+@click.option(
+    "--overwrite",
+    "-o",
+    default=False,
+    help="Overwrite existing files at output path",
+    is_flag=True,
+    show_default=False,
+)
+@click.option(
+    "--no-prompt",
+    "-s",
+    default=False,
+    is_flag=True,
+    help="Skip user input / confirmation prompts",
+)
+@click.option(
+    "--no-log",
+    default=False,
+    is_flag=True,
+    help="Do not print logs to console",
+)
+@click.option(
+    "--no-write", default=False, is_flag=True, help="Do not export to output path"
+)
+@click.option(
+    "--debug", "-d", default=False, is_flag=True, help="Print debug logs to console"
+)
+@click.option(
+    "--workers",
+    "-w",
+    default=1,
+    type=int,
+    help="Number of processes to use for PDF text extraction",
+    show_default=False,
+)
+@click.option(
+    "--no-cache",
+    default=False,
+    is_flag=True,
+    help="Do not read or update PDF text extraction cache",
+)
+@click.option(
+    "--cache-max-bytes",
+    default=EXTRACT_CACHE_MAX_BYTES,
+    type=int,
+    help="Maximum bytes of text kept in PDF text extraction cache",
+    show_default=True,
+)
+@click.option(
+    "--batch-size",
+    "-b",
+    default=0,
+    type=int,
+    help="Cases per batch for multitable export with bounded memory",
+    show_default=False,
+)
+@click.option(
+    "--lazy",
+    default=False,
+    is_flag=True,
+    help="Scan parquet and csv archives lazily, reading only the columns used",
+)
+@click.option(
+    "--profile",
+    default=False,
+    is_flag=True,
+    help="Print time, rows and memory used by each stage",
+)
+@click.option(
+    "--fields",
+    "-f",
+    default="",
+    help="Comma-separated cases table columns to parse (default all)",
+)
+@click.option(
+    "--partition-by",
+    default="",
+    help="Write parquet output as a dataset partitioned by county, year, or county,year",
+)
+@click.option(
+    "--compression",
+    type=click.Choice(["zstd", "brotli", "lz4", "snappy", "gzip", "uncompressed"]),
+    default=None,
+    help="Parquet compression codec (default brotli, zstd for datasets)",
+)
+@click.option(
+    "--compression-level",
+    default=None,
+    type=int,
+    help="Parquet compression level",
+)
+@click.option(
+    "--row-group-size",
+    default=None,
+    type=int,
+    help="Rows per parquet row group",
+)
+@click.option(
+    "--no-categorical",
+    default=False,
+    is_flag=True,
+    help="Export categorical columns as plain strings",
+)
+@click.version_option(
+    package_name="alacorder", prog_name=name, message="%(prog)s beta %(version)s"
+)
+def cli_table(
+    input_path,
+    output_path,
+    count,
+    table,
+    overwrite,
+    no_write,
+    no_log,
+    no_prompt,
+    debug,
+    workers,
+    no_cache,
+    cache_max_bytes,
+    batch_size,
+    lazy,
+    profile,
+    fields,
+    partition_by,
+    compression,
+    compression_level,
+    row_group_size,
+    no_categorical,
+):
+    """
+    Write data tables to output path from archive or directory input.
+
+    Args:
+        input_path (str): PDF directory or archive input
+        output_path (str): Path to table output
+        count (int): Total cases to pull from input
+        table (str): Table (all, cases, fees, charges, settings, witnesses, attorneys, case_action_summaries, images)
+        overwrite (bool): Overwrite existing files at output path
+        no_write (bool): Do not export to output path
+        no_log(bool): Do not print logs to console
+        no_prompt (bool): Skip user input / confirmation prompts
+        debug (bool): Print verbose logs to console
+        workers (int): Number of processes to use for PDF text extraction
+        no_cache (bool): Do not read or update PDF text extraction cache
+        cache_max_bytes (int): Maximum bytes of text kept in PDF text extraction cache
+        batch_size (int): Cases per batch for multitable export with bounded memory
+        lazy (bool): Scan parquet and csv archives lazily, reading only the columns used
+        profile (bool): Print time, rows and memory used by each stage
+        fields (str): Comma-separated cases table columns to parse (default all)
+        partition_by (str): Write parquet output as a dataset partitioned by county, year, or county,year
+        compression (str): Parquet compression codec (default brotli, zstd for datasets)
+        compression_level (int): Parquet compression level
+        row_group_size (int): Rows per parquet row group
+        no_categorical (bool): Export categorical columns as plain strings
+    """
+    log = not no_log
+    multitable = os.path.splitext(output_path)[1] in (".xls", ".xlsx") or (
+        os.path.isdir(output_path) and not is_dataset(output_path)
+    )
+    if multitable and not bool(table):
+        table = "all"
+    elif not bool(table):
+        table = click.prompt(
+            "Table export choice (cases, fees, charges, disposition, filing, attorneys, witnesses, images, case-action-summary, settings)"
+        )
+    cf = set(
+        input_path,
+        output_path,
+        count=count,
+        table=table,
+        overwrite=overwrite,
+        no_write=no_write,
+        log=log,
+        no_prompt=no_prompt,
+        debug=debug,
+        workers=workers,
+        no_cache=no_cache,
+        cache_max_bytes=cache_max_bytes,
+        batch_size=batch_size,
+        lazy=lazy,
+        profile=profile,
+        fields=fields,
+        partition_by=partition_by,
+        compression=compression,
+        compression_level=compression_level,
+        row_group_size=row_group_size,
+        no_categorical=no_categorical,
+    )
+    if cf["DEBUG"]:
+        print(cf, cf=cf)
+    o = init(cf)
+    if profile:
+        print(profile_summary(cf["PROFILE"]))
+    return o
+
+
+@main.command(name="archive", help="Create full text archive from case PDFs")
+@click.option(
+    "--input-path",
+    "-in",
+    required=True,
+    type=click.Path(),
+    prompt="PDF directory or archive input",
+)
+@click.option(
+    "--output-path",
+    "-out",
+    required=True,
+    type=click.Path(),
+    prompt="Path to archive output",
+)
+@click.option(
+    "--count",
+    "-c",
+    default=0,
+    help="Total cases to pull from input",
+    show_default=False,
+)
+@click.option(
+    "--overwrite",
+    "-o",
+    default=False,
+    help="Overwrite existing files at output path",
+    is_flag=True,
+    show_default=False,
+)
+@click.option(
+    "--append",
+    "-a",
+    default=False,
+    is_flag=True,
+    help="Attempt to append to existing file at output path",
+)
+@click.option(
+    "--no-log",
+    default=False,
+    is_flag=True,
+    help="Do not print logs to console",
+)
+@click.option(
+    "--no-prompt",
+    default=False,
+    is_flag=True,
+    help="Skip user input / confirmation prompts",
+)
+@click.option(
+    "--debug", "-d", default=False, is_flag=True, help="Print verbose logs to console"
+)
+@click.option(
+    "--workers",
+    "-w",
+    default=1,
+    type=int,
+    help="Number of processes to use for PDF text extraction",
+    show_default=False,
+)
+@click.option(
+    "--no-cache",
+    default=False,
+    is_flag=True,
+    help="Do not read or update PDF text extraction cache",
+)
+@click.option(
+    "--cache-max-bytes",
+    default=EXTRACT_CACHE_MAX_BYTES,
+    type=int,
+    help="Maximum bytes of text kept in PDF text extraction cache",
+    show_default=True,
+)
+@click.option(
+    "--profile",
+    default=False,
+    is_flag=True,
+    help="Print time, rows and memory used by each stage",
+)
+@click.option(
+    "--partition-by",
+    default="",
+    help="Write parquet output as a dataset partitioned by county, year, or county,year",
+)
+@click.option(
+    "--compression",
+    type=click.Choice(["zstd", "brotli", "lz4", "snappy", "gzip", "uncompressed"]),
+    default=None,
+    help="Parquet compression codec (default brotli, zstd for datasets)",
+)
+@click.option(
+    "--compression-level",
+    default=None,
+    type=int,
+    help="Parquet compression level",
+)
+@click.option(
+    "--row-group-size",
+    default=None,
+    type=int,
+    help="Rows per parquet row group",
+)
+@click.version_option(
+    package_name=name.lower(), prog_name=name.upper(), message="%(prog)s %(version)s"
+)
+def cli_archive(
+    input_path,
+    output_path,
+    count,
+    overwrite,
+    append,
+    no_log,
+    no_prompt,
+    debug,
+    workers,
+    no_cache,
+    cache_max_bytes,
+    profile,
+    partition_by,
+    compression,
+    compression_level,
+    row_group_size,
+):
+    """
+    Write a full text archive from a directory of case detail PDFs.
+
+    Args:
+        input_path (str): PDF directory or archive input
+        output_path (str): Path to archive output
+        count (int): Total cases to pull from input
+        overwrite (bool): Overwrite existing files at output path
+        append (bool): Attempt to append to existing file at output path
+        no_write (bool): Do not export to output path
+        no_prompt (bool): Skip user input / confirmation prompts
+        debug (bool): Print verbose logs to console for developers
+        workers (int): Number of processes to use for PDF text extraction
+        no_cache (bool): Do not read or update PDF text extraction cache
+        cache_max_bytes (int): Maximum bytes of text kept in PDF text extraction cache
+        profile (bool): Print time, rows and memory used by each stage
+        partition_by (str): Write parquet output as a dataset partitioned by county, year, or county,year
+        compression (str): Parquet compression codec (default brotli, zstd for datasets)
+        compression_level (int): Parquet compression level
+        row_group_size (int): Rows per parquet row group
+    """
+    log = not no_log
+    cf = set(
+        input_path,
+        output_path,
+        archive=True,
+        count=count,
+        overwrite=overwrite,
+        no_write=False,
+        log=log,
+        append=append,
+        no_prompt=no_prompt,
+        debug=debug,
+        workers=workers,
+        no_cache=no_cache,
+        cache_max_bytes=cache_max_bytes,
+        profile=profile,
+        partition_by=partition_by,
+        compression=compression,
+        compression_level=compression_level,
+        row_group_size=row_group_size,
+    )
+    if debug:
+        click.echo(cf)
+    o = archive(cf)
+    if profile:
+        print(profile_summary(cf["PROFILE"]))
+    return o
+
+
+@main.command(
+    name="pair",
+    help="Create blank AIS / unique pairing template",
+)
+@click.option(
+    "--input-path",
+    "-in",
+    "input_path",
+    required=True,
+    type=click.Path(),
+    prompt="PDF directory or archive input",
+)
+@click.option(
+    "--output-path",
+    "-out",
+    "output_path",
+    required=True,
+    type=click.Path(),
+    prompt="Path to archive output",
+)
+@click.option(
+    "--overwrite",
+    "-o",
+    default=False,
+    help="Overwrite existing files at output path",
+    is_flag=True,
+    show_default=False,
+)
+@click.option(
+    "--debug", "-d", default=False, is_flag=True, help="Print verbose logs to console"
+)
+def cli_pair(input_path, output_path, overwrite, debug):
+    conf = cf(
+        inputs=input_path,
+        outputs=output_path,
+        debug=debug,
+        overwrite=overwrite,
+        log=True,
+    )
+    p = pairs(conf)
+    print("Created pair template at output path.")
+    return p
+
+
+@main.command(
+    name="vrr-pairs", help="Create voting rights summary from input cases and pairs"
+)
+@click.option(
+    "--input-path",
+    "-in",
+    "input_path",
+    required=True,
+    type=click.Path(),
+    prompt="PDF directory or archive input",
+)
+@click.option(
+    "--pairs",
+    "-p",
+    required=True,
+    type=click.Path(),
+    prompt="Completed pairs template",
+)
+@click.option(
+    "--output-path",
+    "-out",
+    "output_path",
+    required=True,
+    type=click.Path(),
+    prompt="Path to table output",
+)
+@click.option(
+    "--overwrite",
+    "-o",
+    default=False,
+    help="Overwrite existing files at output path",
+    is_flag=True,
+    show_default=False,
+)
+@click.option(
+    "--debug", "-d", default=False, is_flag=True, help="Print verbose logs to console"
+)
+def cli_vrr(input_path, output_path, pairs, overwrite, debug):
+    conf = cf(
+        inputs=input_path,
+        outputs=output_path,
+        pairs=pairs,
+        vrr_summary=True,
+        debug=debug,
+        overwrite=overwrite,
+        log=True,
+    )
+    return vrr_summary(conf)
+
+
+@main.command(
+    name="charge-pairs", help="Create charges summary from input cases and pairs"
+)
+@click.option(
+    "--input-path",
+    "-in",
+    "input_path",
+    required=True,
+    type=click.Path(),
+    prompt="PDF directory or archive input",
+)
+@click.option(
+    "--pairs",
+    "-p",
+    required=True,
+    type=click.Path(),
+    prompt="Completed pairs template",
+)
+@click.option(
+    "--output-path",
+    "-out",
+    "output_path",
+    required=True,
+    type=click.Path(),
+    prompt="Path to table output",
+)
+@click.option(
+    "--overwrite",
+    "-o",
+    default=False,
+    help="Overwrite existing files at output path",
+    is_flag=True,
+    show_default=False,
+)
+@click.option(
+    "--debug", "-d", default=False, is_flag=True, help="Print verbose logs to console"
+)
+def cli_charge_pairs(input_path, output_path, pairs, overwrite, debug):
+    conf = cf(
+        inputs=input_path,
+        outputs=output_path,
+        pairs=pairs,
+        charges_summary=True,
+        debug=debug,
+        overwrite=overwrite,
+        log=True,
+    )
+    return charges_summary(conf)
+
+
+@main.command(
+    name="conv-pairs", help="Create convictions summary from input cases and pairs"
+)
+@click.option(
+    "--input-path",
+    "-in",
+    "input_path",
+    required=True,
+    type=click.Path(),
+    prompt="PDF directory or archive input",
+)
+@click.option(
+    "--pairs",
+    "-p",
+    required=True,
+    type=click.Path(),
+    prompt="Completed pairs template",
+)
+@click.option(
+    "--output-path",
+    "-out",
+    "output_path",
+    required=True,
+    type=click.Path(),
+    prompt="Path to table output",
+)
+@click.option(
+    "--overwrite",
+    "-o",
+    default=False,
+    help="Overwrite existing files at output path",
+    is_flag=True,
+    show_default=False,
+)
+@click.option(
+    "--debug", "-d", default=False, is_flag=True, help="Print verbose logs to console"
+)
+def cli_conv_pairs(input_path, output_path, pairs, overwrite, debug):
+    conf = cf(
+        inputs=input_path,
+        outputs=output_path,
+        pairs=pairs,
+        convictions_summary=True,
+        debug=debug,
+        overwrite=overwrite,
+        log=True,
+    )
+    return convictions_summary(conf)
+
+
+@main.command(name="serve", help="Serve table jobs from warm worker processes")
+@click.option(
+    "--socket",
+    "socket_path",
+    default=None,
+    type=click.Path(),
+    help="Listen on this Unix socket instead of HTTP",
+)
+@click.option(
+    "--host",
+    default="127.0.0.1",
+    help="HTTP host to listen on",
+    show_default=True,
+)
+@click.option(
+    "--port",
+    "-p",
+    default=SERVE_PORT,
+    type=int,
+    help="HTTP port to listen on",
+    show_default=True,
+)
+@click.option(
+    "--workers",
+    "-w",
+    default=1,
+    type=int,
+    help="Number of processes to parse jobs concurrently",
+    show_default=False,
+)
+@click.option(
+    "--no-log",
+    default=False,
+    is_flag=True,
+    help="Do not print logs to console",
+)
+def cli_serve(socket_path, host, port, workers, no_log):
+    """
+    Answer table jobs from `alac.request_table()` or any HTTP client until interrupted.
+
+    Args:
+        socket_path (str): Path to Unix socket to listen on
+        host (str): HTTP host to listen on
+        port (int): HTTP port to listen on
+        workers (int): Number of processes to parse jobs concurrently
+        no_log (bool): Do not print logs to console
+    """
+    log = not no_log
+    serve(socket_path=socket_path, host=host, port=port, workers=workers, log=log)
+
+
+@main.command(name="watch", help="Archive case PDFs as they arrive in a directory")
+@click.option(
+    "--input-path",
+    "-in",
+    required=True,
+    type=click.Path(),
+    prompt="PDF directory to watch",
+)
+@click.option(
+    "--output-path",
+    "-out",
+    required=True,
+    type=click.Path(),
+    prompt="Path to archive output",
+)
+@click.option(
+    "--tables",
+    "-t",
+    default=None,
+    type=click.Path(),
+    help="Directory to append each batch's tables to as parquet datasets",
+)
+@click.option(
+    "--interval",
+    default=2.0,
+    type=float,
+    help="Seconds between directory scans",
+    show_default=True,
+)
+@click.option(
+    "--settle",
+    default=1.0,
+    type=float,
+    help="Seconds a PDF must be unmodified before it is archived",
+    show_default=True,
+)
+@click.option(
+    "--workers",
+    "-w",
+    default=1,
+    type=int,
+    help="Number of processes to use for PDF text extraction",
+    show_default=False,
+)
+@click.option(
+    "--batch-size",
+    "-b",
+    default=100,
+    type=int,
+    help="Maximum PDFs per archive append",
+    show_default=True,
+)
+@click.option(
+    "--once",
+    default=False,
+    is_flag=True,
+    help="Archive new PDFs once and exit",
+)
+@click.option(
+    "--no-log",
+    default=False,
+    is_flag=True,
+    help="Do not print logs to console",
+)
+def cli_watch(
+    input_path,
+    output_path,
+    tables,
+    interval,
+    settle,
+    workers,
+    batch_size,
+    once,
+    no_log,
+):
+    """
+    Append case PDFs to archive at output path as they arrive in input directory until interrupted.
+
+    Args:
+        input_path (str): PDF directory to watch
+        output_path (str): Path to archive output
+        tables (str): Directory to append each batch's tables to as parquet datasets
+        interval (float): Seconds between directory scans
+        settle (float): Seconds a PDF must be unmodified before it is archived
+        workers (int): Number of processes to use for PDF text extraction
+        batch_size (int): Maximum PDFs per archive append
+        once (bool): Archive new PDFs once and exit
+        no_log (bool): Do not print logs to console
+    """
+    return watch(
+        input_path,
+        output_path,
+        tables=tables,
+        interval=interval,
+        settle=settle,
+        workers=workers,
+        batch_size=batch_size,
+        once=once,
+        log=not no_log,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1063 @@
+"""
+Alacourt.com PDF scraper: query spreadsheets, browser sessions, HTTP PDF downloads and pipelined archiving.
+"""
+
+import polars as pl
+import os, sys, time, re, json, signal, tempfile, hashlib, filecmp, itertools
+import multiprocessing, threading
+from collections import deque
+from queue import Queue, Empty
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from .logs import error, plog
+from .io import extend_or_write, extract_text, read, write
+
+print = plog
+
+ALACOURT_URL = os.environ.get("ALACOURT_URL", "https://v2.alacourt.com")
+
+
+def read_query(path, qmax=0, qskip=0, window=None):
+    """
+    Read query spreadsheet at `path` for `fetch()`, adding TEMP columns for Party Search fields and row numbers, and replaying progress recorded in its journal by an interrupted `fetch()` (see `query_journal()`).
+    """
+    if os.path.splitext(path)[1] in (".xlsx", ".xls"):
+        query = pl.read_excel(
+            path,
+            xlsx2csv_options={"ignore_errors": True},
+            read_csv_options={"ignore_errors": True},
+        )
+    elif os.path.splitext(path)[1] == ".csv":
+        query = pl.read_csv(path, ignore_errors=True)
+    elif os.path.splitext(path)[1] == ".json":
+        query = pl.read_json(path)
+    elif os.path.splitext(path)[1] == ".parquet":
+        query = pl.read_parquet(path)
+    else:
+        return None
+    query = query.fill_null("")
+    if "TEMP_" in query.columns:
+        if window:
+            window.write_event_value(
+                "POPUP",
+                "Remove TEMP columns from input query spreadsheet and try again.",
+            )
+        else:
+            raise Exception(
+                "Remove TEMP columns from input query spreadsheet and try again."
+            )
+
+    query = query.with_row_count("TEMP_ROW")
+
+    if qskip > 0:
+        qs = qskip - 1
+        query = query[qs:-1]
+
+    if qmax > query.shape[1]:
+        query = query[0:qmax]
+
+    pscols = [
+        "NAME",
+        "PARTY_TYPE",
+        "SSN",
+        "DOB",
+        "COUNTY",
+        "DIVISION",
+        "CASE_YEAR",
+        "NO_RECORDS",
+        "FILED_BEFORE",
+        "FILED_AFTER",
+    ]
+    tempcols = [
+        "TEMP_NAME",
+        "TEMP_PARTY_TYPE",
+        "TEMP_SSN",
+        "TEMP_DOB",
+        "TEMP_COUNTY",
+        "TEMP_DIVISION",
+        "TEMP_CASE_YEAR",
+        "TEMP_NO_RECORDS",
+        "TEMP_FILED_BEFORE",
+        "TEMP_FILED_AFTER",
+    ]
+
+    # add missing progress cols
+    for col in ("RETRIEVED", "CASES_FOUND", "QUERY_COMPLETE"):
+        if col not in query.columns:
+            query = query.with_columns(pl.lit("").alias(col))
+
+    # add matching temp columns for valid columns (i.e. 'Name' -> 'TEMP_NAME')
+    goodquery = False
+    for col in query.columns:
+        if col.upper().strip().replace(" ", "_") in pscols:
+            query = query.with_columns(
+                [pl.col(col).alias(f"TEMP_{col.upper().strip().replace(' ','_')}")]
+            )
+            goodquery = True
+
+    # add other temp columns as empty
+    for col in tempcols:
+        if col not in query.columns:
+            query = query.with_columns([pl.lit("").alias(col)])
+
+    if goodquery:
+        print(f"{query.shape[0]} queries found in input query file.")
+        journal = query_journal(path)
+        if os.path.exists(journal):
+            query = replay_journal(query, journal)
+        return query
+    else:
+        print(
+            "Try again with at least one valid column header: [NAME, PARTY_TYPE, SSN, DOB, COUNTY, DIVISION, CASE_YEAR, NO_RECORDS, FILED_BEFORE, FILED_AFTER, RETRIEVED, CASES_FOUND, QUERY_COMPLETE]"
+        )
+        return None
+
+
+def query_journal(path):
+    """
+    Return path to progress journal for query spreadsheet at `path`. `fetch()` appends a JSON line to it for each completed query row, and `read_query()` replays it so an interrupted fetch resumes where it stopped.
+    """
+    return f"{path}.progress.jsonl"
+
+
+def replay_journal(query, journal):
+    """
+    Return `query` from `read_query()` with RETRIEVED, CASES_FOUND and QUERY_COMPLETE updated from progress journal at `journal`. Journal lines are matched to rows by row number and name, and a torn last line is ignored.
+    """
+    records = []
+    with open(journal) as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue
+    if len(records) == 0:
+        return query
+    log = (
+        pl.DataFrame(
+            records,
+            schema={
+                "TEMP_ROW": pl.UInt32,
+                "NAME": pl.Utf8,
+                "RETRIEVED": pl.Float64,
+                "CASES_FOUND": pl.Int64,
+                "QUERY_COMPLETE": pl.Utf8,
+            },
+        )
+        .unique(subset="TEMP_ROW", keep="last")
+        .select(pl.all().suffix("_JOURNAL"))
+        .rename({"TEMP_ROW_JOURNAL": "TEMP_ROW"})
+    )
+    query = query.join(log, on="TEMP_ROW", how="left")
+    replayed = pl.col("NAME_JOURNAL") == pl.col("TEMP_NAME")
+    print(
+        f"Resuming {query.select(replayed.sum())[0, 0]} queries completed in progress journal."
+    )
+    return query.with_columns(
+        [
+            pl.when(replayed)
+            .then(pl.col(f"{col}_JOURNAL").cast(query.schema[col], strict=False))
+            .otherwise(pl.col(col))
+            .alias(col)
+            for col in ("RETRIEVED", "CASES_FOUND", "QUERY_COMPLETE")
+        ]
+    ).drop([col for col in query.columns if col.endswith("_JOURNAL")])
+
+
+def fetch(
+    querypath="",
+    dirpath="",
+    cID="",
+    uID="",
+    pwd="",
+    qmax=0,
+    qskip=0,
+    cf=None,
+    no_update=False,
+    debug=False,
+    window=None,
+    sessions=1,
+    rate=0,
+    save_interval=600,
+    archive=None,
+    workers=1,
+    batch_size=100,
+    archive_timeout=3600,
+):
+    """
+    Fetch case PDFs from Alacourt.com.
+    Input query spreadsheet with headers NAME, PARTY_TYPE, SSN, DOB, COUNTY, DIVISION, CASE_YEAR, and FILED_BEFORE as `querypath`. Alacorder will Party Search non-blank fields on Alacourt.com and download to `dirpath`. With `sessions` > 1, each session downloads to its own `session-N` subdirectory of `dirpath` and takes query rows from a shared queue (see `fetch_session()`). Progress is appended to a journal beside `querypath` after each row (see `query_journal()`), and the query spreadsheet is rewritten every `save_interval` seconds and on completion. Given an `archive` path, downloaded PDFs are extracted with `workers` processes while fetching continues and appended to the archive every `batch_size` PDFs (see `archive_downloads()`).
+    Args:
+       querypath (str): Path to query table/spreadsheet (.xls, .xlsx)
+       dirpath (str): Path to PDF output directory
+       cID (str): Customer ID on Alacourt.com
+       uID (str): User ID on Alacourt.com
+       pwd (str): Password on Alacourt.com
+       qmax (int): Maximum queries to conduct on Alacourt.com
+       qskip (int): Skip entries at top of query file
+       no_update (bool): Do not update query template after completion
+       debug (bool): Print detailed runtime information to console
+       sessions (int): Number of browser sessions to fetch query rows concurrently
+       rate (float): Maximum Alacourt.com page requests per second across all sessions (0 for no limit)
+       save_interval (float): Seconds between query spreadsheet rewrites while fetching (0 to rewrite only on completion)
+       archive (str): Path to new or existing archive to append fetched cases to
+       workers (int): Number of processes to use for PDF text extraction
+       batch_size (int): PDFs per archive append
+       archive_timeout (float): Seconds to wait for the archive to finish after fetching before stopping it
+    """
+    if cf != None:
+        querypath = cf["INPUTS"]
+        dirpath = cf["OUTPUT_PATH"]
+        cID = cf["ALA_CUSTOMER_ID"]
+        uID = cf["ALA_USER_ID"]
+        pwd = cf["ALA_PASSWORD"]
+        qmax = cf["FETCH_MAX"]
+        qskip = cf["FETCH_SKIP"]
+        no_update = cf["NO_UPDATE"]
+        sessions = cf["FETCH_SESSIONS"]
+        rate = cf["FETCH_RATE"]
+        window = cf["WINDOW"]
+        archive = cf["FETCH_ARCHIVE"]
+        workers = cf["WORKERS"]
+    else:
+        cf = {
+            "INPUTS": querypath,
+            "OUTPUT_PATH": dirpath,
+            "ALA_CUSTOMER_ID": cID,
+            "ALA_USER_ID": uID,
+            "ALA_PASSWORD": pwd,
+            "FETCH_MAX": qmax,
+            "FETCH_SKIP": qskip,
+            "NO_UPDATE": no_update,
+            "FETCH_SESSIONS": sessions,
+            "FETCH_RATE": rate,
+            "FETCH_ARCHIVE": archive,
+            "WORKERS": workers,
+            "WINDOW": window,
+        }
+
+    query = read_query(cf["INPUTS"], qmax=qmax, qskip=qskip)
+    rows = query.rows(named=True)
+
+    # shared work queue of incomplete query rows
+    work = Queue()
+    for i, r in enumerate(rows):
+        if r["QUERY_COMPLETE"] != "Y":
+            work.put(i)
+    sessions = min(max(sessions, 1), work.qsize())
+
+    # archive downloads as they arrive, in another process so its polars work
+    # cannot deadlock with query updates in this one
+    pdfs = archiver = None
+    if archive != None:
+        ctx = multiprocessing.get_context("spawn")
+        pdfs = ctx.Queue()
+        opts = {
+            key: cf.get(key)
+            for key in ("PARTITION_BY", "COMPRESSION", "COMPRESSION_LEVEL", "LOG")
+        }
+        archiver = ctx.Process(
+            target=archive_downloads, args=[pdfs, archive, workers, batch_size, opts]
+        )
+        archiver.start()
+
+    try:
+        # start browsers and authenticate
+        print("Starting browser... Do not close while in progress!")
+        done = Queue()
+        wait = rate_limiter(rate)
+        for k in range(sessions):
+            path = (
+                dirpath if sessions == 1 else os.path.join(dirpath, f"session-{k + 1}")
+            )
+            threading.Thread(
+                target=fetch_session,
+                args=[rows, work, done, path, cID, uID, pwd],
+                kwargs={
+                    "wait": wait,
+                    "progress": sessions == 1,
+                    "window": window,
+                    "downloaded": pdfs,
+                },
+                daemon=True,
+            ).start()
+
+        # merge session results into query as they finish
+        journal = query_journal(cf["INPUTS"])
+        stale = os.path.exists(journal)
+        saved = time.time()
+        log = None if no_update else open(journal, "a")
+        try:
+            running = sessions
+            while running > 0:
+                i, found, err = done.get()
+                if i == None:
+                    running -= 1
+                    continue
+                if err != None:
+                    print(f"Query #{i} failed, will retry on next run: {err}")
+                    continue
+                if found > 0:
+                    print(
+                        f"#{i}/{query.shape[0]} {rows[i]['TEMP_NAME']} ({found} records returned)"
+                    )
+                else:
+                    print(f"Found no results: {rows[i]['TEMP_NAME']}")
+                retrieved = time.time()
+                query[i, "CASES_FOUND"] = found
+                query[i, "RETRIEVED"] = retrieved
+                query[i, "QUERY_COMPLETE"] = "Y"
+                if log == None:
+                    continue
+                log.write(
+                    json.dumps(
+                        {
+                            "TEMP_ROW": rows[i]["TEMP_ROW"],
+                            "NAME": rows[i]["TEMP_NAME"],
+                            "RETRIEVED": retrieved,
+                            "CASES_FOUND": found,
+                            "QUERY_COMPLETE": "Y",
+                        }
+                    )
+                    + "\n"
+                )
+                log.flush()
+                os.fsync(log.fileno())
+                stale = True
+                if save_interval > 0 and time.time() - saved > save_interval:
+                    write_query(query, cf["INPUTS"])
+                    saved = time.time()
+        finally:
+            if log != None:
+                log.close()
+
+        # journal is only needed until the spreadsheet has caught up
+        if not no_update and stale:
+            write_query(query, cf["INPUTS"])
+            os.remove(journal)
+    finally:  # stop the archiver even if fetching failed, so it cannot outlive us
+        if archiver != None:
+            print("Waiting for archive to finish...")
+            pdfs.put(None)
+            archiver.join(archive_timeout)
+            if archiver.is_alive():
+                print(f"Archive did not finish in {archive_timeout}s, stopping it.")
+                archiver.terminate()
+                archiver.join()
+
+    if archiver != None and archiver.exitcode != 0:
+        error(
+            f"Failed to archive fetched cases to {archive}.",
+            cf={"WINDOW": window, "FORCE": False},
+        )
+
+    if window:
+        window.write_event_value("COMPLETE-SQ", time.time())
+    print("Completed query template.")
+    return query
+
+
+def archive_downloads(pdfs, path, workers=1, batch_size=100, cf=None):
+    """
+    Extract text from each PDF path put on `pdfs` queue with `workers` processes as `fetch()` downloads it, appending cases to archive at `path` (see `extend_or_write()`) every `batch_size` PDFs, until None is put on `pdfs`. Returns number of cases archived.
+
+    Args:
+        pdfs (Queue | multiprocessing.Queue): Paths to downloaded PDFs, then None
+        path (str): Path to new or existing archive
+        workers (int, optional): Number of processes to use for PDF text extraction
+        batch_size (int, optional): PDFs per archive append
+        cf (dict, optional): Configuration object
+    """
+    pending = deque()
+    batch = []
+    seen = {}
+    count = [0]
+
+    def flush():
+        if len(batch) == 0:
+            return
+        df = read(
+            pl.DataFrame(
+                {
+                    "Timestamp": time.time(),
+                    "AllPagesText": [text for pp, text in batch],
+                    "Path": [os.path.abspath(pp) for pp, text in batch],
+                }
+            )
+        )
+        extend_or_write(df, path, cf=cf)
+        count[0] += len(batch)
+        print(f"Archived {count[0]} cases to {path}.")
+        batch.clear()
+
+    if threading.current_thread() is threading.main_thread():
+        # fetch() terminates a stuck archiver; exit through the executor so
+        # its extraction workers are stopped too instead of left orphaned
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(1))
+
+    with ProcessPoolExecutor(max_workers=max(workers, 1)) as executor:
+        try:
+            finished = False
+            while not finished or len(pending) > 0:
+                if not finished:
+                    try:  # collect finished texts while waiting on downloads
+                        pp = pdfs.get(timeout=1)
+                        if pp == None:
+                            finished = True
+                        elif pp not in seen:
+                            seen[pp] = True
+                            pending.append((pp, executor.submit(extract_text, pp)))
+                    except Empty:
+                        pass
+                while len(pending) > 0 and (finished or pending[0][1].done()):
+                    pp, fut = pending.popleft()
+                    batch.append((pp, fut.result()))
+                    if len(batch) >= batch_size:
+                        flush()
+        except BaseException:  # drop queued extractions rather than wait on them
+            executor.shutdown(cancel_futures=True)
+            raise
+    flush()
+    print(f"Finished archiving {count[0]} cases to {path}.")
+    return count[0]
+
+
+def fetch_session(
+    rows,
+    work,
+    done,
+    path,
+    cID,
+    uID,
+    pwd,
+    wait=None,
+    progress=True,
+    window=None,
+    downloads=4,
+    downloaded=None,
+):
+    """
+    Log in to Alacourt.com in a new browser, then Party Search query `rows` by index from `work` queue until it is empty, downloading each row's PDFs to `path` over HTTP with the browser session's cookies (see `download_pdfs()`). Puts (index, cases found, None) or (index, None, exception) on `done` queue after each row, and (None, None, None) when the session ends.
+
+    Args:
+        rows (List[dict]): Query rows from `read_query()`
+        work (Queue): Shared queue of row indices to fetch
+        done (Queue): Shared queue of results
+        path (str): Path to PDF output directory for this session
+        cID (str): Customer ID on Alacourt.com
+        uID (str): User ID on Alacourt.com
+        pwd (str): Password on Alacourt.com
+        wait (Callable, optional): Called before each page request, see `rate_limiter()`
+        progress (bool, optional): Show download progress for each row
+        window (None, optional): PySimpleGUI window element
+        downloads (int, optional): Concurrent PDF downloads
+        downloaded (Queue, optional): Put paths to downloaded PDFs on this queue
+    """
+    wait = wait or rate_limiter()
+    client = http_client(downloads)
+    driver = None
+    try:
+        driver = start_driver(path)
+        wait()
+        login(driver, cID=cID, uID=uID, pwd=pwd, window=window)
+        while True:
+            try:
+                i = work.get_nowait()
+            except Empty:
+                break
+            r = rows[i]
+            try:
+                if driver.current_url == f"{ALACOURT_URL}/frmlogin.aspx":
+                    wait()
+                    login(driver, cID, uID, pwd, window=window)
+                driver.implicitly_wait(1)
+                wait()
+                results = party_search(
+                    driver,
+                    name=r["TEMP_NAME"],
+                    party_type=r["TEMP_PARTY_TYPE"],
+                    ssn=r["TEMP_SSN"],
+                    dob=r["TEMP_DOB"],
+                    county=r["TEMP_COUNTY"],
+                    division=r["TEMP_DIVISION"],
+                    case_year=r["TEMP_CASE_YEAR"],
+                    filed_before=r["TEMP_FILED_BEFORE"],
+                    filed_after=r["TEMP_FILED_AFTER"],
+                    cID=cID,
+                    uID=uID,
+                    pwd=pwd,
+                    window=window,
+                )
+                paths = download_pdfs(
+                    client,
+                    results,
+                    path,
+                    headers=session_headers(driver),
+                    workers=downloads,
+                    wait=wait,
+                    progress=progress,
+                    window=window,
+                )
+                if downloaded != None:
+                    for pp in paths:
+                        downloaded.put(pp)
+                done.put((i, len(results), None))
+            except Exception as e:
+                done.put((i, None, e))
+    except Exception as e:
+        print(f"Browser session downloading to {path} failed: {e}")
+    finally:
+        if driver != None:
+            driver.quit()
+        done.put((None, None, None))
+
+
+def rate_limiter(rate=0):
+    """
+    Return function that blocks until calling it would not exceed `rate` calls per second, counting calls from every thread sharing it (0 for no limit).
+    """
+    lock = threading.Lock()
+    last = [0.0]
+
+    def wait():
+        if rate <= 0:
+            return
+        with lock:
+            delay = last[0] + 1 / rate - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            last[0] = time.monotonic()
+
+    return wait
+
+
+def start_driver(path=""):
+    """
+    Return new Google Chrome selenium.WebDriver() object that downloads PDFs to directory at `path` without prompting.
+    """
+    from selenium import webdriver
+
+    if path != "":
+        path = os.path.abspath(path)
+        os.makedirs(path, exist_ok=True)
+    opt = webdriver.ChromeOptions()
+    opt.add_experimental_option(
+        "prefs",
+        {
+            "download.default_directory": path,  # Change default directory for downloads
+            "download.prompt_for_download": False,  # To auto download the file
+            "download.directory_upgrade": True,
+            "plugins.always_open_pdf_externally": True,  # It will not display PDF directly in chrome
+        },
+    )
+    return webdriver.Chrome(options=opt)
+
+
+def write_query(query, path):
+    """
+    Write `query` from `read_query()` back to query spreadsheet at `path` without its TEMP columns, replacing it only once the new file is complete.
+    """
+    root, ext = os.path.splitext(path)
+    tmp = f"{root}.tmp{ext}"
+    write(
+        query.drop([col for col in query.columns if col.startswith("TEMP_")]),
+        path=tmp,
+        overwrite=True,
+    )
+    os.replace(tmp, path)
+
+
+def party_search(
+    driver,
+    name="",
+    party_type="",
+    ssn="",
+    dob="",
+    county="",
+    division="",
+    case_year="",
+    filed_before="",
+    filed_after="",
+    debug=False,
+    cID="",
+    uID="",
+    pwd="",
+    window=None,
+):
+    """
+    Collect PDFs via SJIS Party Search Form from Alacourt.com
+    Returns list of URLs for download_pdfs() to download
+
+    Args:
+        driver (WebDriver): selenium/chrome web driver object
+        name (str, optional): Name (LAST FIRST)
+        party_type (str, optional): "Defendants" | "Plaintiffs" | "ALL"
+        ssn (str, optional): Social Security Number
+        dob (str, optional): Date of Birth
+        county (str, optional): County
+        division (str, optional): "All Divisions"
+             "Criminal Only"
+             "Civil Only"
+             "CS - CHILD SUPPORT"
+             "CV - CIRCUIT - CIVIL"
+             "CC - CIRCUIT - CRIMINAL"
+             "DV - DISTRICT - CIVIL"
+             "DC - DISTRICT - CRIMINAL"
+             "DR - DOMESTIC RELATIONS"
+             "EQ - EQUITY-CASES"
+             "MC - MUNICIPAL-CRIMINAL"
+             "TP - MUNICIPAL-PARKING"
+             "SM - SMALL CLAIMS"
+             "TR - TRAFFIC"
+        case_year (str, optional): YYYY
+        filed_before (str, optional): M/DD/YYYY
+        filed_after (str, optional): M/DD/YYYY
+        debug (bool, optional): Print detailed logs.
+        cID (str, optional): Customer ID on Alacourt.com
+        uID (str, optional): User ID on Alacourt.com
+        pwd (str, optional): Password on Alacourt.com
+
+    Returns:
+        List[str] of URLs to PDF
+    """
+    from selenium.common.exceptions import NoSuchElementException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import Select
+
+    if "frmIndexSearchForm" not in driver.current_url:
+        driver.get(f"{ALACOURT_URL}/frmIndexSearchForm.aspx")
+
+    driver.implicitly_wait(5)
+
+    has_window = False if window == "None" else True
+
+    # connection error
+    try:
+        party_name_box = driver.find_element(
+            by=By.NAME, value="ctl00$ContentPlaceHolder1$txtName"
+        )
+    except NoSuchElementException:
+        if debug:
+            print(
+                """NoSuchElementException on alac.py 2173: party_name_box = driver.find_element(by=By.NAME, value="ctl00$ContentPlaceHolder1$txtName")"""
+            )
+        if driver.current_url == f"{ALACOURT_URL}/frmlogin.aspx":
+            time.sleep(10)
+            login(driver, cID=cID, uID=uID, pwd=pwd)
+            driver.implicitly_wait(1)
+        driver.get(f"{ALACOURT_URL}/frmIndexSearchForm.aspx")
+        print("Successfully connected and logged into Alacourt!")
+        party_name_box = driver.find_element(
+            by=By.NAME, value="ctl00$ContentPlaceHolder1$txtName"
+        )
+
+    # field search
+    if name != "":
+        party_name_box.send_keys(name)
+    if ssn != "":
+        ssn_box = driver.find_element(
+            by=By.NAME, value="ctl00$ContentPlaceHolder1$txtSSN"
+        )
+        ssn_box.send_keys(ssn)
+    if dob != "":
+        date_of_birth_box = driver.find_element(
+            by=By.NAME, value="ctl00$ContentPlaceHolder1$txtDOB"
+        )
+        date_of_birth_box.send_keys(dob)
+    if party_type != "":
+        party_type_select = driver.find_element(
+            by=By.NAME, value="ctl00$ContentPlaceHolder1$rdlPartyType"
+        )
+        pts = Select(party_type_select)
+        if party_type == "plaintiffs":
+            pts.select_by_visible_text("Plaintiffs")
+        if party_type == "defendants":
+            pts.select_by_visible_text("Defendants")
+        if party_type == "all":
+            pts.select_by_visible_text("ALL")
+
+    if county != "":
+        county_select = driver.find_element(
+            by=By.NAME, value="ctl00$ContentPlaceHolder1$ddlCounties"
+        )
+        scounty = Select(county_select)
+        scounty.select_by_visible_text(county)
+    if division != "":
+        division_select = driver.find_element(
+            by=By.NAME, value="ctl00$ContentPlaceHolder1$UcddlDivisions1$ddlDivision"
+        )
+        sdivision = Select(division_select)
+        sdivision.select_by_visible_text(division)
+    if case_year != "":
+        case_year_select = driver.find_element(
+            by=By.NAME, value="ctl00$ContentPlaceHolder1$ddlCaseYear"
+        )
+        scase_year = Select(case_year_select)
+        scase_year.select_by_visible_text(case_year)
+    no_records_select = driver.find_element(
+        by=By.NAME, value="ctl00$ContentPlaceHolder1$ddlNumberOfRecords"
+    )
+    sno_records = Select(no_records_select)
+    sno_records.select_by_visible_text("1000")
+    if filed_before != "":
+        filed_before_box = driver.find_element(
+            by=By.NAME, value="ctl00$ContentPlaceHolder1$txtFrom"
+        )
+        filed_before_box.send_keys(filed_before)
+    if filed_after != "":
+        filed_after_box = driver.find_element(
+            by=By.NAME, value="ctl00$ContentPlaceHolder1$txtTo"
+        )
+        filed_after_box.send_keys(filed_after)
+
+    driver.implicitly_wait(1)
+
+    # submit search
+    search_button = driver.find_element(by=By.ID, value="searchButton")
+
+    driver.implicitly_wait(1)
+    try:
+        search_button.click()
+    except:
+        driver.implicitly_wait(5)
+        time.sleep(5)
+
+    if debug:
+        print("Submitted party search form...")
+
+    driver.implicitly_wait(1)
+
+    # count pages
+    try:
+        page_counter = driver.find_element(
+            by=By.ID, value="ContentPlaceHolder1_dg_tcPageXofY"
+        ).text
+        pages = int(page_counter.strip()[-1])
+
+    except:
+        pages = 1
+
+    # count results
+    try:
+        results_indicator = driver.find_element(
+            by=By.ID, value="ContentPlaceHolder1_lblResultCount"
+        )
+        results_count = int(
+            results_indicator.text.replace("Search Results: ", "")
+            .replace(" records returned.", "")
+            .strip()
+        )
+    except:
+        pass
+
+    if debug:
+        print(f"Found {results_count} results, fetching URLs and downloading PDFs...")
+
+    # get PDF links from each page
+    pdflinks = []
+    i = 0
+    for i in range(0, pages):
+        driver.implicitly_wait(0.5)
+        hovers = driver.find_elements(By.CLASS_NAME, "menuHover")
+        for x in hovers:
+            try:
+                a = x.get_attribute("href")
+                if "PDF" in a:
+                    pdflinks.append(a)
+            except:
+                pass
+        driver.implicitly_wait(0.5)
+        try:
+            pager_select = Select(
+                driver.find_element(
+                    by=By.NAME, value="ctl00$ContentPlaceHolder1$dg$ctl18$ddlPages"
+                )
+            )
+            next_pg = int(pager_select.text) + 1
+            driver.implicitly_wait(0.5)
+        except:
+            try:
+                driver.implicitly_wait(0.5)
+                time.sleep(0.5)
+                next_button = driver.find_element(
+                    by=By.ID, value="ContentPlaceHolder1_dg_ibtnNext"
+                )
+                next_button.click()
+            except:
+                continue
+    return pdflinks
+
+
+def downloadPDF(driver, url, cID="", uID="", pwd="", window=None):
+    """
+    With selenium WebDriver `driver`, download PDF at `url`.
+
+    Args:
+        driver (WebDriver): Google Chrome selenium.WebDriver() object
+        url (str): URL to Alacourt case detail PDF download
+        cID (str, optional): Customer ID on Alacourt.com
+        uID (str, optional): User ID on Alacourt.com
+        pwd (str, optional): Password on Alacourt.com
+
+    """
+    if (
+        driver.current_url == f"{ALACOURT_URL}/frmlogin.aspx"
+        and cID != ""
+        and uID != ""
+        and pwd != ""
+    ):
+        login(driver, cID=cID, uID=uID, pwd=pwd, window=window)
+    a = driver.get(url)
+    driver.implicitly_wait(0.5)
+
+
+def http_client(workers=4):
+    """
+    Return pooled urllib3 HTTP client for `download_pdfs()` holding up to `workers` connections per host.
+    """
+    import urllib3
+
+    return urllib3.PoolManager(
+        maxsize=workers,
+        block=True,
+        retries=False,
+        timeout=urllib3.Timeout(connect=10, read=60),
+    )
+
+
+def session_headers(driver):
+    """
+    Return HTTP headers carrying the cookies and user agent of logged in selenium WebDriver `driver`, so `download_pdfs()` requests are authenticated as the browser session.
+    """
+    return {
+        "Cookie": "; ".join(f"{c['name']}={c['value']}" for c in driver.get_cookies()),
+        "User-Agent": driver.execute_script("return navigator.userAgent"),
+    }
+
+
+def pdf_name(url, disposition=""):
+    """
+    Return file name for PDF at `url` from its Content-Disposition header `disposition`, the URL path, or a hash of the URL.
+    """
+    name = re.search(r'filename\*?=(?:UTF-8\'\')?"?([^";]+)', disposition)
+    if name:
+        return os.path.basename(name.group(1).strip())
+    name = os.path.basename(url.split("?")[0])
+    if name.lower().endswith(".pdf"):
+        return name
+    return hashlib.md5(url.encode()).hexdigest() + ".pdf"
+
+
+def place_pdf(tmp, path, name):
+    """
+    Move downloaded file `tmp` to `name` in directory `path` and return its new path. Names are claimed with an exclusive create, so concurrent downloads given the same name cannot overwrite each other: if a different file already has `name`, the next free of `name (1).pdf`, `name (2).pdf`, ... is used. A file identical to one already there replaces it, so downloading a PDF again does not leave a copy.
+    """
+    root, ext = os.path.splitext(name)
+    for n in itertools.count():
+        out = os.path.join(path, name if n == 0 else f"{root} ({n}){ext}")
+        try:
+            os.link(tmp, out)
+            os.remove(tmp)
+            return out
+        except FileExistsError:
+            if filecmp.cmp(tmp, out, shallow=False):
+                os.replace(tmp, out)
+                return out
+        except OSError:  # i.e. filesystems without hard links
+            try:
+                os.close(os.open(out, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+            except FileExistsError:
+                if filecmp.cmp(tmp, out, shallow=False):
+                    os.replace(tmp, out)
+                    return out
+                continue
+            os.replace(tmp, out)
+            return out
+
+
+def download_pdf(client, url, path, headers=None, retries=3, backoff=0.5, wait=None):
+    """
+    Download PDF at `url` to directory at `path` with urllib3 `client`, streaming to a temporary file moved into place with `place_pdf()` once its `%PDF` header is verified. Connection errors, HTTP 429 and 5xx responses, and non-PDF responses are retried up to `retries` times after `backoff`, 2 * `backoff`, ... seconds. Returns path to downloaded PDF.
+
+    Args:
+        client (urllib3.PoolManager): HTTP client from `http_client()`
+        url (str): URL to Alacourt case detail PDF download
+        path (str): Path to PDF output directory
+        headers (dict, optional): Request headers, see `session_headers()`
+        retries (int, optional): Retries after first attempt
+        backoff (float, optional): Seconds to wait before first retry
+        wait (Callable, optional): Called before each request, see `rate_limiter()`
+    """
+    import urllib3
+
+    wait = wait or rate_limiter()
+    for attempt in range(retries + 1):
+        tmp = None
+        try:
+            wait()
+            r = client.request("GET", url, headers=headers, preload_content=False)
+            try:
+                if r.status != 200:
+                    raise urllib3.exceptions.HTTPError(f"HTTP {r.status} from {url}")
+                name = pdf_name(url, r.headers.get("Content-Disposition", ""))
+                fd, tmp = tempfile.mkstemp(suffix=".part", dir=path)
+                with os.fdopen(fd, "wb") as f:
+                    for chunk in r.stream(2**16):
+                        f.write(chunk)
+            finally:
+                r.release_conn()
+            with open(tmp, "rb") as f:
+                if f.read(4) != b"%PDF":
+                    raise urllib3.exceptions.HTTPError(f"Not a PDF: {url}")
+            return place_pdf(tmp, path, name)
+        except (urllib3.exceptions.HTTPError, OSError) as e:
+            if tmp != None and os.path.exists(tmp):
+                os.remove(tmp)
+            status = re.match(r"HTTP (\d+)", str(e))
+            if attempt == retries or (
+                status and int(status.group(1)) < 500 and status.group(1) != "429"
+            ):
+                raise
+            time.sleep(backoff * 2**attempt)
+
+
+def download_pdfs(
+    client,
+    urls,
+    path,
+    headers=None,
+    workers=4,
+    retries=3,
+    backoff=0.5,
+    wait=None,
+    progress=False,
+    window=None,
+):
+    """
+    Download PDFs at `urls` to directory at `path` concurrently with `workers` threads sharing urllib3 `client` (see `download_pdf()`). Returns list of paths to downloaded PDFs, or raises the first download error once the others finish.
+
+    Args:
+        client (urllib3.PoolManager): HTTP client from `http_client()`
+        urls (List[str]): URLs to Alacourt case detail PDF downloads
+        path (str): Path to PDF output directory
+        headers (dict, optional): Request headers, see `session_headers()`
+        workers (int, optional): Concurrent downloads
+        retries (int, optional): Retries per PDF after first attempt
+        backoff (float, optional): Seconds to wait before first retry
+        wait (Callable, optional): Called before each request, see `rate_limiter()`
+        progress (bool, optional): Show download progress
+        window (None, optional): PySimpleGUI window element
+    """
+    from tqdm.auto import tqdm
+
+    path = os.path.abspath(path or ".")
+    os.makedirs(path, exist_ok=True)
+    if window and progress:
+        window.write_event_value("PROGRESS-TEXT", 0)
+        window.write_event_value("PROGRESS-TEXT-TOTAL", max(len(urls), 1))
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        futures = [
+            executor.submit(
+                download_pdf, client, url, path, headers, retries, backoff, wait
+            )
+            for url in urls
+        ]
+        for j, fut in enumerate(
+            tqdm(
+                as_completed(futures),
+                total=len(futures),
+                disable=bool(window) or not progress,
+            )
+        ):
+            if window and progress:
+                window.write_event_value("PROGRESS-TEXT", j + 1)
+    return [fut.result() for fut in futures]
+
+
+def login(driver, cID, uID="", pwd="", path="", window=None):
+    """Login to Alacourt.com using (driver) and auth (cID, username, pwd) for browser download to directory at (path)
+
+    Args:
+        driver (WebDriver): Google Chrome selenium.WebDriver() object
+        cID (str): Alacourt.com Customer ID
+        uID (str): Alacourt.com User ID
+        pwd (str): Alacourt.com Password
+        path (str, optional): Set browser download path
+
+    Returns:
+        driver (WebDriver): selenium engine
+    """
+    from selenium.webdriver.common.by import By
+
+    if driver == None:
+        driver = start_driver(path)
+
+    print("Connecting to Alacourt...")
+
+    login_screen = driver.get(f"{ALACOURT_URL}/frmlogin.aspx")
+
+    print("Logging in...")
+
+    driver.implicitly_wait(1)
+
+    cID_box = driver.find_element(by=By.NAME, value="ctl00$ContentPlaceHolder$txtCusid")
+    username_box = driver.find_element(
+        by=By.NAME, value="ctl00$ContentPlaceHolder$txtUserId"
+    )
+    pwd_box = driver.find_element(
+        by=By.NAME, value="ctl00$ContentPlaceHolder$txtPassword"
+    )
+    login_button = driver.find_element(by=By.ID, value="ContentPlaceHolder_btLogin")
+
+    cID_box.send_keys(cID)
+    username_box.send_keys(uID)
+    pwd_box.send_keys(pwd)
+
+    driver.implicitly_wait(1)
+
+    login_button.click()
+
+    driver.implicitly_wait(1)
+
+    try:
+        continueLogIn = driver.find_element(
+            by=By.NAME, value="ctl00$ContentPlaceHolder$btnContinueLogin"
+        )
+        continueLogIn.click()
+    except:
+        pass
+
+    driver.get(f"{ALACOURT_URL}/frmIndexSearchForm.aspx")
+
+    print("Successfully connected and logged into Alacourt!")
+
+    driver.implicitly_wait(1)
+
+    return driver
+
+
+def empty_query(path):
+    """Create empty spreadsheet to fill and import as query submit search list to retrieve matching case records from Alacourt.com.
+
+    Args:
+        path (str): Desired output path (.xls, .xlsx)
+
+    """
+    success = True
+    empty = pl.DataFrame(
+        columns=[
+            "NAME",
+            "PARTY_TYPE",
+            "SSN",
+            "DOB",
+            "COUNTY",
+            "DIVISION",
+            "CASE_YEAR",
+            "NO_RECORDS",
+            "FILED_BEFORE",
+            "FILED_AFTER",
+            "RETRIEVED",
+            "CASES_FOUND",
+        ]
+    )
+    return write(empty, sheet_names="query", path=path, overwrite=True)
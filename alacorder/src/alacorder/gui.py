@@ -0,0 +1,622 @@
+"""
+PySimpleGUI graphical user interface.
+"""
+
+
+from .logs import fshort_name, name, plog, version
+from .io import append_archive, archive, init, pairs, set
+from .fetch import empty_query, fetch
+
+print = plog
+
+def loadgui():
+    """
+    Load PySimpleGUI tk graphical interface
+    """
+    import PySimpleGUI as sg
+    import platform
+    import threading
+
+    psys = platform.system()
+    plat = platform.platform()
+    if "Darwin" in (plat, psys) or "macOS" in (plat, psys):  # set MacOS element sizes
+        HEADER_FONT, LOGO_FONT, ASCII_FONT, BODY_FONT, WINDOW_RESIZE, WINDOW_SIZE = (
+            "Default 22",
+            "Courier 20",
+            "Courier 14",
+            "Default 12",
+            True,
+            [480, 510],
+        )
+    elif "Windows" in (plat, psys):  # set Windows element sizes
+        HEADER_FONT, LOGO_FONT, ASCII_FONT, BODY_FONT, WINDOW_RESIZE, WINDOW_SIZE = (
+            "Default 14",
+            "Courier 13",
+            "Courier 11",
+            "Default 10",
+            True,
+            [500, 540],
+        )
+        try:
+            from ctypes import windll
+
+            windll.shcore.SetProcessDpiAwareness(1)
+        except:
+            pass
+    else:  # set Linux, etc. element sizes
+        HEADER_FONT, LOGO_FONT, ASCII_FONT, BODY_FONT, WINDOW_RESIZE, WINDOW_SIZE = (
+            "Default 15",
+            "Courier 12",
+            "Courier 13",
+            "Default 10",
+            True,
+            [540, 540],
+        )
+    sg.theme("Black")
+    sg.set_options(font=BODY_FONT)
+    fetch_layout = [
+        [
+            sg.Text(
+                """Collect case PDFs in bulk from Alacourt.com.""",
+                font=HEADER_FONT,
+                pad=(5, 5),
+            )
+        ],
+        [
+            sg.Text(
+                """Requires Google Chrome. Use column headers NAME, PARTY_TYPE, SSN,\nDOB, COUNTY, DIVISION, CASE_YEAR, and/or FILED_BEFORE in an Excel\nspreadsheet to submit a list of queries for Alacorder to scrape. Each\ncolumn corresponds to a field in Alacourt's Party Search form.""",
+                pad=(5, 5),
+            )
+        ],
+        [
+            sg.Text("Input Path: "),
+            sg.InputText(
+                tooltip="Existing query template (.xlsx)",
+                size=[22, 10],
+                key="SQ-INPUTPATH",
+                focus=True,
+            ),
+            sg.FileBrowse(button_text="Select File", button_color=("white", "black")),
+            sg.Button(
+                button_text="New Query",
+                button_color=("white", "black"),
+                k="NEWQUERY",
+                enable_events=True,
+            ),
+        ],
+        [
+            sg.Text("Output Path: "),
+            sg.InputText(
+                tooltip="PDF download destination folder",
+                size=[29, 10],
+                key="SQ-OUTPUTPATH",
+            ),
+            sg.FolderBrowse(
+                button_text="Select Folder", button_color=("white", "black")
+            ),
+        ],
+        [
+            sg.Text("Max queries: "),
+            sg.Input(key="SQ-MAX", default_text="0", size=[5, 1]),
+            sg.Text("Skip from top: "),
+            sg.Input(key="SQ-SKIP", default_text="0", size=[5, 1]),
+        ],
+        [sg.Text("Alacourt.com Credentials", font=BODY_FONT)],
+        [
+            sg.Text("Customer ID:"),
+            sg.Input(key="SQ-CUSTOMERID", size=(13, 1)),
+            sg.Text("User ID:"),
+            sg.Input(key="SQ-USERID", size=(13, 1)),
+        ],
+        [
+            sg.Text("Password:"),
+            sg.InputText(key="SQ-PASSWORD", password_char="*", size=(15, 1)),
+        ],
+        [
+            sg.Button(
+                "Start Query",
+                key="SQ",
+                button_color=("white", "black"),
+                pad=(10, 10),
+                disabled_button_color=("grey", "black"),
+                bind_return_key=True,
+            )
+        ],
+    ]
+    archive_layout = [
+        [
+            sg.Text(
+                """Create full text archives from a directory\nof PDF cases.""",
+                font=HEADER_FONT,
+                pad=(5, 5),
+            )
+        ],
+        [
+            sg.Text(
+                """Case text archives require a fraction of the storage capacity and\nprocessing time used to process PDF directories. Before exporting\nyour data to tables, create an archive with supported file extensions\n.parquet, .json, and .csv. Once archived, use your case text archive\nas an input for multitable or single table export.""",
+                pad=(5, 5),
+            )
+        ],
+        [
+            sg.Text("Input Directory: "),
+            sg.InputText(
+                tooltip="PDF directory or full text archive (.parquet, .json, .csv)",
+                size=[25, 1],
+                key="MA-INPUTPATH",
+                focus=True,
+            ),
+            sg.FolderBrowse(
+                button_text="Select Folder", button_color=("white", "black")
+            ),
+        ],
+        [
+            sg.Text("Output Path: "),
+            sg.InputText(
+                tooltip="Output archive file path (.parquet, .json, .csv)",
+                size=[39, 1],
+                key="MA-OUTPUTPATH",
+            ),
+        ],
+        [
+            sg.Text("Skip Cases From: "),
+            sg.Input(
+                tooltip="Skip all input cases found in PDF directory or archive (.parquet, .json, .csv)",
+                key="MA-SKIP",
+                size=[24, 1],
+                pad=(0, 10),
+            ),
+        ],
+        [
+            sg.Text("Max cases: "),
+            sg.Input(key="MA-COUNT", default_text="0", size=[5, 1]),
+            sg.Checkbox("Allow Overwrite", default=True, key="MA-OVERWRITE"),
+            sg.Checkbox("Try to Append", key="MA-APPEND", default=False),
+        ],
+        [
+            sg.Button(
+                "Make Archive",
+                button_color=("white", "black"),
+                key="MA",
+                enable_events=True,
+                bind_return_key=True,
+                disabled_button_color=("grey", "black"),
+                pad=(10, 10),
+            )
+        ],
+    ]  # "MA"
+    append_layout = [
+        [
+            sg.Text(
+                """Append case text archive with the contents\nof a case directory or archive.""",
+                font=HEADER_FONT,
+                pad=(5, 5),
+            )
+        ],
+        [
+            sg.Text(
+                """Case text archives require a fraction of the storage capacity and\nprocessing time used to process PDF directories. Before exporting\nyour data to tables, create an archive with a supported file\nextension (.parquet, .json, .csv). Once archived, use your case text\narchive as an input for table export.""",
+                pad=(5, 5),
+            )
+        ],
+        [
+            sg.Text("To Append: "),
+            sg.InputText(
+                tooltip="PDF Directory or full text archive (.parquet, .json, .csv)",
+                size=[30, 10],
+                key="AA-INPUTPATH",
+                focus=True,
+            ),
+            sg.FileBrowse(button_text="Select File", button_color=("white", "black")),
+        ],
+        [
+            sg.Text("To Be Appended: "),
+            sg.InputText(
+                tooltip="Destination full text archive (.parquet, .json, .csv)",
+                size=[26, 10],
+                key="AA-OUTPUTPATH",
+            ),
+            sg.FileBrowse(button_text="Select File", button_color=("white", "black")),
+        ],
+        [
+            sg.Button(
+                "Append Archives",
+                key="AA",
+                button_color=("white", "black"),
+                pad=(10, 10),
+                disabled_button_color=("grey", "black"),
+                bind_return_key=True,
+            )
+        ],
+    ]  # "AA"
+    sum_layout = [
+        [
+            sg.Text(
+                """Pair cases by AIS number to create a\npaired summary table.""",
+                font=HEADER_FONT,
+                pad=(5, 5),
+            )
+        ],
+        [
+            sg.Text(
+                """To make a charges summary table, start by creating an AIS / Unique ID\npair template, fill the template with AIS numbers or another\nidentifier to match names in common, then enter the template path and\ncase input path below.""",
+                pad=(5, 5),
+            )
+        ],
+        [
+            sg.Text("Input Path:  "),
+            sg.InputText(
+                tooltip="PDF Directory or full text archive (.parquet, .json, .csv)",
+                size=[31, 10],
+                key="SUM-INPUTPATH",
+                focus=True,
+            ),
+            sg.FileBrowse(button_text="Select File", button_color=("white", "black")),
+        ],
+        [
+            sg.Text("Pairs: "),
+            sg.InputText(
+                tooltip="Destination full text archive (.parquet, .json, .csv)",
+                size=[32, 10],
+                key="SUM-PAIRS",
+            ),
+            sg.Button(
+                button_text="Make Template", button_color=("white", "black"), key="MT"
+            ),
+        ],
+        [
+            sg.Text("Output Path:  "),
+            sg.InputText(
+                tooltip="PDF Directory or full text archive (.parquet, .json, .csv)",
+                size=[40, 10],
+                key="SUM-OUTPUTPATH",
+                focus=True,
+            ),
+        ],
+        [
+            sg.Radio("Charges", "SUMMARY", key="SUM-CH", default=True),
+            sg.Radio("Convictions", "SUMMARY", key="SUM-CONV", default=False),
+            sg.Radio("Voting Rights", "SUMMARY", key="SUM-VRR", default=False),
+        ],
+        [
+            sg.Button(
+                "Create Summary",
+                key="SUM",
+                button_color=("white", "black"),
+                pad=(10, 10),
+                disabled_button_color=("grey", "black"),
+                bind_return_key=True,
+            )
+        ],
+    ]  # "SUM"
+    table_layout = [
+        [
+            sg.Text(
+                """Export data tables from a case archive\nor PDF directory.""",
+                font=HEADER_FONT,
+                pad=(5, 5),
+            )
+        ],
+        [
+            sg.Text(
+                """Alacorder processes case detail PDFs and case text archives into data\ntables suitable for research purposes. Enter PDF directory or case text\narchive path and output file path (.xlsx, .xls, .csv, .json) to begin. CSV\nand JSON support single table selection only.""",
+                pad=(5, 5),
+            )
+        ],
+        [
+            sg.Text("Input Path: "),
+            sg.InputText(
+                tooltip="PDF directory or full text archive (.parquet, .json, .csv)",
+                size=[28, 10],
+                key="TB-INPUTPATH",
+                focus=True,
+            ),
+            sg.FolderBrowse(
+                button_text="Select Folder", button_color=("white", "black")
+            ),
+        ],
+        [
+            sg.Text("Output Path: "),
+            sg.InputText(
+                tooltip="Multitable export (.xlsx, .xls) or single-table export (.xlsx, .xls, .json, .csv)",
+                size=[39, 10],
+                key="TB-OUTPUTPATH",
+            ),
+        ],
+        [
+            sg.Radio("All Tables (.xlsx, .xls)", "TABLE", key="TB-ALL", default=True),
+            sg.Radio("Cases", "TABLE", key="TB-CASES", default=False),
+            sg.Radio("Charges", "TABLE", key="TB-CHARGES", default=False),
+            sg.Radio("Fees", "TABLE", key="TB-FEES", default=False),
+        ],
+        [
+            sg.Radio("Case Action Summary", "TABLE", key="TB-CAS", default=False),
+            sg.Radio("Witnesses", "TABLE", key="TB-WITNESSES", default=False),
+            sg.Radio("Images", "TABLE", key="TB-IMAGES", default=False),
+        ],
+        [
+            sg.Radio("Attorneys", "TABLE", key="TB-ATTORNEYS", default=False),
+            sg.Radio("Settings", "TABLE", key="TB-SETTINGS", default=False),
+            sg.Radio("Disposition", "TABLE", key="TB-DISPOSITION", default=False),
+            sg.Radio("Filing", "TABLE", key="TB-FILING", default=False),
+        ],
+        [
+            sg.Text("Max cases: "),
+            sg.Input(key="TB-COUNT", default_text="0", size=[5, 1]),
+            sg.Checkbox("Allow Overwrite", key="TB-OVERWRITE", default=True),
+        ],
+        [
+            sg.Button(
+                "Export Table",
+                key="TB",
+                button_color=("white", "black"),
+                pad=(10, 10),
+                disabled_button_color=("grey", "black"),
+                bind_return_key=True,
+            )
+        ],
+    ]  # "TB"
+    about_layout = [
+        [
+            sg.Text(
+                f""" ┌─┐┌─┐┬─┐┌┬┐┬ ┬┌┬┐┌─┐┬ ┬┌┐┌┌┬┐┌─┐┬┌┐┌\n ├─┘├─┤├┬┘ │ └┬┘││││ ││ ││││ │ ├─┤││││\n ┴  ┴ ┴┴└─ ┴  ┴ ┴ ┴└─┘└─┘┘└┘ ┴ ┴ ┴┴┘└┘\n {version}""",
+                font=ASCII_FONT,
+                pad=(5, 5),
+            )
+        ],
+        [
+            sg.Text(
+                "Alacorder retrieves and processes\nAlacourt case detail PDFs into\ndata tables and archives.",
+                font=HEADER_FONT,
+                pad=(5, 5),
+            )
+        ],
+        [
+            sg.Text(
+                """View documentation, source code, and latest updates at\ngithub.com/sbrobson959/alacorder.\n\n© 2023 Sam Robson""",
+                font=BODY_FONT,
+            )
+        ],
+    ]  # "ABOUT"
+    tabs = sg.TabGroup(
+        expand_x=True,
+        expand_y=False,
+        size=[0, 0],
+        font="Courier",
+        layout=[
+            [sg.Tab("fetch", layout=fetch_layout, pad=(2, 2))],
+            [sg.Tab("archive", layout=archive_layout, pad=(2, 2))],
+            [sg.Tab("table", layout=table_layout, pad=(2, 2))],
+            [sg.Tab("append", layout=append_layout, pad=(2, 2))],
+            [sg.Tab("pair", layout=sum_layout, pad=(2, 2))],
+            [sg.Tab("about", layout=about_layout, pad=(2, 2))],
+        ],
+    )
+    layout = [
+        [sg.Text(fshort_name, font=LOGO_FONT, pad=(5, 5))],
+        [tabs],
+        [
+            sg.ProgressBar(
+                100,
+                size=[5, 10],
+                expand_y=False,
+                orientation="h",
+                expand_x=True,
+                key="PROGRESS",
+                bar_color="black",
+            )
+        ],
+        [
+            sg.Multiline(
+                expand_x=True,
+                expand_y=True,
+                background_color="black",
+                reroute_stdout=True,
+                pad=(5, 5),
+                font="Courier 11",
+                write_only=True,
+                autoscroll=True,
+                no_scrollbar=True,
+                size=[None, 4],
+                border_width=0,
+            )
+        ],
+    ]
+    window = sg.Window(
+        title=name,
+        layout=layout,
+        grab_anywhere=True,
+        resizable=WINDOW_RESIZE,
+        size=WINDOW_SIZE,
+    )
+    while True:
+        event, values = window.read()
+        if event in ("Exit", "Quit", sg.WIN_CLOSED):
+            window.close()
+            break
+        elif "TOTAL" in event and "PROGRESS" in event:
+            window["PROGRESS"].update(max=values[event], current_count=0)
+        elif "PROGRESS" in event and "TOTAL" not in event:
+            window["PROGRESS"].update(current_count=values[event])
+        elif "COMPLETE" in event:
+            print("Alacorder completed the task.")
+            window["AA"].update(disabled=False)
+            window["SQ"].update(disabled=False)
+            window["MA"].update(disabled=False)
+            window["TB"].update(disabled=False)
+            window["MA"].update(disabled=False)
+            window["SUM"].update(disabled=False)
+            window["PROGRESS"].update(current_count=0, max=100)
+            sg.popup("Alacorder completed the task.")
+            continue
+        elif event == "NEWQUERY":
+            if window["SQ-INPUTPATH"].get() == "":
+                sg.popup(
+                    "To create empty query template, enter file output path (extension must be .xlsx) in Input Path, then press the New Query button to try again."
+                )
+            else:
+                if empty_query(window["SQ-INPUTPATH"].get()):
+                    sg.popup("Alacorder created query template.")
+                else:
+                    sg.popup(
+                        "Enter valid path with .xlsx extension in Input Path box and try again."
+                    )
+        elif event == "MT":
+            cf = set(
+                window["SUM-INPUTPATH"].get(),
+                window["SUM-PAIRS"].get(),
+                pairs=window["SUM-PAIRS"].get(),
+                log=True,
+                no_write=False,
+                debug=False,
+                overwrite=True,
+                window=window,
+            )
+            threading.Thread(target=pairs, args=[cf], daemon=True).start()
+            print("Creating AIS / Unique ID pairs template...")
+            window["MT"].update(disabled=True)
+        elif event == "SUM":
+            cf = set(
+                window["SUM-INPUTPATH"].get(),
+                window["SUM-OUTPUTPATH"].get(),
+                pairs=window["SUM-PAIRS"].get(),
+                vrr_summary=window["SUM-VRR"].get(),
+                charges_summary=window["SUM-CH"].get(),
+                convictions_summary=window["SUM-CONV"].get(),
+                log=True,
+                no_write=False,
+                debug=False,
+                overwrite=True,
+                window=window,
+            )
+            print("Making voting rights summary table...")
+            threading.Thread(target=init, args=[cf], daemon=True).start()
+            window["SUM"].update(disabled=True)
+        elif event == "POPUP":
+            sg.popup(values["POPUP"])
+        elif event == "TB":
+            table = ""
+            table = "all" if window["TB-ALL"].get() else table
+            table = "charges" if window["TB-CHARGES"].get() else table
+            table = "fees" if window["TB-FEES"].get() else table
+            table = "case-action-summary" if window["TB-CAS"].get() else table
+            table = "witnesses" if window["TB-WITNESSES"].get() else table
+            table = "images" if window["TB-IMAGES"].get() else table
+            table = "attorneys" if window["TB-ATTORNEYS"].get() else table
+            table = "settings" if window["TB-SETTINGS"].get() else table
+            table = "disposition" if window["TB-DISPOSITION"].get() else table
+            table = "filing" if window["TB-FILING"].get() else table
+            if (
+                window["TB-INPUTPATH"].get() == ""
+                or window["TB-OUTPUTPATH"].get() == ""
+            ):
+                sg.popup("Check configuration and try again.")
+            else:
+                cf = set(
+                    window["TB-INPUTPATH"].get(),
+                    window["TB-OUTPUTPATH"].get(),
+                    count=int(window["TB-COUNT"].get()),
+                    table=table,
+                    log=True,
+                    overwrite=window["TB-OVERWRITE"].get(),
+                    no_prompt=True,
+                    debug=False,
+                    archive=False,
+                    window=window,
+                )
+                # except:
+                window["TB"].update(disabled=True)
+                threading.Thread(target=init, args=[cf], daemon=True).start()
+                continue
+        elif event == "MA":
+            if (
+                window["MA-INPUTPATH"].get() == ""
+                or window["MA-OUTPUTPATH"].get() == ""
+            ):
+                sg.popup("Check configuration and try again.")
+                window["MA"].update(disabled=False)
+                continue
+            try:
+                count = int(window["MA-COUNT"].get().strip())
+            except:
+                count = 0
+            try:
+                cf = set(
+                    window["MA-INPUTPATH"].get(),
+                    window["MA-OUTPUTPATH"].get(),
+                    count=count,
+                    archive=True,
+                    log=True,
+                    overwrite=window["MA-OVERWRITE"].get(),
+                    append=window["MA-APPEND"].get(),
+                    no_prompt=True,
+                    window=window,
+                )
+            except:
+                sg.popup("Check configuration and try again.")
+                window["MA"].update(disabled=False)
+                continue
+            window["MA"].update(disabled=True)
+            threading.Thread(target=archive, args=[cf], daemon=True).start()
+            continue
+        elif event == "SQ":
+            if (
+                window["SQ-INPUTPATH"].get() == ""
+                or window["SQ-OUTPUTPATH"].get() == ""
+            ):
+                sg.popup("Check configuration and try again.")
+            try:
+                pwd = window["SQ-PASSWORD"].get()
+                try:
+                    sq_max = int(window["SQ-MAX"].get().strip())
+                    sq_skip = int(window["SQ-SKIP"].get().strip())
+                except:
+                    sq_max = 0
+                    sq_skip = 0
+                window["SQ"].update(disabled=True)
+                threading.Thread(
+                    target=fetch,
+                    args=(
+                        window["SQ-INPUTPATH"].get(),
+                        window["SQ-OUTPUTPATH"].get(),
+                        window["SQ-CUSTOMERID"].get(),
+                        window["SQ-USERID"].get(),
+                        pwd,
+                        sq_max,
+                        sq_skip,
+                        None,
+                        False,
+                        False,
+                        window,
+                    ),
+                    daemon=True,
+                ).start()
+                continue
+            except:
+                print("Check configuration and try again.")
+                window["SQ"].update(disabled=False)
+                continue
+        elif event == "AA":
+            if (
+                window["AA-INPUTPATH"].get() == ""
+                or window["AA-OUTPUTPATH"].get() == ""
+            ):
+                sg.popup("Check configuration and try again.")
+                continue
+            try:
+                window["AA"].update(disabled=True)
+                threading.Thread(
+                    target=append_archive,
+                    args=(
+                        window["AA-INPUTPATH"].get(),
+                        window["AA-OUTPUTPATH"].get(),
+                    ),
+                    kwargs={"window": window},
+                    daemon=True,
+                ).start()
+                continue
+            except:
+                print("Check configuration and try again.")
+                window["AA"].update(disabled=False)
+                continue
+        else:
+            pass
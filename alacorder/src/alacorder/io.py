@@ -0,0 +1,2247 @@
+"""
+Configuration and I/O: `set()` and `cf()`, archive and table `read()` and `write()`, parquet datasets, case databases, PDF text extraction, and the table and summary tasks started by `init()`.
+"""
+
+import polars as pl
+import os, sys, time, glob, re, math, shutil, tempfile, hashlib, sqlite3
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from .logs import dlog, error, height, plog, profile_stage
+from .parse import (
+    CASE_FIELDS,
+    case_keys,
+    categorical,
+    explode_attorneys,
+    explode_case_action_summary,
+    explode_charges,
+    explode_fees,
+    explode_images,
+    explode_settings,
+    explode_witnesses,
+    parse_tables,
+    plain_strings,
+    split_cases,
+    split_charges,
+    split_fees,
+)
+
+print = plog
+
+EXTRACT_CACHE_NAME = ".alacorder-cache.sqlite"
+EXTRACT_CACHE_MAX_BYTES = 2 * 1024**3  # default, see cf(cache_max_bytes=)
+CASEDB_VERSION = 2  # bump when parse_tables() output changes to invalidate case dbs
+CASEDB_NAME = ".alacorder-casedb"  # directory of case databases keyed by archive hash
+CASEDB_MAX = 8  # case databases kept per directory, least recently used removed
+PARTITION_KEYS = {  # hive partition key expressions, i.e. 01-CC-2020-000123.00
+    "county": pl.col("CaseNumber").str.slice(0, 2),
+    "year": pl.col("CaseNumber").str.extract(r"^\w+-\w+-(\d{4})"),
+}
+
+
+EXCEL_MAX_ROWS = 1048576  # rows per worksheet, including the header row
+MULTI_SHEETS = [
+    "cases",
+    "filing-charges",
+    "disposition-charges",
+    "fees",
+    "settings",
+    "case-action-summary",
+    "witnesses",
+    "attorneys",
+    "images",
+]
+
+
+def pairs(cf):
+    """
+    Create AIS / Unique ID pairs template using configuration object `cf`.
+    """
+    tp = make_pairs_template(load_tables(cf["INPUTS"], cf=cf)["cases"])
+    if not cf["NO_WRITE"]:
+        write(
+            tp, sheet_names=["Pairs"], path=cf["OUTPUT_PATH"], overwrite=cf["OVERWRITE"]
+        )
+    if cf["LOG"]:
+        print("Created template successfully.")
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("MT-COMPLETE", True)
+    return tp
+
+
+def multi(cf):
+    """
+    Start multitable collection using configuration object `cf`.
+    """
+    if cf["BATCH_SIZE"] > 0:
+        return multi_batches(cf)
+    df = read(cf)
+    out = parse_tables(df, cf=cf, fields=cf["FIELDS"])
+    if not cf["NO_WRITE"]:
+        print("Writing to export...", cf=cf)
+        write(
+            [out[sheet] for sheet in MULTI_SHEETS],
+            sheet_names=MULTI_SHEETS,
+            cf=cf,
+        )
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("COMPLETE-TB", True)
+    return out
+
+
+def multi_batches(cf):
+    """
+    Start multitable collection in batches of `cf['BATCH_SIZE']` cases, writing each batch of every table to a Parquet part file so that only one batch is held in memory at a time. Directory outputs keep the parts as `<table>.parquet` datasets; Excel outputs are assembled from them one worksheet at a time.
+    """
+    if cf["NO_WRITE"]:
+        error("Batch mode requires an output path.", cf=cf)
+        return None  # error() only raises without FORCE or WINDOW
+    if cf["OUTPUT_EXT"] == "directory":
+        tmp = None
+        sinkdir = cf["OUTPUT_PATH"]
+    else:
+        tmp = tempfile.TemporaryDirectory()
+        sinkdir = tmp.name
+    sinks = {sheet: os.path.join(sinkdir, f"{sheet}.parquet") for sheet in MULTI_SHEETS}
+    existing = [path for path in sinks.values() if os.path.isdir(path)]
+    if len(existing) > 0 and not cf["OVERWRITE"]:  # stale parts from an earlier run
+        error(
+            "Could not write to output path because overwrite mode is not enabled.",
+            cf=cf,
+        )
+        return None  # error() only raises without FORCE or WINDOW
+    for path in sinks.values():
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        os.makedirs(path)
+    total = math.ceil(cf["COUNT"] / cf["BATCH_SIZE"])
+    quiet = {**cf, "LOG": False, "WINDOW": None}
+    partition_by = cf["PARTITION_BY"] if cf["OUTPUT_EXT"] == "directory" else None
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("PROGRESS_TOTAL", total)
+    with pl.StringCache():  # one category mapping across every batch's parts
+        for i, df in enumerate(read_batches(cf)):
+            print(f"Parsing batch {i + 1} of {total}...", cf=cf)
+            tables = parse_tables(df, cf=quiet, fields=cf["FIELDS"])
+            if not cf["CATEGORICAL"]:
+                tables = {sheet: plain_strings(x) for sheet, x in tables.items()}
+            with profile_stage("write", cf, rows_in=height(list(tables.values()))):
+                for sheet, path in sinks.items():
+                    if partition_by:
+                        write_dataset(
+                            tables[sheet], path, partition_by, cf=cf, metadata=False
+                        )
+                        continue
+                    part = os.path.join(path, f"part-{i:05d}.parquet")
+                    write_part(tables[sheet], part, cf=cf)
+            del df, tables
+            if cf["WINDOW"]:
+                cf["WINDOW"].write_event_value("PROGRESS", i + 1)
+    if cf["OUTPUT_EXT"] in (".xlsx", ".xls"):
+        print("Writing to export...", cf=cf)
+        with profile_stage("write", cf):  # stream each sheet from its parts
+            write_excel(
+                cf["OUTPUT_PATH"],
+                {
+                    sheet: scan_batches(path, cf["BATCH_SIZE"])
+                    for sheet, path in sinks.items()
+                },
+            )
+        sinks = {sheet: cf["OUTPUT_PATH"] for sheet in sinks}
+    elif partition_by:
+        for path in sinks.values():
+            write_dataset_metadata(path, cf=cf)
+    if tmp != None:
+        tmp.cleanup()
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("COMPLETE-TB", True)
+    return sinks
+
+
+def casedb_path(key, cf=None):
+    """
+    Return path to case database directory for archive contents hashed `key` (see `archive_hash()`). Case databases are kept in `.alacorder-casedb` beside the output path in `cf`, as the extraction cache is, else in the user cache directory, never beside the input archive.
+    """
+    if isinstance(cf, dict) and not cf.get("NO_WRITE") and cf.get("OUTPUT_PATH"):
+        if cf.get("OUTPUT_EXT") == "directory":
+            root = cf["OUTPUT_PATH"]
+        else:
+            root = os.path.dirname(os.path.abspath(cf["OUTPUT_PATH"]))
+    else:
+        root = user_cache_dir()
+    return os.path.join(root, CASEDB_NAME, key)
+
+
+def casedb_evict(root, keep=CASEDB_MAX):
+    """
+    Remove all but the `keep` most recently used case databases in directory `root`.
+    """
+    used = {}
+    for name in os.listdir(root):
+        if name.endswith(".tmp"):  # being saved by another process
+            continue
+        try:
+            used[name] = os.path.getmtime(os.path.join(root, name))
+        except OSError:
+            pass
+    for name in sorted(used, key=used.get, reverse=True)[keep:]:
+        shutil.rmtree(os.path.join(root, name), ignore_errors=True)
+
+
+def archive_hash(path):
+    """
+    Return BLAKE2b hex digest of archive file or parquet dataset contents at `path`, or None if `path` is not an archive (i.e. a PDF directory).
+    """
+    if is_dataset(path):
+        parts = archive_parts(path)
+    elif os.path.isfile(path) and os.path.splitext(path)[1] != ".pdf":
+        parts = [path]
+    else:
+        return None
+    h = hashlib.blake2b(digest_size=20)
+    h.update(str(CASEDB_VERSION).encode())
+    for pp in parts:
+        h.update(file_hash(pp).encode())
+    return h.hexdigest()
+
+
+def load_tables(src, cf=None):
+    """
+    Return dict of every multitable export table for archive `src`. Tables are loaded from the archive's case database when there is one for its contents (see `casedb_path()`), else parsed with `parse_tables()` and saved to a case database for the next run if its directory is writable.
+
+    Args:
+        src (str | pl.DataFrame | dict): Path to archive or PDF directory, archive DataFrame, or dict of tables (returned as is)
+        cf (dict, optional): Configuration object for logging and output path
+    """
+    with pl.StringCache():
+        if isinstance(src, dict):
+            return src
+        if not isinstance(src, str):
+            return parse_tables(read(src), cf=cf)
+        key = archive_hash(src)
+        if key == None:
+            return parse_tables(read(src), cf=cf)
+        db = casedb_path(key, cf=cf)
+        try:
+            with open(os.path.join(db, "key")) as f:
+                fresh = f.read().strip() == key
+        except OSError:
+            fresh = False
+        if fresh:
+            if cf != None:
+                plog(f"Loading tables from case database at {db}...", cf=cf)
+            try:
+                tables = {
+                    table: pl.read_parquet(os.path.join(db, f"{table}.parquet"))
+                    for table in MULTI_SHEETS + ["charges"]
+                }
+                try:  # mark as recently used for casedb_evict()
+                    os.utime(db)
+                except OSError:
+                    pass
+                return tables
+            except OSError:  # evicted by another process while reading
+                pass
+        tables = parse_tables(read(src), cf=cf)
+        root = os.path.dirname(db)
+        tmp = f"{db}.{os.getpid()}.tmp"  # processes may save the same case database
+        try:  # key is written last so a partial write is never loaded
+            os.makedirs(root, exist_ok=True)
+            if not os.access(root, os.W_OK):
+                raise PermissionError(f"{root} is not writable")
+            shutil.rmtree(tmp, ignore_errors=True)
+            os.makedirs(tmp)
+            for table, df in tables.items():
+                df.write_parquet(os.path.join(tmp, f"{table}.parquet"))
+            with open(os.path.join(tmp, "key"), "w") as f:
+                f.write(key)
+            shutil.rmtree(db, ignore_errors=True)
+            os.replace(tmp, db)
+            casedb_evict(root)
+        except OSError as e:
+            shutil.rmtree(tmp, ignore_errors=True)
+            dlog(f"Could not save case database at {db}: {e}", cf=cf)
+        return tables
+
+
+def cases(cf):
+    """
+    Start cases table collection using configuration object `cf`.
+    """
+    df = read(cf)
+    print("Parsing case info...", cf=cf)
+    with profile_stage("split_cases", cf, rows_in=height(df)) as stage:
+        ca = split_cases(df.lazy(), fields=cf["FIELDS"])[0].collect()
+        stage["RowsOut"] = ca.shape[0]
+    if not cf["NO_WRITE"]:
+        print("Writing to export...")
+        write(ca, cf=cf)
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("COMPLETE-TB", True)
+    return ca
+
+
+def charges(cf):
+    """
+    Start charges table collection using configuration object `cf`.
+    """
+    df = read(cf)
+    print("Parsing charges...", cf=cf)
+    with profile_stage("split_charges", cf, rows_in=height(df)) as stage:
+        ac = explode_charges(df.lazy())
+        ch = split_charges(ac).collect()
+        stage["RowsOut"] = ch.shape[0]
+    if not cf["NO_WRITE"]:
+        print("Writing to export...", cf=cf)
+        write(ch, cf=cf)
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("COMPLETE-TB", True)
+    return ch
+
+
+def fees(cf):
+    """
+    Start fee sheet collection using configuration object `cf`.
+    """
+    df = read(cf)
+    print("Parsing fee sheets...", cf=cf)
+    with profile_stage("split_fees", cf, rows_in=height(df)) as stage:
+        af = explode_fees(df.lazy())
+        fs = split_fees(af).collect()
+        stage["RowsOut"] = fs.shape[0]
+    if not cf["NO_WRITE"]:
+        print("Writing to export...", cf=cf)
+        write(fs, cf=cf)
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("COMPLETE-TB", True)
+    return fs
+
+
+def witnesses(cf):
+    """
+    Collect witnesses tables using configuration object `cf`.
+    """
+    q = read(cf)
+    with profile_stage("explode_witnesses", cf, rows_in=height(q)) as stage:
+        out = explode_witnesses(q.lazy()).collect()
+        stage["RowsOut"] = out.shape[0]
+    if not cf["NO_WRITE"]:
+        write(out, sheet_names=["witnesses"], cf=cf)
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("COMPLETE-TB", True)
+    return out
+
+
+def attorneys(cf):
+    """
+    Collect attorneys tables using configuration object `cf`.
+    """
+    q = read(cf)
+    with profile_stage("explode_attorneys", cf, rows_in=height(q)) as stage:
+        out = explode_attorneys(q.lazy()).collect()
+        stage["RowsOut"] = out.shape[0]
+    if not cf["NO_WRITE"]:
+        write(out, sheet_names=["attorneys"], cf=cf)
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("COMPLETE-TB", True)
+    return out
+
+
+def settings(cf):
+    """
+    Collect settings tables using configuration object `cf`.
+    """
+    q = read(cf)
+    with profile_stage("explode_settings", cf, rows_in=height(q)) as stage:
+        out = explode_settings(q.lazy()).collect()
+        stage["RowsOut"] = out.shape[0]
+    if not cf["NO_WRITE"]:
+        write(out, sheet_names=["settings"], cf=cf)
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("COMPLETE-TB", True)
+    return out
+
+
+def images(cf):
+    """
+    Collect images tables using configuration object `cf`.
+    """
+    q = read(cf)
+    with profile_stage("explode_images", cf, rows_in=height(q)) as stage:
+        out = explode_images(q.lazy()).collect()
+        stage["RowsOut"] = out.shape[0]
+    if not cf["NO_WRITE"]:
+        write(out, sheet_names=["images"], cf=cf)
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("COMPLETE-TB", True)
+    return out
+
+
+def vrr_summary(cf):
+    """
+    Summarize voting rights status from pairs using configuration object `cf`.
+    """
+    vr = vrr_summary_from_pairs(cf["INPUTS"], cf["PAIRS"], debug=cf["DEBUG"], cf=cf)
+    if not cf["NO_WRITE"]:
+        write(
+            vr, sheet_names=["VRR"], path=cf["OUTPUT_PATH"], overwrite=cf["OVERWRITE"]
+        )
+    if cf["LOG"]:
+        print("Created table successfully.")
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("VRR-COMPLETE", True)
+    return vr
+
+
+def case_action_summary(cf):
+    """
+    Collect case action summaries using configuration object `cf`.
+    """
+    q = read(cf)
+    with profile_stage("explode_case_action_summary", cf, rows_in=height(q)) as stage:
+        out = explode_case_action_summary(q.lazy()).collect()
+        stage["RowsOut"] = out.shape[0]
+    if not cf["NO_WRITE"]:
+        write(out, sheet_names=["case-action-summary"], cf=cf)
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("COMPLETE-TB", True)
+    return out
+
+
+def charges_summary(cf):
+    """
+    Summarize voting rights status from pairs using configuration object `cf`.
+    """
+    ch = charges_summary_from_pairs(
+        cf["INPUTS"], cf["PAIRS"], debug=cf["DEBUG"], cf=cf
+    )
+    if not cf["NO_WRITE"]:
+        write(
+            ch,
+            sheet_names=["ChargesSummary"],
+            path=cf["OUTPUT_PATH"],
+            overwrite=cf["OVERWRITE"],
+        )
+    if cf["LOG"]:
+        print("Created table successfully.")
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("CHSUM-COMPLETE", True)
+    return ch
+
+
+def convictions_summary(cf):
+    """
+    Summarize voting rights status from pairs using configuration object `cf`.
+    """
+    conv = convictions_summary_from_pairs(
+        cf["INPUTS"], cf["PAIRS"], debug=cf["DEBUG"], cf=cf
+    )
+    if not cf["NO_WRITE"]:
+        write(
+            conv,
+            sheet_names=["ConvictionsSummary"],
+            path=cf["OUTPUT_PATH"],
+            overwrite=cf["OVERWRITE"],
+        )
+    if cf["LOG"]:
+        print("Created table successfully.")
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("CONVSUM-COMPLETE", True)
+    return conv
+
+
+def init(cf):
+    """
+    Start Alacorder using configuration object `cf`.
+    """
+    if cf["FETCH"] == True:
+        from .fetch import fetch  # fetch imports this module
+
+        ft = fetch(cf=cf)
+        return ft
+    elif cf["ARCHIVE"] == True:
+        ar = archive(cf)
+        return ar
+    elif cf["VRR_SUMMARY"] == True and cf["PAIRS"]:
+        vr = vrr_summary(cf)
+        return vr
+    elif cf["CHARGES_SUMMARY"] == True and cf["PAIRS"]:
+        ch = charges_summary(cf)
+        return ch
+    elif cf["CONVICTIONS_SUMMARY"] == True and cf["PAIRS"]:
+        conv = convictions_summary(cf)
+        return cf
+    elif (
+        cf["TABLE"].lower() in ("charges", "disposition", "filing")
+        and cf["SUPPORT_SINGLETABLE"]
+    ):
+        ch = charges(cf)
+        return ch
+    elif cf["TABLE"].lower() in ("cases", "caseinfo") and cf["SUPPORT_SINGLETABLE"]:
+        ca = cases(cf)
+        return ca
+    elif (
+        cf["TABLE"].lower() in ("fees", "feesheet", "fines")
+        and cf["SUPPORT_SINGLETABLE"]
+    ):
+        fs = fees(cf)
+        return fs
+    elif cf["TABLE"].lower() in ("witnesses", "witness") and cf["SUPPORT_SINGLETABLE"]:
+        out = witnesses(cf)
+        return out
+    elif (
+        cf["TABLE"].lower()
+        in (
+            "case-action-summary",
+            "cas",
+        )
+        and cf["SUPPORT_SINGLETABLE"]
+    ):
+        out = case_action_summary(cf)
+        return out
+    elif cf["TABLE"].lower() in ("settings", "set") and cf["SUPPORT_SINGLETABLE"]:
+        out = settings(cf)
+        return out
+    elif cf["TABLE"].lower() in ("images", "imgs", "img") and cf["SUPPORT_SINGLETABLE"]:
+        out = images(cf)
+        return out
+    elif cf["TABLE"] in ("attorneys", "att") and cf["SUPPORT_SINGLETABLE"]:
+        out = attorneys(cf)
+        return out
+    elif (
+        cf["TABLE"].lower() in ("all", "", "multi", "multitable")
+        and cf["SUPPORT_MULTITABLE"]
+    ):
+        mult = multi(cf)
+        return mult
+    else:
+        print("Job not specified. Select a mode and reconfigure to start.")
+        return None
+
+
+def archive(cf):
+    """
+    Write a full text archive from inputs using configuration `cf`.
+    """
+    if cf["APPEND"] and cf["EXISTING_OUTPUT"]:
+        if len(cf["QUEUE"]) == 0:
+            print("No new cases found to append.", cf=cf)
+            a = None
+        else:
+            a = read(cf)
+            print(f"Appending {a.shape[0]} new cases to archive...", cf=cf)
+            extend_archive(a, cf["OUTPUT_PATH"], cf=cf)
+    else:
+        a = read(cf)
+        write(a, cf=cf)
+    if cf["WINDOW"]:
+        cf["WINDOW"].write_event_value("COMPLETE-MA", True)
+    return a
+
+
+def set(
+    inputs,
+    outputs=None,
+    count=0,
+    table="",
+    archive=False,
+    log=False,
+    no_prompt=True,
+    debug=False,
+    overwrite=False,
+    no_write=False,
+    fetch=False,
+    cID="",
+    uID="",
+    pwd="",
+    qmax=0,
+    qskip=0,
+    pairs=None,
+    vrr_summary=False,
+    charges_summary=False,
+    convictions_summary=False,
+    append=False,
+    window=None,
+    force=False,
+    no_update=False,
+    workers=1,
+    no_cache=False,
+    cache_max_bytes=EXTRACT_CACHE_MAX_BYTES,
+    batch_size=0,
+    lazy=False,
+    profile=False,
+    fields=None,
+    partition_by=None,
+    compression=None,
+    compression_level=None,
+    row_group_size=None,
+    no_categorical=False,
+    sessions=1,
+    rate=0,
+    fetch_archive=None,
+    now=False,
+):
+    """
+    Check inputs and outputs and return a configuration object for Alacorder table parser functions to receive as parameter and complete task, or set `now = True` to run immediately.
+
+    Args:
+        inputs (Path | DataFrame): PDF directory, query, archive path, or DataFrame input
+        outputs (Path | DataFrame, optional): Path to archive, directory, or file output
+        count (int, optional): Max cases to pull from input
+        table (str, optional): Table (all, cases, fees, charges, settings, witnesses, attorneys, case_action_summaries, images)
+        archive (bool, optional): Write a full text archive from a directory of case detail PDFs
+        log (bool, optional): Print logs and progress to console
+        no_prompt (bool, optional): Skip user input / confirmation prompts
+        debug (bool, optional): Print verbose logs to console for developers
+        overwrite (bool, optional): Overwrite existing files at output path
+        no_write (bool, optional): Do not export to output path
+        fetch (bool, optional): Retrieve case detail PDFs from Alacourt.com
+        cID (str, optional): Customer ID on Alacourt.com
+        uID (str, optional): User ID on Alacourt.com
+        pwd (str, optional): Password on Alacourt.com
+        qmax (int, optional): Maximum queries to conduct on Alacourt.com
+        qskip (int, optional): Skip entries at top of query file
+        pairs (str, optional): Path to AIS / Unique ID pairs for grouped table functions
+        vrr_summary (bool, optional): Create voting rights summary from pairs
+        charges_summary (bool, optional): Create charges summary from pairs
+        convictions_summary (bool, optional): Create convictions summary from pairs
+        append (bool, optional): Append one archive to another
+        window (None, optional): PySimpleGUI window element
+        force (bool, optional): Do not raise exceptions
+        no_update (bool, optional): Do not mark input query when fetching cases
+        workers (int, optional): Number of processes to use for PDF text extraction
+        no_cache (bool, optional): Do not read or update PDF text extraction cache
+        cache_max_bytes (int, optional): Maximum bytes of text kept in PDF text extraction cache
+        batch_size (int, optional): Cases per batch for multitable export with bounded memory (0 for all at once)
+        lazy (bool, optional): Scan parquet and csv archive inputs lazily so table parsers only read the columns they use
+        profile (bool, optional): Record wall time, CPU time, rows and peak RSS growth of each stage to `cf['PROFILE']`
+        fields (List[str] | str, optional): Parse only these cases table columns (list or comma-separated, see `CASE_FIELDS`)
+        partition_by (List[str] | str, optional): Write parquet outputs as hive-partitioned datasets by "county", "year", or both
+        compression (str, optional): Parquet compression codec (default brotli for files, zstd for datasets)
+        compression_level (int, optional): Parquet compression level
+        row_group_size (int, optional): Rows per parquet row group
+        no_categorical (bool, optional): Export categorical columns (see `CATEGORICAL_COLUMNS`) as plain strings
+        sessions (int, optional): Number of browser sessions to fetch query rows concurrently
+        rate (float, optional): Maximum Alacourt.com page requests per second across all sessions (0 for no limit)
+        fetch_archive (str, optional): Path to archive to append fetched cases to as they download
+        now (bool, optional): Start Alacorder upon successful configuration
+    """
+    return cf(
+        inputs=inputs,
+        outputs=outputs,
+        count=count,
+        table=table,
+        archive=archive,
+        log=log,
+        no_prompt=no_prompt,
+        debug=debug,
+        overwrite=overwrite,
+        no_write=no_write,
+        fetch=fetch,
+        cID=cID,
+        uID=uID,
+        pwd=pwd,
+        qmax=qmax,
+        qskip=qskip,
+        pairs=pairs,
+        vrr_summary=vrr_summary,
+        charges_summary=charges_summary,
+        convictions_summary=convictions_summary,
+        append=append,
+        window=window,
+        force=force,
+        no_update=no_update,
+        workers=workers,
+        no_cache=no_cache,
+        cache_max_bytes=cache_max_bytes,
+        batch_size=batch_size,
+        lazy=lazy,
+        profile=profile,
+        fields=fields,
+        partition_by=partition_by,
+        compression=compression,
+        compression_level=compression_level,
+        row_group_size=row_group_size,
+        no_categorical=no_categorical,
+        sessions=sessions,
+        rate=rate,
+        fetch_archive=fetch_archive,
+        now=now,
+    )
+
+
+def cf(
+    inputs,
+    outputs=None,
+    count=0,
+    table="",
+    archive=False,
+    log=False,
+    no_prompt=True,
+    debug=False,
+    overwrite=False,
+    no_write=False,
+    fetch=False,
+    cID="",
+    uID="",
+    pwd="",
+    qmax=0,
+    qskip=0,
+    pairs=None,
+    vrr_summary=False,
+    charges_summary=False,
+    convictions_summary=False,
+    append=False,
+    window=None,
+    force=False,
+    no_update=False,
+    workers=1,
+    no_cache=False,
+    cache_max_bytes=EXTRACT_CACHE_MAX_BYTES,
+    batch_size=0,
+    lazy=False,
+    profile=False,
+    fields=None,
+    partition_by=None,
+    compression=None,
+    compression_level=None,
+    row_group_size=None,
+    no_categorical=False,
+    sessions=1,
+    rate=0,
+    fetch_archive=None,
+    now=False,
+):
+    """
+    Check inputs and outputs and return a configuration object for Alacorder table parser functions to receive as parameter and complete task, or set `now = True` to run immediately.
+
+    Args:
+        inputs (Path | DataFrame): PDF directory, query, archive path, or DataFrame input
+        outputs (Path | DataFrame, optional): Path to archive, directory, or file output
+        count (int, optional): Max cases to pull from input
+        table (str, optional): Table (all, cases, fees, charges, settings, witnesses, attorneys, case_action_summaries, images)
+        archive (bool, optional): Write a full text archive from a directory of case detail PDFs
+        log (bool, optional): Print logs and progress to console
+        no_prompt (bool, optional): Skip user input / confirmation prompts
+        debug (bool, optional): Print verbose logs to console for developers
+        overwrite (bool, optional): Overwrite existing files at output path
+        no_write (bool, optional): Do not export to output path
+        fetch (bool, optional): Retrieve case detail PDFs from Alacourt.com
+        cID (str, optional): Customer ID on Alacourt.com
+        uID (str, optional): User ID on Alacourt.com
+        pwd (str, optional): Password on Alacourt.com
+        qmax (int, optional): Maximum queries to conduct on Alacourt.com
+        qskip (int, optional): Skip entries at top of query file
+        pairs (str, optional): Path to AIS / Unique ID pairs for grouped table functions
+        vrr_summary (bool, optional): Create voting rights summary from pairs
+        charges_summary (bool, optional): Create charges summary from pairs
+        convictions_summary (bool, optional): Create convictions summary from pairs
+        append (bool, optional): Append one archive to another
+        window (None, optional): PySimpleGUI window element
+        force (bool, optional): Do not raise exceptions
+        no_update (bool, optional): Do not mark input query when fetching cases
+        workers (int, optional): Number of processes to use for PDF text extraction
+        no_cache (bool, optional): Do not read or update PDF text extraction cache
+        cache_max_bytes (int, optional): Maximum bytes of text kept in PDF text extraction cache
+        batch_size (int, optional): Cases per batch for multitable export with bounded memory (0 for all at once)
+        lazy (bool, optional): Scan parquet and csv archive inputs lazily so table parsers only read the columns they use
+        profile (bool, optional): Record wall time, CPU time, rows and peak RSS growth of each stage to `cf['PROFILE']`
+        fields (List[str] | str, optional): Parse only these cases table columns (list or comma-separated, see `CASE_FIELDS`)
+        partition_by (List[str] | str, optional): Write parquet outputs as hive-partitioned datasets by "county", "year", or both
+        compression (str, optional): Parquet compression codec (default brotli for files, zstd for datasets)
+        compression_level (int, optional): Parquet compression level
+        row_group_size (int, optional): Rows per parquet row group
+        no_categorical (bool, optional): Export categorical columns (see `CATEGORICAL_COLUMNS`) as plain strings
+        sessions (int, optional): Number of browser sessions to fetch query rows concurrently
+        rate (float, optional): Maximum Alacourt.com page requests per second across all sessions (0 for no limit)
+        fetch_archive (str, optional): Path to archive to append fetched cases to as they download
+        now (bool, optional): Start Alacorder upon successful configuration
+    """
+    good = True
+    outputs = None if no_write else outputs
+    no_write = True if outputs == None else no_write
+    found = 0
+    cache = None
+
+    if debug:
+        sys.tracebacklimit = 10
+        pl.Config.set_verbose(True)
+        pl.Config.set_tbl_rows(100)
+    else:
+        sys.tracebacklimit = 2
+        pl.Config.set_verbose(False)
+
+    # raise overwrite error
+    if no_write:
+        outputext = "none"
+        existing_output = False
+    elif is_dataset(outputs):
+        if not overwrite and not append:
+            error(
+                "Error: Existing archive at output path.\nRepeat in overwrite mode to continue.",
+                cf={"WINDOW": window, "FORCE": force},
+            )
+        outputext = ".parquet"
+        existing_output = True
+    elif os.path.isdir(outputs):
+        outputext = "directory"
+        existing_output = False
+    elif os.path.isfile(outputs):
+        if not overwrite and not append:
+            error(
+                "Error: Existing file at output path.\nRepeat in overwrite mode to continue.",
+                cf={"WINDOW": window, "FORCE": force},
+            )
+        outputext = os.path.splitext(outputs)[1]
+        existing_output = True
+    else:
+        outputext = os.path.splitext(str(outputs))[1]
+        existing_output = False
+
+    support_multitable = (
+        True if outputext in (".xls", ".xlsx", "none", "directory") else False
+    )
+    support_singletable = (
+        True
+        if outputext
+        in (".xls", ".xlsx", "none", ".json", ".parquet", ".csv", "directory")
+        else False
+    )
+    support_archive = (
+        True
+        if outputext in (".xls", ".xlsx", ".csv", ".parquet", ".zip", ".json", "none")
+        else False
+    )
+    if force not in (  # raise file extension not supported
+        ".xls",
+        ".xlsx",
+        ".csv",
+        ".parquet",
+        ".json",
+        ".csv",
+        "none",
+        "directory",
+    ) and outputext not in (
+        ".xls",
+        ".xlsx",
+        ".csv",
+        ".parquet",
+        ".json",
+        ".csv",
+        "none",
+        "directory",
+    ):
+        error(
+            "Error: File extension not supported.\nRepeat with .xls, .xlsx, .parquet, .csv, or .json.",
+            cf={"WINDOW": window, "FORCE": force},
+        )
+
+    if (  # raise no table selection
+        support_multitable == False
+        and archive == False
+        and fetch == False
+        and table
+        not in (
+            "cases",
+            "charges",
+            "fees",
+            "disposition",
+            "disposition-charges",
+            "filing",
+            "filing-charges",
+            "attorneys",
+            "settings",
+            "images",
+            "case-action-summary",
+            "witnesses",
+        )
+    ):
+        error(
+            "Single table export choice required! (cases, charges, fees, disposition, filing, settings, attorneys, images, case-action-summary, witnesses)",
+            cf={"WINDOW": window, "FORCE": force},
+        )
+
+    if isinstance(fields, str):  # i.e. "CaseNumber,Name,DOB" from --fields
+        fields = [f.strip() for f in fields.split(",") if f.strip()]
+    if fields:
+        unknown = [f for f in fields if f not in CASE_FIELDS]
+        if len(unknown) > 0:
+            error(
+                f"Unknown case fields: {', '.join(unknown)}. Choose from: {', '.join(CASE_FIELDS)}",
+                cf={"WINDOW": window, "FORCE": force},
+            )
+            fields = [f for f in fields if f in CASE_FIELDS]
+    else:
+        fields = None
+
+    if isinstance(partition_by, str):  # i.e. "county,year" from --partition-by
+        partition_by = [p.strip() for p in partition_by.split(",") if p.strip()]
+    if partition_by:
+        if any(p not in PARTITION_KEYS for p in partition_by):
+            error(
+                f"Partition keys must be {' or '.join(PARTITION_KEYS)}.",
+                cf={"WINDOW": window, "FORCE": force},
+            )
+        if outputext not in (".parquet", "directory"):
+            error(
+                "Partitioned output requires a .parquet or directory output path.",
+                cf={"WINDOW": window, "FORCE": force},
+            )
+        partition_by = [p for p in partition_by if p in PARTITION_KEYS]
+    else:
+        partition_by = None
+
+    # summaries load tables from the case database, so only count the archive
+    summary = pairs and (vrr_summary or charges_summary or convictions_summary)
+    scan = batch_size > 0 or lazy or bool(summary)
+
+    archived = None
+    if archive and append and existing_output and not no_write:  # raise append failure
+        try:
+            archived = read_paths(outputs)
+        except:
+            error(
+                "Append failed! Archive at output path could not be read.",
+                cf={"WINDOW": window, "FORCE": force},
+            )
+
+    if isinstance(inputs, pl.dataframe.frame.DataFrame):  # DataFrame inputs
+        if not force and not "AllPagesText" in inputs.columns:
+            error(
+                "Alacorder could not read archive. Try again with another file.",
+                cf={"WINDOW": window, "FORCE": force},
+            )
+        elif not force and not "ALABAMA" in inputs["AllPagesText"][0]:
+            error(
+                "Alacorder could not read archive. Try again with another file.",
+                cf={"WINDOW": window, "FORCE": force},
+            )
+        queue = inputs
+        found = queue.shape[0]
+        is_full_text = True
+        itype = "object"
+    elif isinstance(inputs, pl.series.series.Series):  # series input
+        if not force and not "AllPagesText" in pl.DataFrame(inputs).columns:
+            error(
+                "Alacorder could not read archive. Try again with another file.",
+                cf={"WINDOW": window, "FORCE": force},
+            )
+        elif not force and not "ALABAMA" in inputs[0]:
+            error(
+                "Alacorder could not read archive. Try again with another file.",
+                cf={"WINDOW": window, "FORCE": force},
+            )
+        queue = inputs
+        found = queue.shape[0]
+        is_full_text = True
+        itype = "object"
+    elif is_dataset(inputs):  # parquet dataset directory inputs
+        if scan:  # count now, read when parsing
+            queue = scan_archive(inputs)
+            found = queue.select(pl.count()).collect()[0, 0]
+        else:
+            queue = read(inputs)
+            found = queue.shape[0]
+        is_full_text = True
+        itype = "archive"
+    elif os.path.isdir(inputs):  # directory inputs
+        queue = glob.glob(inputs + "**/*.pdf", recursive=True)
+        queue = [os.path.abspath(pp) for pp in queue]  # so appends match from any cwd
+        if archived != None:  # only extract cases not already in archive
+            done = archived_queue(archived, queue)
+            queue = [pp for pp in queue if pp not in done]
+        found = len(queue)
+        if not force and not found > 0 and archived == None:
+            error("No cases found in archive.", cf={"WINDOW": window, "FORCE": force})
+        is_full_text = False
+        itype = "directory"
+        if no_cache:
+            cache = None
+        elif outputext == "directory":
+            cache = os.path.join(outputs, EXTRACT_CACHE_NAME)
+        elif not no_write:
+            cache = os.path.join(
+                os.path.dirname(os.path.abspath(outputs)), EXTRACT_CACHE_NAME
+            )
+        else:  # keep the cache out of shared input directories
+            cache = user_cache_path()
+    elif os.path.isfile(inputs):  # file inputs
+        if scan and os.path.splitext(inputs)[1] in (
+            ".parquet",
+            ".csv",
+        ):
+            queue = scan_archive(inputs)
+            found = queue.select(pl.count()).collect()[0, 0]
+        else:
+            queue = read(inputs)
+            found = queue.shape[0]
+        is_full_text = True
+        itype = (
+            "query" if os.path.splitext(inputs)[1] in (".xls", ".xlsx") else "archive"
+        )
+    else:
+        error("Failed to determine input type.", cf={"WINDOW": window, "FORCE": force})
+
+    if count == 0:
+        count = found
+    if count > found:
+        count = found
+    if found > count:
+        if isinstance(queue, pl.lazyframe.frame.LazyFrame):
+            queue = queue.head(count)
+        else:
+            queue = queue[0:count]
+
+    out = {
+        "QUEUE": queue,
+        "INPUTS": inputs,
+        "NEEDTEXT": bool(not is_full_text),
+        "INPUT_TYPE": itype,
+        "FOUND": found,
+        "COUNT": count,
+        "OUTPUT_PATH": outputs,
+        "OUTPUT_EXT": outputext,
+        "SUPPORT_MULTITABLE": support_multitable,
+        "SUPPORT_SINGLETABLE": support_singletable,
+        "SUPPORT_ARCHIVE": support_archive,
+        "TABLE": table,
+        "ARCHIVE": archive,
+        "PAIRS": pairs,
+        "VRR_SUMMARY": vrr_summary,
+        "CHARGES_SUMMARY": charges_summary,
+        "CONVICTIONS_SUMMARY": convictions_summary,
+        "APPEND": append,
+        "NO_UPDATE": no_update,
+        "FETCH": fetch,
+        "ALA_CUSTOMER_ID": cID,
+        "ALA_USER_ID": uID,
+        "ALA_PASSWORD": pwd,
+        "FETCH_SKIP": qskip,
+        "FETCH_MAX": qmax,
+        "FETCH_SESSIONS": sessions,
+        "FETCH_RATE": rate,
+        "FETCH_ARCHIVE": fetch_archive,
+        "LOG": log,
+        "NO_WRITE": no_write,
+        "NO_PROMPT": no_prompt,
+        "OVERWRITE": overwrite,
+        "EXISTING_OUTPUT": existing_output,
+        "DEBUG": debug,
+        "WINDOW": window,
+        "FORCE": force,
+        "WORKERS": workers,
+        "CACHE": cache,
+        "CACHE_MAX_BYTES": cache_max_bytes,
+        "BATCH_SIZE": batch_size,
+        "LAZY": lazy and not archive,
+        "PROFILE": [] if profile else None,
+        "FIELDS": fields,
+        "PARTITION_BY": partition_by,
+        "COMPRESSION": compression,
+        "COMPRESSION_LEVEL": compression_level,
+        "ROW_GROUP_SIZE": row_group_size,
+        "CATEGORICAL": not no_categorical,
+    }
+    dlog(out, cf=debug)
+    if now:
+        return init(out)
+    return out
+
+
+def read(cf, county=None, year=None):
+    """
+    Read `cf` input PDF directory or case text archive into memory. Hive-partitioned parquet dataset archives are pruned to `county` and `year` partitions if given (see `archive_parts()`).
+    """
+    if isinstance(cf, pl.dataframe.frame.DataFrame):  # df input
+        df = cf
+        if "AllPagesTextNoNewLine" not in df.columns and "AllPagesText" in df.columns:
+            df = df.with_columns(
+                pl.col("AllPagesText")
+                .str.replace_all(r"\n", " ")
+                .alias("AllPagesTextNoNewLine")
+            )
+        return case_keys(df)
+    elif isinstance(cf, pl.lazyframe.frame.LazyFrame):  # scanned archive input
+        if "AllPagesTextNoNewLine" not in cf.columns and "AllPagesText" in cf.columns:
+            cf = cf.with_columns(
+                pl.col("AllPagesText")
+                .str.replace_all(r"\n", " ")
+                .alias("AllPagesTextNoNewLine")
+            )
+        return case_keys(cf)
+    elif isinstance(cf, list):  # [paths] input
+        queue = [os.path.abspath(pp) for pp in cf]
+        aptxt = extract_texts(queue)
+        archive = pl.DataFrame(
+            {"Timestamp": time.time(), "AllPagesText": aptxt, "Path": queue}
+        )
+        archive = archive.with_columns(
+            pl.col("AllPagesText")
+            .str.replace_all(r"\n", " ")
+            .alias("AllPagesTextNoNewLine")
+        )
+        return case_keys(archive)
+    elif isinstance(cf, dict):  # cf input
+        with profile_stage("read", cf, rows_in=cf["COUNT"]) as stage:
+            if isinstance(cf["QUEUE"], pl.lazyframe.frame.LazyFrame):
+                queue = cf["QUEUE"] if cf["LAZY"] else cf["QUEUE"].collect()
+                archive = read(queue)
+            elif cf["NEEDTEXT"] == False or "ALABAMA" in cf["QUEUE"][0]:
+                archive = cf["QUEUE"]
+            else:
+                queue = cf["QUEUE"]
+                print("Extracting text...", cf=cf)
+                aptxt = extract_texts(
+                    queue,
+                    workers=cf["WORKERS"],
+                    cache=cf["CACHE"],
+                    cf=cf,
+                    max_bytes=cf["CACHE_MAX_BYTES"],
+                )
+                archive = pl.DataFrame(
+                    {"Timestamp": time.time(), "AllPagesText": aptxt, "Path": queue}
+                )
+                archive = archive.with_columns(
+                    pl.col("AllPagesText")
+                    .str.replace_all(r"\n", " ")
+                    .alias("AllPagesTextNoNewLine")
+                )
+                archive = case_keys(archive)
+            stage["RowsOut"] = height(archive)
+        return archive
+    elif is_dataset(cf):  # parquet dataset directory input
+        parts = archive_parts(cf, county=county, year=year)
+        if len(parts) > 0:
+            with pl.StringCache():  # categorical table parts written by separate runs
+                archive = pl.concat(
+                    [case_keys(pl.read_parquet(pp)) for pp in parts],
+                    how="diagonal",
+                )
+        else:  # no parts, or every part pruned
+            archive = case_keys(empty_archive(cf))
+        if partition_filter(county, year) is not None:
+            archive = archive.filter(partition_filter(county, year))
+        if "AllPagesText" in archive.columns:
+            archive = archive.with_columns(
+                pl.col("AllPagesText")
+                .str.replace_all(r"\n", " ")
+                .alias("AllPagesTextNoNewLine")
+            )
+        return case_keys(archive)
+    elif os.path.isdir(cf):  # directory path input
+        queue = glob.glob(cf + "**/*.pdf", recursive=True)
+        queue = [os.path.abspath(pp) for pp in queue]
+        aptxt = extract_texts(queue)
+        archive = pl.DataFrame(
+            {"Timestamp": time.time(), "AllPagesText": aptxt, "Path": queue}
+        )
+        archive = archive.with_columns(
+            pl.col("AllPagesText")
+            .str.replace_all(r"\n", " ")
+            .alias("AllPagesTextNoNewLine")
+        )
+        return case_keys(archive)
+    elif os.path.isfile(cf):  # file path input
+        ext = os.path.splitext(cf)[1]
+        if ext in (".xls", ".xlsx"):
+            archive = pl.read_excel(
+                cf,
+                xlsx2csv_options={"ignore_errors": True},
+                read_csv_options={"ignore_errors": True},
+            )
+            return case_keys(archive)
+        elif ext == ".json":
+            archive = pl.read_json(cf)
+            if "AllPagesText" in archive.columns:
+                archive = archive.with_columns(
+                    pl.col("AllPagesText")
+                    .str.replace_all(r"\n", " ")
+                    .alias("AllPagesTextNoNewLine")
+                )
+            return case_keys(archive)
+        elif ext == ".csv":
+            archive = pl.read_csv(cf, ignore_errors=True)
+            if "AllPagesText" in archive.columns:
+                archive = archive.with_columns(
+                    pl.col("AllPagesText")
+                    .str.replace_all(r"\n", " ")
+                    .alias("AllPagesTextNoNewLine")
+                )
+            return case_keys(archive)
+        elif ext == ".parquet":
+            archive = pl.read_parquet(cf)
+            if "AllPagesText" in archive.columns:
+                archive = archive.with_columns(
+                    pl.col("AllPagesText")
+                    .str.replace_all(r"\n", " ")
+                    .alias("AllPagesTextNoNewLine")
+                )
+            return case_keys(archive)
+    else:
+        return None
+
+
+def write(outputs, sheet_names=[], cf=None, path=None, overwrite=False):
+    """Write `outputs` to output path at `cf['OUTPUT_PATH']` or `path`.
+
+    Args:
+        outputs ([DataFrame]): DataFrame(s) to write to output
+        sheet_names (List[str], optional): Output Excel worksheet names
+
+        cf (dict): Configuration object
+
+        or:
+            path (str): Output path
+            overwrite (bool): Allow overwrite
+    """
+    if cf == None:
+        cf = {
+            "OUTPUT_PATH": path,
+            "OUTPUT_EXT": os.path.splitext(path)[1],
+            "NO_WRITE": False,
+            "OVERWRITE": True,
+            "FORCE": False,
+        }
+    else:  # cf trumps params if both given
+        path = cf["OUTPUT_PATH"]
+        overwrite = cf["OVERWRITE"]
+    if isinstance(outputs, list):
+        if len(outputs) != len(sheet_names) and len(outputs) != 1:
+            error(
+                "alac.write() missing sheet_names parameter. See documentation for details.",
+                cf=cf,
+            )
+    if isinstance(outputs, pl.dataframe.frame.DataFrame):  # df input
+        if "AllPagesTextNoNewLine" in outputs.columns:
+            outputs = outputs.select(pl.exclude("AllPagesTextNoNewLine"))
+    if cf["NO_WRITE"] == True:
+        return outputs
+    if not cf.get("CATEGORICAL", True):
+        outputs = plain_strings(outputs)
+    with profile_stage("write", cf, rows_in=height(outputs)):
+        existing = os.path.isfile(cf["OUTPUT_PATH"]) or (
+            cf["OUTPUT_EXT"] == ".parquet" and os.path.isdir(cf["OUTPUT_PATH"])
+        )  # a directory output is only replaced table by table, checked below
+        if not cf["OVERWRITE"] and existing:
+            error(
+                "Could not write to output path because overwrite mode is not enabled.",
+                cf=cf,
+            )
+        elif cf["OUTPUT_EXT"] in (".xlsx", ".xls"):
+            if not isinstance(outputs, list):
+                outputs = [outputs]
+            if len(sheet_names) > 0:
+                write_excel(cf["OUTPUT_PATH"], dict(zip(sheet_names, outputs)))
+            else:
+                write_excel(cf["OUTPUT_PATH"], {"Sheet1": outputs[0]})
+        elif cf["OUTPUT_EXT"] == "directory":  # one parquet file per table
+            if not isinstance(outputs, list):
+                outputs = [outputs]
+            if len(sheet_names) == 0:
+                sheet_names = [cf.get("TABLE") or "archive"]
+            for name, x in zip(sheet_names, outputs):
+                out = os.path.join(cf["OUTPUT_PATH"], f"{name}.parquet")
+                if not cf["OVERWRITE"] and os.path.exists(out):
+                    error(
+                        "Could not write to output path because overwrite mode is not enabled.",
+                        cf=cf,
+                    )
+                    continue  # error() only raises without FORCE or WINDOW
+                if cf.get("PARTITION_BY"):
+                    shutil.rmtree(out, ignore_errors=True)
+                    write_dataset(x, out, partition_by=cf["PARTITION_BY"], cf=cf)
+                else:
+                    x.write_parquet(out, **parquet_options(cf))
+        elif cf["OUTPUT_EXT"] == ".parquet" and cf.get("PARTITION_BY"):
+            if os.path.isdir(cf["OUTPUT_PATH"]):
+                shutil.rmtree(cf["OUTPUT_PATH"])
+            elif os.path.isfile(cf["OUTPUT_PATH"]):
+                os.remove(cf["OUTPUT_PATH"])
+            write_dataset(
+                outputs, cf["OUTPUT_PATH"], partition_by=cf["PARTITION_BY"], cf=cf
+            )
+        elif cf["OUTPUT_EXT"] == ".parquet":
+            outputs.write_parquet(cf["OUTPUT_PATH"], **parquet_options(cf))
+        elif cf["OUTPUT_EXT"] == ".json":
+            outputs.write_json(cf["OUTPUT_PATH"])
+        elif cf["OUTPUT_EXT"] in (".csv", ".txt"):
+            outputs.write_csv(cf["OUTPUT_PATH"])
+        elif cf["OUTPUT_EXT"] not in ("none", "", "directory", None):
+            outputs.write_csv(cf["OUTPUT_PATH"])
+        else:
+            pass
+    return outputs
+
+
+def write_excel(path, sheets, batch_size=10000, sample=1000):
+    """
+    Write `sheets` to Excel workbook at `path` in xlsxwriter `constant_memory` mode, streaming rows to disk in batches instead of holding the workbook in memory until it closes. Column widths are fitted to the header and first `sample` rows of each sheet rather than every cell. Sheets longer than Excel's row limit continue on `<sheet>-2`, `<sheet>-3`, etc.
+
+    Args:
+        path (str): Path to .xlsx output
+        sheets (dict): Worksheet names mapped to DataFrames or iterables of DataFrames (i.e. `scan_batches()`)
+        batch_size (int, optional): Rows converted from each DataFrame at a time
+        sample (int, optional): Rows per sheet used to fit column widths
+    """
+    import xlsxwriter
+
+    with xlsxwriter.Workbook(
+        path,
+        {
+            "constant_memory": True,
+            "strings_to_formulas": False,
+            "strings_to_urls": False,
+            "nan_inf_to_errors": True,
+        },
+    ) as workbook:
+        formats = {
+            "header": workbook.add_format({"bold": True}),
+            "float": workbook.add_format({"num_format": "0.00"}),
+        }
+        for name, batches in sheets.items():
+            if isinstance(batches, pl.dataframe.frame.DataFrame):
+                batches = [batches]
+            first, part, row = None, 0, EXCEL_MAX_ROWS
+            for df in batches:
+                first = df if first is None else first
+                for i in range(0, df.shape[0], batch_size):
+                    for values in df.slice(i, batch_size).rows():
+                        if row == EXCEL_MAX_ROWS:  # roll over to next sheet
+                            part += 1
+                            sheet = excel_sheet(
+                                workbook, name, part, df, sample, formats
+                            )
+                            row = 1
+                        sheet.write_row(row, 0, values)
+                        row += 1
+            if part == 0:  # header only
+                excel_sheet(workbook, name, 1, first, sample, formats)
+
+
+def excel_sheet(workbook, name, part, df, sample, formats):
+    """
+    Return new worksheet `name` (or `name-part` after the first) in `workbook` with header row and column widths fitted to `df`.
+    """
+    if part > 1:
+        suffix = f"-{part}"
+        name = name[: 31 - len(suffix)] + suffix
+    sheet = workbook.add_worksheet(name[:31])
+    if df is None:
+        return sheet
+    head = df.head(sample)
+    for col, (column, dtype) in enumerate(zip(df.columns, df.dtypes)):
+        longest = head.select(pl.col(column).cast(pl.Utf8).str.n_chars().max())[0, 0]
+        width = min(max(len(column), longest or 0), 50) + 2
+        fmt = formats["float"] if dtype in (pl.Float32, pl.Float64) else None
+        sheet.set_column(col, col, width, fmt)
+    sheet.write_row(0, 0, df.columns, formats["header"])
+    sheet.freeze_panes(1, 0)
+    return sheet
+
+
+def is_dataset(path):
+    """
+    Return True if `path` is a directory archive of parquet files (i.e. `archive.parquet/part-00000.parquet`).
+    """
+    return (
+        isinstance(path, str)
+        and os.path.isdir(path)
+        and os.path.splitext(os.path.normpath(path))[1] == ".parquet"
+    )
+
+
+def archive_parts(path, county=None, year=None):
+    """
+    Return sorted paths to parquet files in directory archive at `path`. In hive-partitioned archives (i.e. `archive.parquet/county=01/year=2020/part-00000.parquet`), parts outside the given `county` and `year` partitions are pruned.
+
+    Args:
+        path (str): Path to directory archive
+        county (str | List[str], optional): County code(s) to keep (i.e. "01")
+        year (str | int | List, optional): Case year(s) to keep
+    """
+    parts = glob.glob(os.path.join(path, "**", "*.parquet"), recursive=True)
+    parts = sorted(pp for pp in parts if not os.path.basename(pp)[0] in ("_", "."))
+    for key, want in (("county", county), ("year", year)):
+        if want == None:
+            continue
+        want = [str(w) for w in (want if isinstance(want, (list, tuple)) else [want])]
+        kept = []
+        for pp in parts:
+            dirs = os.path.relpath(os.path.dirname(pp), path).split(os.sep)
+            values = [d.split("=", 1)[1] for d in dirs if d.startswith(f"{key}=")]
+            if len(values) == 0 or values[0] in want:  # unpartitioned parts are kept
+                kept.append(pp)
+        parts = kept
+    return parts
+
+
+def empty_archive(path):
+    """
+    Return empty DataFrame with the schema of directory archive at `path`, read from the footer of its first part, or the schema of a new archive if it has no parts.
+    """
+    parts = archive_parts(path)
+    if len(parts) > 0:
+        return pl.read_parquet(parts[0], n_rows=0)
+    return pl.DataFrame(
+        schema={"Timestamp": pl.Float64, "AllPagesText": pl.Utf8, "Path": pl.Utf8}
+    )
+
+
+def partition_filter(county=None, year=None):
+    """
+    Return expression selecting cases in `county` and `year` (values or lists) by `CaseNumber`, or None if neither is given.
+    """
+    exprs = []
+    for key, want in (("county", county), ("year", year)):
+        if want != None:
+            want = want if isinstance(want, (list, tuple)) else [want]
+            want = [str(w) for w in want]
+            exprs.append(PARTITION_KEYS[key].is_in(want))
+    if len(exprs) == 0:
+        return None
+    return exprs[0] if len(exprs) == 1 else exprs[0] & exprs[1]
+
+
+def parquet_options(cf=None, dataset=False):
+    """
+    Return `write_parquet()` keyword arguments for the compression codec, level and row group size in configuration object `cf`. Single files default to brotli, dataset parts to zstd.
+    """
+    cf = cf if isinstance(cf, dict) else {}
+    return {
+        "compression": cf.get("COMPRESSION") or ("zstd" if dataset else "brotli"),
+        "compression_level": cf.get("COMPRESSION_LEVEL"),
+        "row_group_size": cf.get("ROW_GROUP_SIZE"),
+    }
+
+
+def write_dataset(df, path, partition_by=("county",), cf=None, metadata=True):
+    """
+    Write `df` as a hive-partitioned parquet dataset at directory `path`, partitioned by county code and/or case year from `CaseNumber` (i.e. `path/county=01/year=2020/part-00000.parquet`). New parts are added beside any already in a partition, so repeated calls append. Writes a `_metadata` summary of every part if `metadata` and pyarrow is installed.
+
+    Args:
+        df (pl.DataFrame): Archive or table with `CaseNumber` column
+        path (str): Path to dataset directory
+        partition_by (List[str], optional): "county", "year", or both
+        cf (dict, optional): Configuration object for compression settings
+        metadata (bool, optional): Write `_metadata` summary file
+    """
+    if "AllPagesTextNoNewLine" in df.columns:
+        df = df.select(pl.exclude("AllPagesTextNoNewLine"))
+    keys = [f"__{key}" for key in partition_by]
+    df = df.with_columns(
+        [
+            PARTITION_KEYS[key].fill_null("__HIVE_DEFAULT_PARTITION__").alias(col)
+            for key, col in zip(partition_by, keys)
+        ]
+    )
+    os.makedirs(path, exist_ok=True)
+    groups = df.partition_by(keys, maintain_order=True) if df.shape[0] > 0 else [df]
+    for group in groups:
+        if group.shape[0] > 0:
+            values = [group[0, col] for col in keys]
+        else:
+            values = ["__HIVE_DEFAULT_PARTITION__"] * len(keys)
+        partition = os.path.join(
+            path, *[f"{key}={value}" for key, value in zip(partition_by, values)]
+        )
+        os.makedirs(partition, exist_ok=True)
+        n = len(os.listdir(partition))
+        while os.path.exists(os.path.join(partition, f"part-{n:05d}.parquet")):
+            n += 1
+        write_part(
+            group.select(pl.exclude(keys)),
+            os.path.join(partition, f"part-{n:05d}.parquet"),
+            cf=cf,
+        )
+    if metadata:
+        write_dataset_metadata(path, cf=cf)
+    return df.select(pl.exclude(keys))
+
+
+def write_part(df, path, cf=None):
+    """
+    Write `df` to parquet dataset part file at `path` under a temporary name, then move it into place, so readers of a live dataset never open a partly written part.
+    """
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        df.write_parquet(tmp, **parquet_options(cf, dataset=True))
+        os.replace(tmp, path)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return path
+
+
+def write_dataset_metadata(path, cf=None):
+    """
+    Write `_metadata` summary file listing the schema and row groups of every part in parquet dataset at `path`, so readers can plan without opening each part. Skipped if pyarrow is not installed.
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        dlog("pyarrow not installed, skipping dataset _metadata", cf=cf)
+        return None
+    out = os.path.join(path, "_metadata")
+    parts = archive_parts(path)
+    if len(parts) == 0:
+        return None
+    collector = []
+    for pp in parts:
+        md = pq.read_metadata(pp)
+        md.set_file_path(os.path.relpath(pp, path).replace(os.sep, "/"))
+        collector.append(md)
+    try:
+        pq.write_metadata(pq.read_schema(parts[0]), out, metadata_collector=collector)
+    except (RuntimeError, ValueError) as e:  # parts with differing schemas
+        dlog(f"Could not write dataset _metadata: {e}", cf=cf)
+        if os.path.exists(out):
+            os.remove(out)
+        return None
+    return out
+
+
+def scan_archive(path, county=None, year=None):
+    """
+    Return LazyFrame over parquet, parquet dataset, or csv archive at `path` without reading it into memory. Partitioned datasets are pruned to `county` and `year` if given.
+    """
+    if is_dataset(path):
+        parts = archive_parts(path, county=county, year=year)
+        if len(parts) > 0:
+            archive = pl.concat(
+                [case_keys(pl.scan_parquet(pp)) for pp in parts],
+                how="diagonal",
+            )
+        else:  # no parts, or every part pruned
+            archive = case_keys(empty_archive(path).lazy())
+    elif os.path.splitext(path)[1] == ".csv":
+        archive = case_keys(pl.scan_csv(path, ignore_errors=True))
+    else:
+        archive = case_keys(pl.scan_parquet(path))
+    where = partition_filter(county, year)
+    return archive if where is None else archive.filter(where)
+
+
+def scan_batches(path, size):
+    """
+    Yield parquet, parquet dataset, or csv archive at `path` in DataFrames of at most `size` rows.
+    """
+    if is_dataset(path):
+        for pp in archive_parts(path):
+            yield from scan_batches(pp, size)
+    elif os.path.splitext(path)[1] == ".csv":
+        reader = pl.read_csv_batched(path, batch_size=size, ignore_errors=True)
+        batches = reader.next_batches(1)
+        while batches:
+            for i in range(0, batches[0].shape[0], size):
+                yield batches[0].slice(i, size)
+            batches = reader.next_batches(1)
+    else:
+        try:  # pyarrow reads row groups in order, polars slices rescan from the top
+            import pyarrow.parquet as pq
+        except ImportError:
+            found = pl.scan_parquet(path).select(pl.count()).collect()[0, 0]
+            for i in range(0, found, size):
+                yield pl.scan_parquet(path).slice(i, size).collect()
+        else:
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=size):
+                yield pl.from_arrow(batch)
+
+
+def read_batches(cf):
+    """
+    Yield `cf` input in archive DataFrames of at most `cf['BATCH_SIZE']` cases, extracting or reading one batch at a time.
+    """
+    size = cf["BATCH_SIZE"]
+    queue = cf["QUEUE"]
+    if cf["NEEDTEXT"]:
+        for i in range(0, len(queue), size):
+            paths = queue[i : i + size]
+            aptxt = extract_texts(
+                paths,
+                workers=cf["WORKERS"],
+                cache=cf["CACHE"],
+                max_bytes=cf["CACHE_MAX_BYTES"],
+            )
+            yield read(
+                pl.DataFrame(
+                    {"Timestamp": time.time(), "AllPagesText": aptxt, "Path": paths}
+                )
+            )
+    elif isinstance(queue, pl.lazyframe.frame.LazyFrame):
+        remaining = cf["COUNT"]
+        for batch in scan_batches(cf["INPUTS"], size):
+            if remaining <= 0:
+                break
+            yield read(batch.head(remaining))
+            remaining -= batch.shape[0]
+    else:
+        for i in range(0, queue.shape[0], size):
+            yield read(queue.slice(i, size))
+
+
+def read_paths(path):
+    """
+    Return `Path` column of archive at `path` without reading case text.
+    """
+    ext = os.path.splitext(os.path.normpath(path))[1]
+    if is_dataset(path):
+        parts = [pl.scan_parquet(pp).select("Path") for pp in archive_parts(path)]
+        paths = pl.concat(parts).collect() if len(parts) > 0 else pl.DataFrame()
+    elif ext == ".parquet":
+        paths = pl.read_parquet(path, columns=["Path"])
+    elif ext == ".csv":
+        paths = pl.read_csv(path, columns=["Path"], ignore_errors=True)
+    else:
+        paths = read(path).select("Path")
+    return paths["Path"].to_list() if "Path" in paths.columns else []
+
+
+def stored_key(pp):
+    """
+    Return archive `Path` value `pp` normalized for matching to PDF paths: absolute paths as is, relative paths as their components below the last `..`, or None if there are none.
+    """
+    if not pp:
+        return None
+    if os.path.isabs(pp):
+        return os.path.normpath(pp)
+    parts = os.path.normpath(pp).split(os.sep)
+    while ".." in parts:  # keep the components below the last ..
+        parts = parts[parts.index("..") + 1 :]
+    return os.sep.join(parts) if len(parts) > 0 else None
+
+
+def archived_queue(stored, queue):
+    """
+    Return dict of absolute paths in `queue` already in an archive whose `Path` column is `stored`. Archives written before paths were stored absolute hold paths as given to `-in`, which are matched by their trailing components (i.e. `pdfs/sub/a.pdf` matches `/data/pdfs/sub/a.pdf`), so appending from another directory or with an absolute `-in` does not archive every PDF again.
+    """
+    absolute = {}
+    relative = {}
+    for pp in stored:
+        key = stored_key(pp)
+        if key != None:
+            (absolute if os.path.isabs(key) else relative)[key] = True
+    done = {}
+    for pp in queue:
+        if pp in absolute:
+            done[pp] = True
+            continue
+        parts = pp.split(os.sep)
+        for i in range(1, len(parts)):
+            if os.sep.join(parts[i:]) in relative:
+                done[pp] = True
+                break
+    return done
+
+
+def extend_archive(df, path, cf=None):
+    """
+    Append the cases in `df` to the archive at `path` without rewriting existing case text where the format allows it. Parquet archives become directory archives with one part file per append, with a warning when a single file archive is converted. CSV archives are appended in place.
+
+    Args:
+        df (DataFrame): New cases to add
+        path (str): Existing archive path
+        cf (dict, optional): Configuration object
+
+    Returns:
+        DataFrame: `df` as written
+    """
+    if "AllPagesTextNoNewLine" in df.columns:
+        df = df.select(pl.exclude("AllPagesTextNoNewLine"))
+    ext = os.path.splitext(os.path.normpath(path))[1]
+    if ext == ".parquet":
+        if os.path.isfile(path):  # move single file into directory archive
+            print(
+                f"Warning: Converting {path} to a directory archive of part files to append to it. Read it with alac.read() or pl.scan_parquet(\"{path}/*.parquet\")."
+            )
+            tmp = f"{path}.{os.getpid()}.tmp"  # built aside, then renamed into place
+            os.makedirs(tmp)
+            try:
+                os.link(path, os.path.join(tmp, "part-00000.parquet"))
+            except OSError:  # i.e. filesystems without hard links
+                shutil.copy2(path, os.path.join(tmp, "part-00000.parquet"))
+            os.remove(path)
+            os.rename(tmp, path)
+        if isinstance(cf, dict) and cf.get("PARTITION_BY"):
+            return write_dataset(df, path, partition_by=cf["PARTITION_BY"], cf=cf)
+        n = len(archive_parts(path))
+        while os.path.exists(os.path.join(path, f"part-{n:05d}.parquet")):
+            n += 1
+        write_part(df, os.path.join(path, f"part-{n:05d}.parquet"), cf=cf)
+    elif ext == ".csv":
+        cols = pl.read_csv(path, n_rows=1, ignore_errors=True).columns
+        df = df.select(
+            [
+                pl.col(c) if c in df.columns else pl.lit(None).alias(c)
+                for c in cols
+            ]
+        )
+        with open(path, "ab") as f:
+            df.write_csv(f, has_header=False)
+    else:
+        print(f"Appending to {ext} archives requires rewriting the file.", cf=cf)
+        old = read(path)
+        old = old.select(pl.exclude("AllPagesTextNoNewLine"))
+        write(pl.concat([old, df], how="diagonal"), path=path, overwrite=True)
+    return df
+
+
+def extend_or_write(df, path, cf=None):
+    """
+    Append the rows in `df` to the archive or parquet dataset at `path` (see `extend_archive()`), or write them there if `path` does not exist yet. New `.parquet` paths are created as directories with one part file per append. New archives are written under a temporary name and renamed into place, so readers never see a partial archive.
+    """
+    root, ext = os.path.splitext(os.path.normpath(path))
+    if os.path.exists(path):
+        return extend_archive(df, path, cf=cf)
+    if "AllPagesTextNoNewLine" in df.columns:
+        df = df.select(pl.exclude("AllPagesTextNoNewLine"))
+    tmp = f"{root}.{os.getpid()}.tmp{ext}"  # built aside, then renamed into place
+    if ext == ".parquet":
+        os.makedirs(tmp)
+        if isinstance(cf, dict) and cf.get("PARTITION_BY"):
+            df = write_dataset(df, tmp, partition_by=cf["PARTITION_BY"], cf=cf)
+        else:
+            write_part(df, os.path.join(tmp, "part-00000.parquet"), cf=cf)
+    else:
+        write(df, path=tmp, overwrite=True)
+    os.rename(tmp, path)
+    return df
+
+
+def append_archive(inpath="", outpath="", cf=None):
+    """
+    Append the contents of one archive to another.
+
+    Args:
+        inpath (str): Input archive
+        outpath (str): Output archive
+        cf (dict): Configuration object
+
+    Returns:
+        DataFrame: Appended archive object
+    """
+    if cf and inpath == "":
+        inpath = cf["INPUTS"]
+
+    if cf and outpath == "":
+        outpath = cf["OUTPUT_PATH"]
+
+    if not os.path.isfile(inpath) and not os.path.isfile(outpath):
+        error("Error: Invalid path.", cf=cf)
+
+    inarc = read(inpath)
+    outarc = read(outpath)
+
+    try:
+        inarc = inarc.select("AllPagesText", "Path", "Timestamp")
+        outarc = outarc.select("AllPagesText", "Path", "Timestamp")
+    except:
+        try:
+            dlog(inarc, outarc, cf=conf)
+            print("Warning: Could not find column Timestamp in archive.")
+            inarc = inarc.select("AllPagesText", "Path")
+            outarc = outarc.select("AllPagesText", "Path")
+        except:
+            dlog(inarc, outarc, cf=conf)
+            print("Warning: Could not find column Path in archive.")
+            inarc = inarc.select("AllPagesText")
+            outarc = outarc.select("AllPagesText")
+
+    out = pl.concat([inarc, outarc])
+
+    if window:
+        window.write_event_value("COMPLETE-AA", True)
+    write(out, path=outpath, overwrite=True)
+    return out
+
+
+def make_pairs_template(df, debug=False, cf=None):
+    if isinstance(df, str):
+        df = load_tables(df, cf=cf)["cases"]
+    if not "AllPagesText" in df.columns:  # cases table
+        names = df.select("Name", "CaseNumber", "DOB", "Alias")
+    else:
+        names = case_keys(df).with_columns(
+            [
+                pl.col("AllPagesText")
+                .str.extract(r"(\d{2}/\d{2}/\d{4})(?:.{0,5}DOB:)", group_index=1)
+                .str.replace_all(r"[^\d/]", "")
+                .str.strip()
+                .alias("DOB"),
+                pl.col("AllPagesText")
+                .str.extract(r"(SSN)(.+)(Alias)", group_index=2)
+                .str.replace(r"(SSN)", "")
+                .str.replace(r"Alias", "")
+                .str.replace(r"\:", "")
+                .str.strip()
+                .alias("Alias"),
+            ]
+        )
+    names = (
+        names.groupby("Name")
+        .agg("CaseNumber", "DOB", "Alias")
+        .select(
+            [
+                pl.lit("").alias("AIS / Unique ID"),
+                pl.col("Name"),
+                pl.col("Alias").arr.get(0).str.replace("null", ""),
+                pl.col("DOB").arr.get(0),
+                pl.col("CaseNumber").arr.lengths().alias("CaseCount"),
+                pl.col("CaseNumber").arr.join(", ").alias("Cases"),
+            ]
+        )
+    )
+    names = names.sort("Name")
+    return names
+
+
+def charges_summary_from_pairs(src, pairs, debug=False, cf=None):
+    with pl.StringCache():
+        src = load_tables(src, cf=cf)
+        if isinstance(pairs, str):
+            pairs = read(pairs)
+        summary = (
+            src["cases"]
+            .join(pairs, on="Name", how="inner")
+            .groupby("AIS / Unique ID")
+            .agg("Name", "Alias", "DOB", "CaseNumber", "Race", "Sex")
+        )
+        ch = src["charges"].filter(pl.col("Filing"))  # filter convictions
+        summary = summary.select(  # prepare summary for join w/ convictions
+            [
+                pl.col("AIS / Unique ID"),
+                pl.col("Name").arr.get(0).alias("Name"),
+                pl.col("Alias").arr.get(0).alias("Alias"),
+                pl.col("DOB").arr.get(0),
+                pl.col("Race").arr.get(0),
+                pl.col("Sex").arr.get(0),
+                pl.col("CaseNumber").arr.join(", "),
+            ]
+        )
+        summary = summary.join(ch, on="Name", how="outer")  # join cases, convictions
+        summary = summary.groupby("Name").agg(
+            [
+                pl.col("AIS / Unique ID"),
+                pl.col("DOB"),
+                pl.col("Race"),
+                pl.col("Sex"),
+                pl.col("CaseNumber"),
+                pl.col("Alias"),
+                pl.col("Cite"),
+                pl.col("ChargesSummary"),
+                (pl.col("TypeDescription") == "MISDEMEANOR")
+                .sum()
+                .alias("MisdemeanorChargeCount"),
+                (pl.col("TypeDescription") == "FELONY")
+                .sum()
+                .alias("FelonyChargeCount"),
+                (pl.col("TypeDescription") == "TRAFFIC")
+                .sum()
+                .alias("TrafficChargeCount"),
+                pl.col("CERVDisqCharge"),
+                pl.col("PardonDisqCharge"),
+                pl.col("PermanentDisqCharge"),
+            ]
+        )
+        summary = summary.select(
+            [
+                pl.col("AIS / Unique ID")
+                .arr.get(0)
+                .cast(pl.Utf8)
+                .alias("AIS / Unique ID"),
+                pl.col("Name"),
+                pl.col("DOB").arr.get(0).alias("DOB"),
+                pl.col("Race").arr.get(0),
+                pl.col("Sex").arr.get(0),
+                pl.col("ChargesSummary").arr.lengths().alias("ChargeCount"),
+                pl.col("CERVDisqCharge").arr.count_match(True).alias("CERVChargeCount"),
+                pl.col("PardonDisqCharge")
+                .arr.count_match(True)
+                .alias("PardonChargeCount"),
+                pl.col("MisdemeanorChargeCount").cast(pl.UInt32),
+                pl.col("FelonyChargeCount").cast(pl.UInt32),
+                pl.col("TrafficChargeCount").cast(pl.UInt32),
+                pl.col("PermanentDisqCharge")
+                .arr.count_match(True)
+                .alias("PermanentChargeCount"),
+                pl.col("ChargesSummary")
+                .arr.join(", ")
+                .str.replace(r"null", "")
+                .alias("ChargesSummary"),
+            ]
+        )
+        summary = summary.filter(pl.col("Name") != "")
+        summary = plain_strings(summary).fill_null("")  # fill_null() breaks categoricals
+        return categorical(summary)
+
+
+def convictions_summary_from_pairs(src, pairs, debug=False, cf=None):
+    with pl.StringCache():
+        src = load_tables(src, cf=cf)
+        if isinstance(pairs, str):
+            pairs = read(pairs)
+        summary = (
+            src["cases"]
+            .join(pairs, on="Name", how="inner")
+            .groupby("AIS / Unique ID")
+            .agg("Name", "Alias", "DOB", "CaseNumber", "Race", "Sex")
+        )
+        conv = src["charges"].filter(pl.col("Conviction"))  # filter convictions
+        summary = summary.select(  # prepare summary for join w/ convictions
+            [
+                pl.col("AIS / Unique ID"),
+                pl.col("Name").arr.get(0).alias("Name"),
+                pl.col("Alias").arr.get(0).alias("Alias"),
+                pl.col("DOB").arr.get(0),
+                pl.col("Race").arr.get(0),
+                pl.col("Sex").arr.get(0),
+                pl.col("CaseNumber").arr.join(", "),
+            ]
+        )
+        summary = summary.join(conv, on="Name", how="outer")  # join cases, convictions
+        summary = summary.groupby("Name").agg(
+            [
+                pl.col("AIS / Unique ID"),
+                pl.col("DOB"),
+                pl.col("CaseNumber"),
+                pl.col("Alias"),
+                pl.col("Race"),
+                pl.col("Sex"),
+                pl.col("Cite"),
+                pl.col("ChargesSummary"),
+                (pl.col("TypeDescription") == "MISDEMEANOR")
+                .sum()
+                .alias("MisdemeanorConvictionCount"),
+                (pl.col("TypeDescription") == "FELONY")
+                .sum()
+                .alias("FelonyConvictionCount"),
+                (pl.col("TypeDescription") == "TRAFFIC")
+                .sum()
+                .alias("TrafficConvictionCount"),
+                (pl.col("CourtAction") == "GUILTY").sum().alias("GuiltyPleaCount"),
+                pl.col("CERVDisqConviction"),
+                pl.col("PardonDisqConviction"),
+                pl.col("PermanentDisqConviction"),
+                pl.col("TotalBalance"),
+                pl.col("PaymentToRestore"),
+            ]
+        )
+        summary = summary.select(
+            [
+                pl.col("AIS / Unique ID")
+                .arr.get(0)
+                .cast(pl.Utf8)
+                .alias("AIS / Unique ID"),
+                pl.col("Name"),
+                pl.col("DOB").arr.get(0).alias("DOB"),
+                pl.col("Race").arr.get(0),
+                pl.col("Sex").arr.get(0),
+                pl.col("ChargesSummary").arr.lengths().alias("ConvictionCount"),
+                pl.col("CERVDisqConviction")
+                .arr.count_match(True)
+                .alias("CERVConvictionCount"),
+                pl.col("PardonDisqConviction")
+                .arr.count_match(True)
+                .alias("PardonConvictionCount"),
+                pl.col("MisdemeanorConvictionCount").cast(pl.UInt32),
+                pl.col("FelonyConvictionCount").cast(pl.UInt32),
+                pl.col("TrafficConvictionCount").cast(pl.UInt32),
+                pl.col("GuiltyPleaCount").cast(pl.UInt32),
+                pl.col("PermanentDisqConviction")
+                .arr.count_match(True)
+                .alias("PermanentConvictionCount"),
+                pl.col("TotalBalance").arr.sum(),
+                pl.col("PaymentToRestore").arr.sum(),
+                pl.col("ChargesSummary")
+                .arr.join(", ")
+                .str.replace(r"null", "")
+                .alias("ChargesSummary"),
+            ]
+        )
+        summary = summary.filter(pl.col("Name") != "")
+        summary = plain_strings(summary).fill_null("")  # fill_null() breaks categoricals
+        return categorical(summary)
+
+
+def vrr_summary_from_pairs(src, pairs, debug=False, cf=None):
+    with pl.StringCache():
+        src = load_tables(src, cf=cf)
+        if isinstance(pairs, str):
+            pairs = read(pairs)
+        summary = (  # pair AIS to cases sheet
+            src["cases"]
+            .join(pairs, on="Name", how="inner")
+            .groupby("AIS / Unique ID")
+            .agg("Name", "Alias", "DOB", "CaseNumber", "Race", "Sex")
+        )
+        disq = src["charges"].filter(  # filter disqualifying convictions
+            pl.col("CERVDisqConviction")
+            | pl.col("PardonDisqConviction")
+            | pl.col("PermanentDisqConviction")
+        )
+        summary = summary.select(  # prepare summary for join w/ convictions
+            [
+                pl.col("AIS / Unique ID"),
+                pl.col("Name").arr.get(0).alias("Name"),
+                pl.col("Alias").arr.get(0).alias("Alias"),
+                pl.col("DOB").arr.get(0),
+                pl.col("Race").arr.get(0),
+                pl.col("Sex").arr.get(0),
+                pl.col("CaseNumber").arr.join(", "),
+            ]
+        )
+        summary = summary.join(disq, on="Name", how="outer")  # join cases, convictions
+        summary = summary.groupby("Name").agg(
+            [
+                pl.col("AIS / Unique ID"),
+                pl.col("DOB"),
+                pl.col("CaseNumber"),
+                pl.col("Race"),
+                pl.col("Sex"),
+                pl.col("Alias"),
+                pl.col("Cite"),
+                pl.col("ChargesSummary"),
+                pl.col("CERVDisqConviction"),
+                pl.col("PardonDisqConviction"),
+                pl.col("PermanentDisqConviction"),
+                pl.col("TotalBalance"),
+                pl.col("PaymentToRestore"),
+            ]
+        )
+        summary = summary.select(
+            [
+                pl.col("AIS / Unique ID")
+                .arr.get(0)
+                .cast(pl.Utf8)
+                .alias("AIS / Unique ID"),
+                pl.col("Name"),
+                pl.col("DOB").arr.get(0).alias("DOB"),
+                pl.col("Race").arr.get(0),
+                pl.col("Sex").arr.get(0),
+                pl.col("CERVDisqConviction")
+                .arr.count_match(True)
+                .alias("CERVConvictionCount"),
+                pl.col("PardonDisqConviction")
+                .arr.count_match(True)
+                .alias("PardonConvictionCount"),
+                pl.col("PermanentDisqConviction")
+                .arr.count_match(True)
+                .alias("PermanentConvictionCount"),
+                pl.col("TotalBalance").arr.sum(),
+                pl.col("PaymentToRestore").arr.sum(),
+                pl.col("ChargesSummary")
+                .arr.join(", ")
+                .str.replace(r"null", "")
+                .alias("ChargesSummary"),
+            ]
+        )
+        summary = summary.filter(pl.col("Name") != "")
+        summary = plain_strings(summary).fill_null("")  # fill_null() breaks categoricals
+        return categorical(summary)
+
+
+def extract_text(path) -> str:
+    """
+    From path, return full text of PDF as string (PyMuPdf engine required!)
+    """
+    import fitz
+
+    try:
+        doc = fitz.open(path)
+    except:
+        return ""
+    text = ""
+    for pg in doc:
+        try:
+            text += " \n ".join(
+                x[4].replace("\n", " ") for x in pg.get_text(option="blocks")
+            )
+        except:
+            pass
+    text = re.sub(r"(<image\:.+?>)", "", text).strip()
+    return text
+
+
+def extract_texts(
+    queue, workers=1, cache=None, cf=None, max_bytes=EXTRACT_CACHE_MAX_BYTES
+):
+    """
+    From list of paths `queue`, return full text of each PDF in `Path` order, extracting with `workers` processes. Reuses and updates extraction cache at path `cache` if given, evicting least recently used texts beyond `max_bytes`. Reports progress to `cf['WINDOW']` or console if `cf['LOG']`.
+    """
+    from tqdm.auto import tqdm
+
+    window = cf["WINDOW"] if isinstance(cf, dict) else None
+    bar = None
+    if window:
+        window.write_event_value("PROGRESS_TOTAL", len(queue))
+    elif isinstance(cf, dict) and cf["LOG"]:
+        bar = tqdm(total=len(queue))
+    aptxt = [None] * len(queue)
+    progress = [0]
+
+    def advance(n):
+        progress[0] += n
+        if window:
+            window.write_event_value("PROGRESS", progress[0])
+        elif bar is not None:
+            bar.update(n)
+
+    if cache:
+        con = open_cache(cache)
+        keys = cache_lookup(con, queue, aptxt)
+        todo = [i for i, text in enumerate(aptxt) if text == None]
+        advance(len(queue) - len(todo))
+    else:
+        con = None
+        todo = list(range(len(queue)))
+
+    def done(i, text):
+        aptxt[i] = text
+        if con != None:
+            cache_store(con, queue[i], keys[i], text)
+        advance(1)
+
+    if workers > 1 and len(todo) > 1:
+        # keep a bounded window of pending files per worker, collect in order
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for i in todo:
+                pending.append((i, executor.submit(extract_text, queue[i])))
+                if len(pending) >= workers * 4:
+                    i, fut = pending.popleft()
+                    done(i, fut.result())
+            while pending:
+                i, fut = pending.popleft()
+                done(i, fut.result())
+    else:
+        for i in todo:
+            done(i, extract_text(queue[i]))
+    if con != None:
+        con.commit()
+        cache_evict(con, max_bytes)
+        con.close()
+    if bar is not None:
+        bar.close()
+    return aptxt
+
+
+def user_cache_dir():
+    """
+    Return path to alacorder directory in the user cache directory (i.e. `~/.cache/alacorder/`), for caches with no output path to keep them beside.
+    """
+    root = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(root, "alacorder")
+
+
+def user_cache_path():
+    """
+    Return path to PDF text extraction cache in the user cache directory (see `user_cache_dir()`), creating the directory if needed.
+    """
+    os.makedirs(user_cache_dir(), exist_ok=True)
+    return os.path.join(user_cache_dir(), EXTRACT_CACHE_NAME)
+
+
+def open_cache(path):
+    """
+    Open PDF text extraction cache at `path`, creating it if needed, and return sqlite3 connection.
+    """
+    con = sqlite3.connect(path)
+    con.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS files (
+            path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, hash TEXT
+        );
+        CREATE TABLE IF NOT EXISTS texts (
+            hash TEXT PRIMARY KEY, text TEXT, bytes INTEGER, used REAL
+        );
+        CREATE INDEX IF NOT EXISTS texts_used ON texts (used);
+        """
+    )
+    return con
+
+
+def file_hash(path):
+    """
+    Return BLAKE2b hex digest of file contents at `path`.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def cache_lookup(con, queue, aptxt):
+    """
+    Fill `aptxt` with cached text for each path in `queue` found in extraction cache `con`. Files whose size and mtime are unchanged cost one stat; others are hashed and matched by content. Returns list of (size, mtime, hash) keys for `cache_store()`.
+    """
+    known = {
+        r[0]: r[1:] for r in con.execute("SELECT path, size, mtime, hash FROM files")
+    }
+    now = time.time()
+    keys = []
+    for i, pp in enumerate(queue):
+        try:
+            st = os.stat(pp)
+        except OSError:
+            keys += [None]
+            continue
+        row = known.get(pp)
+        if row != None and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+            digest = row[2]
+        else:
+            digest = file_hash(pp)
+        keys += [(st.st_size, st.st_mtime_ns, digest)]
+        hit = con.execute("SELECT text FROM texts WHERE hash = ?", (digest,)).fetchone()
+        if hit != None and hit[0] != "":  # failures cached by older versions
+            aptxt[i] = hit[0]
+            con.execute("UPDATE texts SET used = ? WHERE hash = ?", (now, digest))
+            if row == None or row[2] != digest or row[1] != st.st_mtime_ns:
+                con.execute(
+                    "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                    (pp, st.st_size, st.st_mtime_ns, digest),
+                )
+    con.commit()
+    return keys
+
+
+def cache_store(con, path, key, text):
+    """
+    Add extracted `text` of PDF at `path` with `key` from `cache_lookup()` to extraction cache `con`. Empty text, i.e. a failed or partial download, is not cached so it is extracted again next run.
+    """
+    if key == None or text == "":
+        return
+    size, mtime, digest = key
+    con.execute(
+        "INSERT OR REPLACE INTO texts VALUES (?, ?, ?, ?)",
+        (digest, text, len(text.encode("utf-8")), time.time()),
+    )
+    con.execute(
+        "INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", (path, size, mtime, digest)
+    )
+
+
+def cache_evict(con, max_bytes):
+    """
+    Remove least recently used texts from extraction cache `con` until it holds at most `max_bytes` of text.
+    """
+    total = con.execute("SELECT COALESCE(SUM(bytes), 0) FROM texts").fetchone()[0]
+    if total <= max_bytes:
+        return
+    drop = []
+    for digest, nbytes in con.execute("SELECT hash, bytes FROM texts ORDER BY used"):
+        if total <= max_bytes:
+            break
+        drop += [(digest,)]
+        total -= nbytes
+    con.executemany("DELETE FROM texts WHERE hash = ?", drop)
+    con.execute("DELETE FROM files WHERE hash NOT IN (SELECT hash FROM texts)")
+    con.commit()
+
+
+def get_paths(dirpath):
+    """
+    From path-like `dirpath`, return list of paths to pdfs in directory
+    """
+    return glob.glob(dirpath + "**/*.pdf", recursive=True)
@@ -0,0 +1,198 @@
+"""
+Console logging, errors and stage profiling shared by the other Alacorder modules.
+"""
+
+import polars as pl
+import sys, time
+from contextlib import contextmanager
+
+name = "ALACORDER"
+version = "79.8.9"
+long_version = "partymountain"
+
+
+try:
+    import resource  # peak RSS for profile_stage(), unavailable on Windows
+except ImportError:
+    resource = None
+
+
+pl.Config.set_tbl_rows(20)
+pl.Config.set_fmt_str_lengths(100)
+pl.Config.set_tbl_width_chars(90)
+pl.Config.set_tbl_formatting("NOTHING")
+pl.Config.set_tbl_hide_column_data_types(True)
+
+
+fname = f"{name} {version}"
+fshort_name = f"{name} {'.'.join(version.split('.')[0:-1])}"
+
+prt = print
+
+
+def plog(*msg, cf=None):
+    global prt
+    if len(msg) == 1:
+        msg = msg[0]
+        if isinstance(cf, dict):
+            try:
+                if cf["LOG"] == True:
+                    prt(msg)
+            except:
+                prt(msg)
+        elif cf == None:
+            prt(msg)
+        elif type(cf) == bool and cf:
+            prt(msg)
+    elif len(msg) > 1:
+        for m in msg:
+            if isinstance(cf, dict):
+                try:
+                    if cf["LOG"] == True:
+                        prt(m)
+                except:
+                    prt(m)
+            elif cf == None:
+                prt(m)
+            elif type(cf) == bool and cf:
+                prt(m)
+
+
+print = plog
+
+
+def dlog(*msg, cf=None):
+    if type(cf) == bool:
+        if cf:
+            for m in msg:
+                print(m)
+            return msg
+        else:
+            return None
+    elif type(cf) == dict:
+        if cf["DEBUG"]:
+            for m in msg:
+                print(m)
+            return msg
+        else:
+            return None
+    else:
+        return None
+
+
+def error(*msg, cf=None):
+    message = ""
+    for m in msg:
+        message += f"{m} "
+    message = message.strip()
+    if cf:
+        if cf["WINDOW"]:
+            cf["WINDOW"].write_event_value("POPUP", message)
+        elif cf["FORCE"]:
+            print(message)
+        else:
+            raise Exception(message)
+    else:
+        raise Exception(message)
+
+
+def popup(*msg, cf=None):
+    message = ""
+    for m in msg:
+        message += f"{m} "
+    message = message.strip()
+    if cf:
+        if cf["WINDOW"]:
+            cf["WINDOW"].write_event_value("POPUP", message)
+        else:
+            print(message)
+    else:
+        print(message)
+
+
+PROFILE_HOOKS = []
+
+
+def profile_hook(f):
+    """
+    Register `f` to be called with each stage record made by `profile_stage()`, i.e. to stream records to a JSON lines file. Returns `f` so it can be used as a decorator. Table parser stages are only recorded when `cf['PROFILE']` is on, as timing them means collecting each parser on its own.
+    """
+    PROFILE_HOOKS.append(f)
+    return f
+
+
+def peak_rss():
+    """
+    Return peak resident set size of this process in MB, or None if unsupported.
+    """
+    if resource == None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024**2 if sys.platform == "darwin" else peak / 1024
+
+
+def height(df):
+    """
+    Return total rows in DataFrame or list of DataFrames `df`, or None if not known without collecting.
+    """
+    if isinstance(df, list):
+        heights = [height(x) for x in df]
+        return None if None in heights else sum(heights)
+    if isinstance(df, pl.dataframe.frame.DataFrame):
+        return df.shape[0]
+    return None
+
+
+@contextmanager
+def profile_stage(stage, cf=None, rows_in=None):
+    """
+    Record wall time, CPU time, rows in and out, and peak RSS growth of the enclosed stage to `cf['PROFILE']` and each function registered with `profile_hook()`. Set `RowsOut` on the yielded record before the block ends. Records nothing unless profiling is on or a hook is registered.
+
+    Args:
+        stage (str): Stage name (i.e. "split_cases")
+        cf (dict, optional): Configuration object
+        rows_in (int, optional): Rows input to stage
+    """
+    on = isinstance(cf, dict) and isinstance(cf.get("PROFILE"), list)
+    if not on and len(PROFILE_HOOKS) == 0:
+        yield {}
+        return
+    record = {"Stage": stage, "RowsIn": rows_in, "RowsOut": None}
+    rss, cpu, wall = peak_rss(), time.process_time(), time.perf_counter()
+    try:
+        yield record
+    finally:
+        record["Wall"] = time.perf_counter() - wall
+        record["CPU"] = time.process_time() - cpu
+        record["RSSDelta"] = None if rss == None else peak_rss() - rss
+        if on:
+            cf["PROFILE"].append(record)
+        for hook in PROFILE_HOOKS:
+            hook(record)
+
+
+def profile_summary(records):
+    """
+    Return DataFrame totalling `profile_stage()` records by stage, in order of first run. `RSSDelta` is the largest peak RSS growth in MB of any run of the stage.
+    """
+    df = pl.DataFrame(
+        records,
+        schema={
+            "Stage": pl.Utf8,
+            "RowsIn": pl.Int64,
+            "RowsOut": pl.Int64,
+            "Wall": pl.Float64,
+            "CPU": pl.Float64,
+            "RSSDelta": pl.Float64,
+        },
+    )
+    return df.groupby("Stage", maintain_order=True).agg(
+        [
+            pl.count().alias("Runs"),
+            pl.col("RowsIn").sum(),
+            pl.col("RowsOut").sum(),
+            pl.col("Wall").sum().round(3),
+            pl.col("CPU").sum().round(3),
+            pl.col("RSSDelta").max().round(1),
+        ]
+    )
@@ -0,0 +1,1393 @@
+"""
+Table parsing engine. Splits full text archives into the cases, charges, fees, settings, witnesses, attorneys, case action summary and images tables.
+"""
+
+import polars as pl
+
+from .logs import dlog, height, plog, profile_stage
+
+print = plog
+
+
+CAS_HEADING = (  # Case Action Summary heading beside its column header, in either order
+    r"Case Action Summary\s*Date:?\s+Time\s+Code\s+Comments"
+    r"|Date:?\s+Time\s+Code\s+Comments\s*Case Action Summary"
+)
+SPLIT = "\uffff"  # noncharacter marking span boundaries, not expected in case text
+
+CATEGORICAL_COLUMNS = [  # low-cardinality table columns stored as pl.Categorical
+    "Race",
+    "Sex",
+    "County",
+    "CourtAction",
+    "TypeDescription",
+    "Category",
+    "DefendantStatus",
+    "BondType",
+    "FeeStatus",
+]
+
+
+CASE_FIELDS = [
+    "Retrieved",
+    "CaseNumber",
+    "Name",
+    "DOB",
+    "Race",
+    "Sex",
+    "Description",
+    "CourtAction",
+    "CourtActionDate",
+    "TotalAmtDue",
+    "TotalAmtPaid",
+    "TotalBalance",
+    "TotalAmtHold",
+    "D999",
+    "BondAmt",
+    "Phone",
+    "StreetAddress",
+    "City",
+    "State",
+    "ZipCode",
+    "County",
+    "Country",
+    "Alias",
+    "SSN",
+    "Weight",
+    "Eyes",
+    "Hair",
+    "FilingDate",
+    "CaseInitiationDate",
+    "ArrestDate",
+    "OffenseDate",
+    "IndictmentDate",
+    "JuryDemand",
+    "InpatientTreatmentOrdered",
+    "TrialType",
+    "Judge",
+    "DefendantStatus",
+    "ArrestingAgencyType",
+    "ArrestingOfficer",
+    "ProbationOfficeName",
+    "PreviousDUIConvictions",
+    "CaseInitiationType",
+    "DomesticViolence",
+    "AgencyORI",
+    "WarrantIssuanceDate",
+    "WarrantActionDate",
+    "WarrantIssuanceStatus",
+    "WarrantActionStatus",
+    "WarrantLocationStatus",
+    "NumberOfWarrants",
+    "BondType",
+    "BondTypeDesc",
+    "BondCompany",
+    "SuretyCode",
+    "BondReleaseDate",
+    "FailedToAppearDate",
+    "BondsmanProcessIssuance",
+    "AppealDate",
+    "AppealCourt",
+    "OriginOfAppeal",
+    "AppealToDesc",
+    "AppealStatus",
+    "AppealTo",
+    "NumberOfSubpoenas",
+    "AdminUpdatedBy",
+    "TransferDesc",
+    "TBNV1",
+    "TBNV2",
+    "DriverLicenseNo",
+    "StateID",
+]
+
+
+def parse_stage(stage, f, df, cf=None, **kwargs):
+    """
+    Return LazyFrame plan(s) from table parser `f` on `df`. If profiling is on, the plans are collected now and returned as DataFrames so the parser is timed as `stage` by `profile_stage()`, else they are left for one `collect_all()`.
+
+    Args:
+        stage (str): Stage name for profile records
+        f (function): Table parser (i.e. `split_cases`)
+        df (pl.DataFrame | pl.LazyFrame): Parser input
+        cf (dict, optional): Configuration object
+    """
+    plans = f(df.lazy(), **kwargs)
+    if not (isinstance(cf, dict) and isinstance(cf.get("PROFILE"), list)):
+        return plans
+    many = isinstance(plans, tuple)
+    with profile_stage(stage, cf, rows_in=height(df)) as record:
+        out = pl.collect_all(list(plans) if many else [plans])
+        record["RowsOut"] = out[0].shape[0]
+    return tuple(out) if many else out[0]
+
+
+def parse_tables(df, cf=None, fields=None):
+    """
+    Return dict of every multitable export table parsed from archive `df`, with only `fields` in the cases table if given.
+    """
+    with pl.StringCache():
+        debug = cf["DEBUG"] if isinstance(cf, dict) else False
+        df = case_sections(df)  # build every table as one set of plans
+        plog("Extracting case info...", cf=cf)
+        ca, ac, af = parse_stage(
+            "split_cases", split_cases, df, cf=cf, debug=debug, fields=fields
+        )
+        print("Parsing charges...", cf=cf)
+        ch = parse_stage("split_charges", split_charges, ac, cf=cf, debug=debug)
+        print("Parsing fees...", cf=cf)
+        fs = parse_stage("split_fees", split_fees, af, cf=cf, debug=debug)
+        print("Parsing settings...", cf=cf)
+        settings = parse_stage("explode_settings", explode_settings, df, cf=cf)
+        print("Parsing case action summaries...", cf=cf)
+        cas = parse_stage(
+            "explode_case_action_summary", explode_case_action_summary, df, cf=cf
+        )
+        print("Parsing witnesses...", cf=cf)
+        wit = parse_stage("explode_witnesses", explode_witnesses, df, cf=cf)
+        print("Parsing attorneys...", cf=cf)
+        att = parse_stage("explode_attorneys", explode_attorneys, df, cf=cf)
+        print("Parsing images...", cf=cf)
+        img = parse_stage("explode_images", explode_images, df, cf=cf)
+        ca, ch, fs, settings, cas, wit, att, img = pl.collect_all(
+            [x.lazy() for x in (ca, ch, fs, settings, cas, wit, att, img)]
+        )
+        dlog(ca, ch, fs, settings, cas, wit, att, img, cf=cf)
+        ch_filing = ch.filter(pl.col("Filing") == True).select(
+            pl.exclude("CourtAction", "CourtActionDate")
+        )
+        ch_disposition = ch.filter(pl.col("Filing") == False)
+        return {
+            "cases": ca,
+            "charges": ch,
+            "filing-charges": ch_filing,
+            "disposition-charges": ch_disposition,
+            "fees": fs,
+            "settings": settings,
+            "case-action-summary": cas,
+            "witnesses": wit,
+            "attorneys": att,
+            "images": img,
+        }
+
+
+def case_keys(df):
+    """
+    Return archive `df` with `CaseNumber` and `Name` key columns, parsing them from `AllPagesText` only where they are not already stored on the archive.
+    """
+    if "AllPagesText" not in df.columns:
+        return df
+    keys = {
+        "CaseNumber": pl.concat_str(
+            [
+                pl.col("AllPagesText").str.extract(
+                    r"(County: )(\d{2})", group_index=2
+                ),
+                pl.lit("-"),
+                pl.col("AllPagesText").str.extract(r"(\w{2}\-\d{4}\-\d{6}\.\d{2})"),
+            ]
+        ).alias("CaseNumber"),
+        "Name": pl.col("AllPagesText")
+        .str.extract(
+            r"(?:VS\.|V\.| VS | V | VS: |-VS-{1})([A-Z\s]{10,100})(Case Number)*",
+            group_index=1,
+        )
+        .str.replace_all("Case Number:", "", literal=True)
+        .str.replace(r"C$", "")
+        .str.strip()
+        .alias("Name"),
+    }
+    missing = [keys[k] for k in keys if k not in df.columns]
+    return df.with_columns(missing) if len(missing) > 0 else df
+
+
+def case_sections(df):
+    """
+    Return archive `df` with the case section spans the table parsers read, computing only those not already on `df`.
+
+    `CaseDetail` is the span of `AllPagesText` before the Case Action Summary heading, which case info field regexes run over so they do not rescan the docket entries and images list that make up most of a long case. The heading is only matched beside its `Date: Time Code Comments` column header (see `CAS_HEADING`), so the phrase elsewhere in a case (i.e. in a charge description or docket note) does not end the span early, and cases without the heading keep their full text. `ChargesDetail` and `FeeSheet` are the rest of `CaseDetail` from the first charge row and the first fee sheet row (`ACTIVE` or `Total:`) respectively. Each starts where its row regexes first could match, so charges and fees regexes find the same rows as over `CaseDetail` while skipping the header and parties block before them. Header and party fields are labelled values that PyMuPDF may extract in any order, so they have no narrower span than `CaseDetail`.
+
+    `SettingsChunk` (Settings to Court Action), `WitnessesChunk` (Witness to Case Action Summary), `AttorneysChunk` (Type of Counsel to Warrant Issuance), `CASChunk` (Case Action Summary to Images Pages), and `ImagesChunk` (Images Pages to End of the Report) are found once here, so the settings, witnesses, attorneys, case action summary, and images parsers each run over their own section rather than the whole case.
+    """
+    if "AllPagesText" not in df.columns:
+        return df
+    if "CaseDetail" not in df.columns:
+        df = df.with_columns(
+            pl.col("AllPagesText")
+            .str.replace(CAS_HEADING, f"{SPLIT}$0")  # mark the first heading
+            .str.splitn(SPLIT, 2)
+            .struct.field("field_0")
+            .alias("CaseDetail")
+        )
+    sections = {
+        "ChargesDetail": rest_of("CaseDetail", r"\d{3}\s[A-Z0-9]{4}").alias(
+            "ChargesDetail"
+        ),
+        "FeeSheet": rest_of("CaseDetail", r"ACTIVE|Total:").alias("FeeSheet"),
+        "SettingsChunk": section(
+            "AllPagesTextNoNewLine",
+            r"(Settings)(.+)(Court Action)",
+            "Settings",
+            "Court Action",
+        ).alias("SettingsChunk"),
+        "WitnessesChunk": section(
+            "AllPagesTextNoNewLine",
+            r"Witness(.+)Case Action Summary",
+            "Witness",
+            "Case Action Summary",
+        ).alias("WitnessesChunk"),
+        "AttorneysChunk": section(
+            "AllPagesTextNoNewLine",
+            r"(Type of Counsel Name Phone Email Attorney Code)(.+)(Warrant Issuance)",
+            "Type of Counsel Name Phone Email Attorney Code",
+            "Warrant Issuance",
+        ).alias("AttorneysChunk"),
+        "CASChunk": section(
+            "AllPagesText",
+            r"(Case Action Summary)([^\\]*)(Images\s+?Pages)",
+            "Case Action Summary",
+            r"Images\s+?Pages",
+        ).alias("CASChunk"),
+        "ImagesChunk": pl.col("AllPagesText")
+        .str.extract(
+            r"(Images\s+?Pages)([^\\n]*)(END OF THE REPORT)", group_index=2
+        )
+        .alias("ImagesChunk"),
+    }
+    no_newline = ("SettingsChunk", "WitnessesChunk", "AttorneysChunk")
+    missing = [
+        sections[k]
+        for k in sections
+        if k not in df.columns
+        and ("AllPagesTextNoNewLine" in df.columns or k not in no_newline)
+    ]
+    return df.with_columns(missing) if len(missing) > 0 else df
+
+
+def rest_of(column, start):
+    """
+    Return expression for the text of `column` from the first match of regex `start` on, or all of `column` if `start` does not match. Regexes whose matches must begin with a `start` match find the same matches over this span as over `column`.
+    """
+    return pl.coalesce(
+        [
+            pl.col(column)
+            .str.replace(start, f"{SPLIT}$0")
+            .str.splitn(SPLIT, 2)
+            .struct.field("field_1"),
+            pl.col(column),
+        ]
+    )
+
+
+def section(column, pattern, head, tail):
+    """
+    Return expression for the text between `head` and `tail` in the first match of section `pattern` in `column`. Same result as `str.extract(pattern)` on a `(head)(.+)(tail)` pattern, but the span is found without running the capture engine across the whole section, which is many times slower on long cases.
+    """
+    return (
+        pl.col(column)
+        .str.extract_all(pattern)
+        .arr.first()
+        .str.replace(f"^{head}", "")
+        .str.replace(f"{tail}$", "")
+    )
+
+
+def categorical(df):
+    """
+    Return table `df` with its `CATEGORICAL_COLUMNS` cast to `pl.Categorical`, which stores each distinct value once and makes grouping and comparing them integer operations.
+    """
+    return df.with_columns(
+        [pl.col(c).cast(pl.Categorical) for c in CATEGORICAL_COLUMNS if c in df.columns]
+    )
+
+
+def plain_strings(df):
+    """
+    Return table or list of tables `df` with `pl.Categorical` columns cast back to `pl.Utf8` for exports read by tools without dictionary-encoded column support.
+    """
+    if isinstance(df, list):
+        return [plain_strings(x) for x in df]
+    return df.with_columns(
+        [
+            pl.col(c).cast(pl.Utf8)
+            for c, dtype in df.schema.items()
+            if dtype == pl.Categorical
+        ]
+    )
+
+
+def explode_charges(df, debug=False):
+    lazy = isinstance(df, pl.lazyframe.frame.LazyFrame)
+    all_charges = case_sections(case_keys(df).lazy()).with_columns(
+        [
+            pl.col("ChargesDetail")
+            .str.extract_all(
+                r"(\d{3}\s{1}[A-Z0-9]{4}.{1,200}?.{3}-.{3}-.{3}[^a-z\n]{0,75})"
+            )
+            .alias("RE_Charges"),
+            pl.col("FeeSheet")
+            .str.extract(r"(Total:.+\$[^\n]*)")
+            .str.replace_all(r"[^0-9|\.|\s|\$]", "")
+            .str.extract_all(r"\s\$\d+\.\d{2}")
+            .arr.get(2)
+            .str.replace_all(r"[^0-9\.]", "")
+            .cast(pl.Float64, strict=False)
+            .alias("RAWTotalBalance"),
+            pl.col("FeeSheet")
+            .str.extract(r"(ACTIVE[^\n]+D999[^\n]+)")
+            .str.extract_all(r"\$\d+\.\d{2}")
+            .arr.get(-1)
+            .str.replace(r"[\$\s]", "")
+            .cast(pl.Float64, strict=False)
+            .alias("RAWD999"),
+        ]
+    )
+
+    all_charges = all_charges.explode("RE_Charges").select(
+        [
+            pl.col("Name"),
+            pl.col("CaseNumber"),
+            pl.col("RE_Charges")
+            .str.replace_all(r"[A-Z][a-z][A-Za-z\s\$]+.+", "")
+            .str.strip()
+            .alias("Charges"),
+            pl.when(pl.col("RAWTotalBalance").is_null())
+            .then(pl.lit(0.0))
+            .otherwise(pl.col("RAWTotalBalance"))
+            .alias("TotalBalance"),
+            pl.when(pl.col("RAWD999").is_null())
+            .then(pl.lit(0.0))
+            .otherwise(pl.col("RAWD999"))
+            .alias("TotalD999"),
+        ]
+    )
+
+    dlog(all_charges.columns, cf=debug)
+    return all_charges if lazy else all_charges.collect()
+
+
+def explode_fees(df, debug=False):
+    lazy = isinstance(df, pl.lazyframe.frame.LazyFrame)
+    cases = case_sections(case_keys(df).lazy()).with_columns(
+        [
+            pl.col("FeeSheet")
+            .str.extract_all(
+                r"(ACTIVE [^\(\n]+\$[^\(\n]+ACTIVE[^\(\n]+[^\n]|Total:.+\$[^\n]*)"
+            )
+            .alias("RE_Fees"),
+        ]
+    )
+    all_fees = cases.explode("RE_Fees").select(
+        [
+            pl.col("CaseNumber"),
+            pl.col("RE_Fees")
+            .str.replace_all(r"[^A-Z0-9|\.|\s|\$|\n]", " ")
+            .str.strip()
+            .alias("Fees"),
+        ]
+    )
+    dlog(all_fees.columns, cf=debug)
+    return all_fees if lazy else all_fees.collect()
+
+
+def split_cases(df, debug=False, fields=None):
+    """
+    Return cases table and exploded charges and fees from archive `df`. If `fields` is given, the cases table has only those columns, and the regexes for every other field are pruned from the plan rather than computed and dropped.
+
+    Args:
+        df (pl.DataFrame | pl.LazyFrame): Archive
+        debug (bool, optional): Print column names at each step
+        fields (List[str], optional): Cases table columns to parse (see `CASE_FIELDS`)
+    """
+    lazy = isinstance(df, pl.lazyframe.frame.LazyFrame)
+    cases = case_sections(case_keys(df).lazy()).with_columns(
+        [
+            pl.col("AllPagesTextNoNewLine")
+            .str.extract(r"(SSN\:)(.{0,100})(Alias 1)", group_index=2)
+            .str.replace(r"(SSN)", "")
+            .str.replace(r"Alias", "")
+            .str.replace(r"\:", "")
+            .str.strip()
+            .alias("Alias"),
+            pl.col("CaseDetail")
+            .str.extract(r"(\d{2}/\d{2}/\d{4})(?:.{0,5}DOB:)", group_index=1)
+            .str.replace_all(r"[^\d/]", "")
+            .str.strip()
+            .alias("DOB"),
+            pl.col("CaseDetail")
+            .str.extract(r"(Phone: )(.+)", group_index=2)
+            .str.replace_all(r"[^0-9]", "")
+            .str.slice(0, 10)
+            .str.replace_all(r"(.{3}0000000)", "")
+            .alias("RE_Phone"),
+            pl.col("CaseDetail").str.extract(r"(B|W|H|A)/(?:F|M)").alias("Race"),
+            pl.col("CaseDetail").str.extract(r"(?:B|W|H|A)/(F|M)").alias("Sex"),
+            pl.col("CaseDetail")
+            .str.extract(r"(?:Address 1:)(.+)(?:Phone)*?", group_index=1)
+            .str.replace(r"(Phone.+)", "")
+            .str.strip()
+            .alias("Address1"),
+            pl.col("CaseDetail")
+            .str.extract(r"(?:Address 2:)(.+)")
+            .str.strip()
+            .alias("Address2"),
+            pl.col("CaseDetail")
+            .str.extract(r"(?:Zip: )(.+)", group_index=1)
+            .str.replace_all(r"[A-Z].+", "")
+            .alias("ZipCode"),
+            pl.col("CaseDetail")
+            .str.extract(r"(?:City: )(.*)(?:State: )(.*)", group_index=1)
+            .alias("City"),
+            pl.col("CaseDetail")
+            .str.extract(r"(?:City: )(.*)(?:State: )(.*)", group_index=2)
+            .alias("State"),
+            pl.col("ChargesDetail")
+            .str.extract_all(
+                r"(\d{3}\s{1}[A-Z0-9]{4}.{1,200}?.{3}-.{3}-.{3}[^a-z\n]{0,75})"
+            )
+            .alias("RE_Charges"),
+            pl.col("FeeSheet")
+            .str.extract_all(
+                r"(ACTIVE [^\(\n]+\$[^\(\n]+ACTIVE[^\(\n]+[^\n]|Total:.+\$[^\n]*)"
+            )
+            .alias("RE_Fees"),
+            pl.col("FeeSheet")
+            .str.extract(r"(Total:.+\$[^\n]*)")
+            .str.replace_all(r"[^0-9|\.|\s|\$]", "")
+            .str.extract_all(r"\s\$\d+\.\d{2}")
+            .alias("TOTALS"),
+            pl.col("FeeSheet")
+            .str.extract(r"(ACTIVE[^\n]+D999[^\n]+)")
+            .str.extract_all(r"\$\d+\.\d{2}")
+            .arr.get(-1)
+            .str.replace(r"[\$\s]", "")
+            .cast(pl.Float64, strict=False)
+            .alias("D999RAW"),
+            pl.col("CaseDetail")
+            .str.extract_all(r"(\w{2}\d{12})")
+            .arr.join("/")
+            .alias("RelatedCases"),
+            pl.col("CaseDetail")
+            .str.extract(r"Filing Date: (\d\d?/\d\d?/\d\d\d\d)")
+            .alias("FilingDate"),
+            pl.col("CaseDetail")
+            .str.extract(r"Case Initiation Date: (\d\d?/\d\d?/\d\d\d\d)")
+            .alias("CaseInitiationDate"),
+            pl.col("CaseDetail")
+            .str.extract(r"Arrest Date: (\d\d?/\d\d?/\d\d\d\d)")
+            .alias("ArrestDate"),
+            pl.col("CaseDetail")
+            .str.extract(r"Offense Date: (\d\d?/\d\d?/\d\d\d\d)")
+            .alias("OffenseDate"),
+            pl.col("CaseDetail")
+            .str.extract(r"Indictment Date: (\d\d?/\d\d?/\d\d\d\d)")
+            .alias("IndictmentDate"),
+            pl.col("CaseDetail")
+            .str.extract(r"Youthful Date: (\d\d?/\d\d?/\d\d\d\d)")
+            .alias("YouthfulDate"),
+            pl.col("CaseDetail")
+            .str.extract(r"AL Institutional Service Num: ([^\na-z])")
+            .str.strip()
+            .alias("ALInstitutionalServiceNum"),
+            pl.col("CaseDetail")
+            .str.extract(r"Alacourt\.com (\d\d?/\d\d?/\d\d\d\d)")
+            .alias("Retrieved"),
+            pl.col("CaseDetail")
+            .str.extract(
+                r"Court Action: (BOUND|GUILTY PLEA|WAIVED TO GJ|DISMISSED|TIME LAPSED|NOL PROSS|CONVICTED|INDICTED|DISMISSED|FORFEITURE|TRANSFER|REMANDED|WAIVED|ACQUITTED|WITHDRAWN|PETITION|PRETRIAL|COND\. FORF\.)"
+            )
+            .alias("CourtAction"),
+            pl.col("CaseDetail")
+            .str.extract(r"Court Action Date: (\d\d?/\d\d?/\d\d\d\d)")
+            .alias("CourtActionDate"),
+            pl.col("CaseDetail")
+            .str.extract(r"Charge: ([A-Z\.0-9\-\s]+)")
+            .str.rstrip("C")
+            .str.strip()
+            .alias("Description"),
+            pl.col("CaseDetail")
+            .str.extract(r"Jury Demand: ([A-Z]+)")
+            .str.strip()
+            .alias("JuryDemand"),
+            pl.col("CaseDetail")
+            .str.extract(r"Inpatient Treatment Ordered: ([YES|NO]?)")
+            .str.strip()
+            .alias("InpatientTreatmentOrdered"),
+            pl.col("CaseDetail")
+            .str.extract(r"Trial Type: ([A-Z]+)")
+            .str.replace(r"[S|N]$", "")
+            .str.strip()
+            .alias("TrialType"),
+            pl.col("CaseDetail")
+            .str.extract(r"Case Number: (\d\d-\w+) County:")
+            .str.strip()
+            .alias("County"),
+            pl.col("CaseDetail")
+            .str.extract(r"Judge: ([A-Z\-\.\s]+)")
+            .str.rstrip("T")
+            .str.strip()
+            .alias("Judge"),
+            pl.col("CaseDetail")
+            .str.extract(r"Probation Office \#: ([0-9\-]+)")
+            .alias("PROBATIONOFFICENUMBERRAW"),
+            pl.col("CaseDetail")
+            .str.extract(r"Defendant Status: ([A-Z\s]+)")
+            .str.rstrip("J")
+            .str.strip()
+            .alias("DefendantStatus"),
+            pl.col("CaseDetail")
+            .str.extract(r"([^0-9]+) Arresting Agency Type:")
+            .str.replace(r"\n", "")
+            .str.strip()
+            .alias("ArrestingAgencyType"),
+            pl.col("CaseDetail")
+            .str.extract(r"Arresting Officer: ([A-Z\s]+)")
+            .str.rstrip("S")
+            .str.rstrip("P")
+            .str.strip()
+            .alias("ArrestingOfficer"),
+            pl.col("CaseDetail")
+            .str.extract(r"Probation Office Name: ([A-Z0-9]+)")
+            .alias("ProbationOfficeName"),
+            pl.col("CaseDetail")
+            .str.extract(r"Traffic Citation \#: ([A-Z0-9]+)")
+            .alias("TrafficCitationNumber"),
+            pl.col("CaseDetail")
+            .str.extract(r"Previous DUI Convictions: (\d{3})")
+            .str.strip()
+            .cast(pl.Int64, strict=False)
+            .alias("PreviousDUIConvictions"),
+            pl.col("CaseDetail")
+            .str.extract(r"Case Initiation Type: ([A-Z\s]+)")
+            .str.rstrip("J")
+            .str.strip()
+            .alias("CaseInitiationType"),
+            pl.col("CaseDetail")
+            .str.extract(r"Domestic Violence: ([YES|NO])")
+            .str.strip()
+            .alias("DomesticViolence"),
+            pl.col("CaseDetail")
+            .str.extract(r"Agency ORI: ([A-Z\s]+)")
+            .str.rstrip("C")
+            .str.strip()
+            .alias("AgencyORI"),
+            pl.col("CaseDetail")
+            .str.extract(r"Driver License N°: ([A-Z0-9]+)")
+            .str.strip()
+            .alias("DLRAW"),
+            pl.col("CaseDetail")
+            .str.extract(r"SSN: ([X\d]{3}\-[X\d]{2}-[X\d]{4})")
+            .alias("SSN"),
+            pl.col("CaseDetail")
+            .str.extract(r"([A-Z0-9]{11}?) State ID:")
+            .alias("SIDRAW"),
+            pl.col("CaseDetail")
+            .str.extract(r"Weight: (\d*)", group_index=1)
+            .cast(pl.Int64, strict=False)
+            .alias("Weight"),
+            pl.col("CaseDetail")
+            .str.extract(r"Height : (\d'\d{2})")
+            .alias("RAWHEIGHT"),
+            pl.col("CaseDetail")
+            .str.extract(r"Eyes/Hair: (\w{3})/(\w{3})", group_index=1)
+            .alias("Eyes"),
+            pl.col("CaseDetail")
+            .str.extract(r"Eyes/Hair: (\w{3})/(\w{3})", group_index=2)
+            .alias("Hair"),
+            pl.col("CaseDetail")
+            .str.extract(r"Country: (\w*+)")
+            .str.replace(r"(Enforcement|Party)", "")
+            .str.strip()
+            .alias("Country"),
+            pl.col("CaseDetail")
+            .str.extract(r"(\d\d?/\d\d?/\d\d\d\d) Warrant Issuance Date:")
+            .str.strip()
+            .alias("WarrantIssuanceDate"),
+            pl.col("CaseDetail")
+            .str.extract(r"Warrant Action Date: (\d\d?/\d\d?/\d\d\d\d)")
+            .str.strip()
+            .alias("WarrantActionDate"),
+            pl.col("CaseDetail")
+            .str.extract(r"Warrant Issuance Status: (\w)")
+            .str.strip()
+            .alias("WarrantIssuanceStatus"),
+            pl.col("CaseDetail")
+            .str.extract(r"Warrant Action Status: (\w)")
+            .str.strip()
+            .alias("WarrantActionStatus"),
+            pl.col("CaseDetail")
+            .str.extract(r"Warrant Location Status: (\w)")
+            .str.strip()
+            .alias("WarrantLocationStatus"),
+            pl.col("CaseDetail")
+            .str.extract(r"Number Of Warrants: (\d{3}\s\d{3})")
+            .str.strip()
+            .alias("NumberOfWarrants"),
+            pl.col("CaseDetail")
+            .str.extract(r"Bond Type: (\w)")
+            .str.strip()
+            .alias("BondType"),
+            pl.col("CaseDetail")
+            .str.extract(r"Bond Type Desc: ([A-Z\s]+)")
+            .str.strip()
+            .alias("BondTypeDesc"),
+            pl.col("CaseDetail")
+            .str.extract(r"([\d\.]+) Bond Amount:")
+            .str.replace_all(r"[^0-9\.\s]", "")
+            .cast(pl.Float64, strict=False)
+            .alias("BondAmt"),
+            pl.col("CaseDetail")
+            .str.extract(r"Bond Company: ([A-Z0-9]+)")
+            .str.rstrip("S")
+            .str.strip()
+            .alias("BondCompany"),
+            pl.col("CaseDetail")
+            .str.extract(r"Surety Code: ([A-Z0-9]{4})")
+            .str.strip()
+            .alias("SuretyCode"),
+            pl.col("CaseDetail")
+            .str.extract(r"Release Date: (\d\d?/\d\d?/\d\d\d\d)")
+            .str.strip()
+            .alias("BondReleaseDate"),
+            pl.col("CaseDetail")
+            .str.extract(r"Failed to Appear Date: (\d\d?/\d\d?/\d\d\d\d)")
+            .str.strip()
+            .alias("FailedToAppearDate"),
+            pl.col("CaseDetail")
+            .str.extract(
+                r"Bondsman Process Issuance: ([^\n]*?) Bondsman Process Return:"
+            )
+            .str.strip()
+            .alias("BondsmanProcessIssuance"),
+            pl.col("CaseDetail")
+            .str.extract(r"Bondsman Process Return: (.*?) Number of Subponeas")
+            .str.strip()
+            .alias("BondsmanProcessReturn"),
+            pl.col("CaseDetail")
+            .str.extract(r"([\n\s/\d]*?) Appeal Court:")
+            .str.replace_all(r"[\n\s]", "")
+            .str.strip()
+            .alias("AppealDate"),
+            pl.col("CaseDetail")
+            .str.extract(r"([A-Z\-\s]+) Appeal Case Number")
+            .str.strip()
+            .alias("AppealCourt"),
+            pl.col("CaseDetail")
+            .str.extract(r"Orgin Of Appeal: ([A-Z\-\s]+)")
+            .str.rstrip("L")
+            .str.strip()
+            .alias("OriginOfAppeal"),
+            pl.col("CaseDetail")
+            .str.extract(r"Appeal To Desc: ([A-Z\-\s]+)")
+            .str.rstrip("D")
+            .str.rstrip("T")
+            .str.strip()
+            .alias("AppealToDesc"),
+            pl.col("CaseDetail")
+            .str.extract(r"Appeal Status: ([A-Z\-\s]+)")
+            .str.rstrip("A")
+            .str.strip()
+            .alias("AppealStatus"),
+            pl.col("CaseDetail")
+            .str.extract(r"Appeal To: (\w?) Appeal")
+            .str.strip()
+            .alias("AppealTo"),
+            pl.col("CaseDetail")
+            .str.extract(r"LowerCourt Appeal Date: (\d\d?/\d\d?/\d\d\d\d)")
+            .str.replace_all(r"[\n\s:\-]", "")
+            .str.strip()
+            .alias("LowerCourtAppealDate"),
+            pl.col("CaseDetail")
+            .str.extract(r"Disposition Date Of Appeal: (\d\d?/\d\d?/\d\d\d\d)")
+            .str.replace_all(r"[\n\s:\-]", "")
+            .str.strip()
+            .alias("DispositionDateOfAppeal"),
+            pl.col("CaseDetail")
+            .str.extract(r"Disposition Type Of Appeal: [^A-Za-z]+")
+            .str.replace_all(r"[\n\s:\-]", "")
+            .str.strip()
+            .alias("DispositionTypeOfAppeal"),
+            pl.col("CaseDetail")
+            .str.extract(r"Number of Subponeas: (\d{3})")
+            .str.replace_all(r"[^0-9]", "")
+            .str.strip()
+            .cast(pl.Int64, strict=False)
+            .alias("NumberOfSubpoenas"),
+            pl.col("CaseDetail")
+            .str.extract(r"Updated By: (\w{3})")
+            .str.strip()
+            .alias("AdminUpdatedBy"),
+            pl.col("CaseDetail")
+            .str.extract(r"Transfer to Admin Doc Date: (\d\d?/\d\d?/\d\d\d\d)")
+            .str.strip()
+            .alias("TransferToAdminDocDate"),
+            pl.col("CaseDetail")
+            .str.extract(r"Transfer Desc: ([A-Z\s]{0,15} \d\d?/\d\d?/\d\d\d\d)")
+            .str.replace_all(r"(Transfer Desc:)", "")
+            .str.strip()
+            .alias("TransferDesc"),
+            pl.col("CaseDetail")
+            .str.extract(r"Date Trial Began but No Verdict \(TBNV1\): ([^\n]+)")
+            .str.strip()
+            .alias("TBNV1"),
+            pl.col("CaseDetail")
+            .str.extract(r"Date Trial Began but No Verdict \(TBNV2\): ([^\n]+)")
+            .str.strip()
+            .alias("TBNV2"),
+        ]
+    )
+    cases = cases.with_columns(
+        [
+            pl.when(pl.col("D999RAW").is_null())
+            .then(pl.lit(0))
+            .otherwise(pl.col("D999RAW"))
+            .alias("D999")
+        ]
+    )
+    cases = cases.with_columns(
+        [
+            pl.col("CaseNumber"),
+            pl.col("CaseDetail")
+            .str.extract_all(r"(?:Requrements Completed: )([YES|NO]?)")
+            .arr.join(", ")
+            .str.replace_all(r"[\n:]|Requrements Completed", "")
+            .str.strip()
+            .alias("SentencingRequirementsCompleted"),
+            pl.col("CaseDetail")
+            .str.extract_all(r"(?:Sentence Date: )(\d\d?/\d\d?/\d\d\d\d)")
+            .arr.join(", ")
+            .str.replace_all(r"(Sentence Date: )", "")
+            .str.strip()
+            .alias("SentenceDate"),
+            pl.col("CaseDetail")
+            .str.extract_all(r"Probation Period: ([^\.]+)")
+            .arr.join(", ")
+            .str.strip()
+            .alias("ProbationPeriod"),
+            pl.col("CaseDetail")
+            .str.extract_all(r"License Susp Period: ([^\.]+)")
+            .arr.join(", ")
+            .str.replace_all(r"(License Susp Period:)", "")
+            .str.strip()
+            .alias("LicenseSuspPeriod"),
+            pl.col("CaseDetail")
+            .str.extract_all(r"Jail Credit Period: ([^\.]+)")
+            .arr.join(", ")
+            .str.replace_all(r"(Jail Credit Period:)", "")
+            .str.strip()
+            .alias("JailCreditPeriod"),
+            pl.col("CaseDetail")
+            .str.extract_all(r"Sentence Provisions: ([Y|N]?)")
+            .arr.join(", ")
+            .str.replace_all(r"(Sentence Provisions:)", "")
+            .str.strip()
+            .alias("SentenceProvisions"),
+            pl.col("CaseDetail")
+            .str.extract_all(r"Sentence Start Date: (\d\d?/\d\d?/\d\d\d\d)")
+            .arr.join(", ")
+            .str.replace_all(r"(Sentence Start Date:)", "")
+            .str.strip()
+            .alias("SentenceStartDate"),
+            pl.col("CaseDetail")
+            .str.extract_all(r"Sentence End Date: (\d\d?/\d\d?/\d\d\d\d)")
+            .arr.join(", ")
+            .str.replace_all(r"(Sentence End Date:)", "")
+            .str.strip()
+            .alias("SentenceEndDate"),
+            pl.col("CaseDetail")
+            .str.extract_all(r"Probation Begin Date: (\d\d?/\d\d?/\d\d\d\d)")
+            .arr.join(", ")
+            .str.replace_all(r"(Probation Begin Date:)", "")
+            .str.strip()
+            .alias("ProbationBeginDate"),
+            pl.col("CaseDetail")
+            .str.extract_all(r"Updated By: (\w{3}?)")
+            .arr.join(", ")
+            .str.replace_all(r"(Updated By:)", "")
+            .str.strip()
+            .alias("SentenceUpdatedBy"),
+            pl.col("CaseDetail")
+            .str.extract_all(r"Last Update: (\d\d?/\d\d?/\d\d\d\d)")
+            .arr.join(", ")
+            .str.strip()
+            .alias("SentenceLastUpdate"),
+            pl.col("CaseDetail")
+            .str.extract_all(r"Probation Revoke: (\d\d?/\d\d?/\d\d\d\d)")
+            .arr.join(", ")
+            .str.replace_all(r"Probation Revoke: ", "")
+            .str.strip()
+            .alias("ProbationRevoke"),
+        ]
+    )
+
+    dlog(cases.columns, "cases raw regex", cf=debug)
+
+    # clean columns, unnest totals
+    cases = cases.with_columns(
+        pl.col("RE_Phone")
+        .str.replace_all(r"[^0-9]|2050000000", "")
+        .alias("CLEAN_Phone"),
+        pl.concat_str([pl.col("Address1"), pl.lit(" "), pl.col("Address2")])
+        .str.replace_all(r"JID: \w{3} Hardship.*|Defendant Information.*", "")
+        .str.strip()
+        .alias("StreetAddress"),
+        pl.col("Name"),
+        pl.when(pl.col("PROBATIONOFFICENUMBERRAW") == "0-000000-00")
+        .then(pl.lit(""))
+        .otherwise(pl.col("PROBATIONOFFICENUMBERRAW"))
+        .alias("ProbationOfficeName"),
+        pl.when(pl.col("DLRAW") == "AL")
+        .then(pl.lit(""))
+        .otherwise(pl.col("DLRAW"))
+        .alias("DriverLicenseNo"),
+        pl.when(pl.col("SIDRAW") == "AL000000000")
+        .then(pl.lit(""))
+        .otherwise(pl.col("SIDRAW"))
+        .alias("StateID"),
+        pl.col("TOTALS")
+        .arr.get(0)
+        .str.replace_all(r"[^0-9\.]", "")
+        .cast(pl.Float64, strict=False)
+        .alias("TotalAmtDue"),
+        pl.col("TOTALS")
+        .arr.get(1)
+        .str.replace_all(r"[^0-9\.]", "")
+        .cast(pl.Float64, strict=False)
+        .alias("TotalAmtPaid"),
+        pl.col("TOTALS")
+        .arr.get(2)
+        .str.replace_all(r"[^0-9\.]", "")
+        .cast(pl.Float64, strict=False)
+        .alias("TotalBalance"),
+        pl.col("TOTALS")
+        .arr.get(3)
+        .str.replace_all(r"[^0-9\.]", "")
+        .cast(pl.Float64, strict=False)
+        .alias("TotalAmtHold"),
+    )
+    cases = cases.with_columns(
+        pl.when(pl.col("CLEAN_Phone").str.n_chars() < 7)
+        .then(None)
+        .otherwise(pl.col("CLEAN_Phone"))
+        .alias("Phone"),
+    )
+
+    # clean Charges strings
+    # explode Charges for table parsing, reusing the columns parsed above
+    all_charges = cases.explode("RE_Charges").select(
+        [
+            pl.col("Name"),
+            pl.col("CaseNumber"),
+            pl.col("RE_Charges")
+            .str.replace_all(r"[A-Z][a-z][A-Za-z\s\$]+.+", "")
+            .str.strip()
+            .alias("Charges"),
+            pl.when(pl.col("TotalBalance").is_null())
+            .then(pl.lit(0.0))
+            .otherwise(pl.col("TotalBalance"))
+            .alias("TotalBalance"),
+            pl.when(pl.col("D999RAW").is_null())
+            .then(pl.lit(0.0))
+            .otherwise(pl.col("D999RAW"))
+            .alias("TotalD999"),
+        ]
+    )
+
+    # clean Fees strings
+    # explode Fees for table parsing
+    all_fees = cases.explode("RE_Fees").select(
+        [
+            pl.col("CaseNumber"),
+            pl.col("RE_Fees")
+            .str.replace_all(r"[^A-Z0-9|\.|\s|\$|\n]", " ")
+            .str.strip()
+            .alias("Fees"),
+        ]
+    )
+
+    dlog(cases.columns, cf=debug)
+
+    cases = cases.select(CASE_FIELDS)
+    cases = cases.fill_null("")
+    cases = categorical(cases)
+    cases = cases.sort("CaseNumber")
+    if fields:  # projection pushdown drops the unused expressions
+        cases = cases.select(fields)
+    if lazy:
+        return cases, all_charges, all_fees
+    return tuple(pl.collect_all([cases, all_charges, all_fees]))
+
+
+def split_charges(df, debug=False):
+    lazy = isinstance(df, pl.lazyframe.frame.LazyFrame)
+    dlog(df.columns, "^ split_charges input param", cf=debug)
+    charges = df.lazy().with_columns(
+        [
+            pl.col("Name"),
+            pl.col("CaseNumber"),
+            pl.col("Charges").str.slice(0, 3).alias("Num"),
+            pl.col("Charges").str.slice(4, 4).alias("Code"),
+            pl.col("Charges").str.slice(9, 1).alias("Sort"),
+            pl.col("Charges")
+            .str.extract(r"(\d\d/\d\d/\d\d\d\d)", group_index=1)
+            .alias("CourtActionDate"),
+            pl.col("Charges")
+            .str.extract(
+                r"[A-Z0-9]{3}-[A-Z0-9]{3}-[A-Z0-9]{3}\({0,1}[A-Z]{0,1}\){0,1}\.{0,1}\d{0,1}",
+                group_index=0,
+            )
+            .alias("RAWCITE"),
+            pl.col("Charges")
+            .str.extract(
+                r"(BOUND|GUILTY PLEA|WAIVED TO GJ|DISMISSED|TIME LAPSED|NOL PROSS|CONVICTED|INDICTED|DISMISSED|FORFEITURE|TRANSFER|REMANDED|WAIVED|ACQUITTED|WITHDRAWN|PETITION|PRETRIAL|COND\. FORF\.)",
+                group_index=1,
+            )
+            .alias("CourtAction"),
+            pl.col("Charges")
+            .str.replace_all(
+                r"[A-Z0-9]{3}\s*?-[A-Z0-9]{3}\s*?-[A-Z0-9]{3}\(*?[A-Z]*?\)*?\(*?[A-Z0-9]*?\)*?\.*?\d*?",
+                "\x1f",
+            )
+            .str.split("\x1f")  # same pieces as re.split() on the cite pattern
+            .alias("Split"),
+        ]
+    )
+    dlog(charges.columns, cf=debug)
+    charges = charges.filter(pl.col("Num").str.contains("0"))
+    charges = charges.with_columns(
+        [
+            pl.col("Charges")
+            .str.contains(r"\d\d?/\d\d?/\d\d\d\d")
+            .alias("Disposition"),
+            pl.col("Charges").str.contains(pl.lit("FELONY")).alias("Felony"),
+            pl.col("Charges").str.contains("GUILTY PLEA").alias("GUILTY_PLEA"),
+            pl.col("Charges").str.contains("CONVICTED").alias("CONVICTED"),
+        ]
+    )
+    charges = charges.with_columns(
+        [
+            pl.when(pl.col("Disposition"))
+            .then(pl.col("Split").arr.get(1))
+            .otherwise(pl.col("Split").arr.get(0).str.slice(9))
+            .str.replace(r"-   -", "", literal=True)
+            .str.replace("1STS", "1ST", literal=True)
+            .str.strip()
+            .alias("RAWDESC"),
+            pl.when(pl.col("Disposition"))
+            .then(pl.col("Split").arr.get(0).str.slice(19))
+            .otherwise(pl.col("Split").arr.get(1))
+            .str.strip()
+            .alias("SEG_2"),
+            pl.when(pl.col("Disposition") == True)
+            .then(False)
+            .otherwise(True)
+            .alias("Filing"),
+        ]
+    )
+    dlog(charges.columns, cf=debug)
+    charges = charges.with_columns(
+        [
+            pl.col("SEG_2")
+            .str.extract(
+                r"(TRAFFIC MISDEMEANOR|BOND|FELONY|MISDEMEANOR|OTHER|TRAFFIC|VIOLATION)",
+                group_index=1,
+            )
+            .str.replace("TRAFFIC MISDEMEANOR", "MISDEMEANOR")
+            .alias("TypeDescription"),
+            pl.col("SEG_2")
+            .str.extract(
+                r"(ALCOHOL|BOND|CONSERVATION|DOCKET|DRUG|GOVERNMENT|HEALTH|MUNICIPAL|OTHER|PERSONAL|PROPERTY|SEX|TRAFFIC)",
+                group_index=1,
+            )
+            .alias("Category"),
+            pl.col("RAWDESC")
+            .str.contains(r"(A ATT|ATTEMPT|S SOLICIT|CONSP)")
+            .is_not()
+            .alias("A_S_C_DISQ"),
+            pl.col("Code")
+            .str.contains(
+                r"(OSUA|EGUA|MAN1|MAN2|MANS|ASS1|ASS2|KID1|KID2|HUT1|HUT2|BUR1|BUR2|TOP1|TOP2|TPCS|TPCD|TPC1|TET2|TOD2|ROB1|ROB2|ROB3|FOR1|FOR2|FR2D|MIOB|TRAK|TRAG|VDRU|VDRY|TRAO|TRFT|TRMA|TROP|CHAB|WABC|ACHA|ACAL)"
+            )
+            .alias("CERV_DISQ_MATCH"),
+            pl.col("Code")
+            .str.contains(
+                r"(RAP1|RAP2|SOD1|SOD2|STSA|SXA1|SXA2|ECHI|SX12|CSSC|FTCS|MURD|MRDI|MURR|FMUR|PMIO|POBM|MIPR|POMA|INCE)"
+            )
+            .alias("PARDON_DISQ_MATCH"),
+            pl.col("Charges")
+            .str.contains(r"(CM\d\d|CMUR)|(CAPITAL)")
+            .alias("PERM_DISQ_MATCH"),
+        ]
+    )
+    charges = charges.filter(pl.col("TypeDescription").str.contains(r"[A-Za-z]"))
+    charges = charges.with_columns(
+        [
+            pl.when(pl.col("GUILTY_PLEA") | pl.col("CONVICTED"))
+            .then(True)
+            .otherwise(False)
+            .alias("Conviction")
+        ]
+    )
+    charges = charges.with_columns(
+        [
+            pl.when(
+                pl.col("CERV_DISQ_MATCH")
+                & pl.col("Felony")
+                & pl.col("Conviction")
+                & pl.col("A_S_C_DISQ")
+            )
+            .then(True)
+            .otherwise(False)
+            .alias("CERVDisqConviction"),
+            pl.when(pl.col("CERV_DISQ_MATCH") & pl.col("Felony") & pl.col("A_S_C_DISQ"))
+            .then(True)
+            .otherwise(False)
+            .alias("CERVDisqCharge"),
+            pl.when(
+                pl.col("PARDON_DISQ_MATCH")
+                & pl.col("A_S_C_DISQ")
+                & pl.col("Conviction")
+                & pl.col("Felony")
+            )
+            .then(True)
+            .otherwise(False)
+            .alias("PardonDisqConviction"),
+            pl.when(
+                pl.col("PARDON_DISQ_MATCH") & pl.col("Felony") & pl.col("A_S_C_DISQ")
+            )
+            .then(True)
+            .otherwise(False)
+            .alias("PardonDisqCharge"),
+            pl.when(
+                pl.col("PERM_DISQ_MATCH")
+                & pl.col("A_S_C_DISQ")
+                & pl.col("Felony")
+                & pl.col("Conviction")
+            )
+            .then(True)
+            .otherwise(False)
+            .alias("PermanentDisqConviction"),
+            pl.when(pl.col("PERM_DISQ_MATCH") & pl.col("Felony") & pl.col("A_S_C_DISQ"))
+            .then(True)
+            .otherwise(False)
+            .alias("PermanentDisqCharge"),
+            pl.concat_str([pl.col("CaseNumber"), pl.lit("-"), pl.col("Num")]).alias(
+                "CASENONUM"
+            ),
+        ]
+    )
+    charges = charges.with_columns(
+        [
+            pl.col("TotalBalance"),
+            pl.when(
+                pl.col("CERVDisqConviction")
+                | pl.col("PardonDisqConviction")
+                | pl.col("PermanentDisqConviction")
+            )
+            .then((pl.col("TotalBalance") - pl.col("TotalD999")))
+            .otherwise(None)
+            .alias("PaymentToRestore"),
+        ]
+    )
+    aggch = charges.groupby("CASENONUM").agg("CaseNumber", "RAWCITE", "RAWDESC")
+    aggch = aggch.select(
+        [
+            pl.col("CASENONUM"),
+            pl.col("CaseNumber").arr.get(0).alias("CaseNumber"),
+            pl.col("RAWDESC").arr.get(0).alias("Description"),
+            pl.col("RAWCITE").arr.get(0).alias("Cite"),
+        ]
+    )
+    charges = charges.join(aggch, on="CASENONUM")
+    charges = charges.fill_null("")
+    charges = charges.with_columns(
+        [
+            pl.concat_str(
+                [
+                    pl.col("CaseNumber"),
+                    pl.lit(" - "),
+                    pl.col("Num"),
+                    pl.lit(" "),
+                    pl.col("Cite"),
+                    pl.lit(" "),
+                    pl.col("Description"),
+                    pl.lit(" "),
+                    pl.col("TypeDescription"),
+                    pl.lit(" "),
+                    pl.col("CourtAction"),
+                    pl.lit(" "),
+                    pl.col("CourtActionDate"),
+                ]
+            )
+            .str.strip()
+            .str.replace(r",$", "")
+            .str.replace(r"\s+", " ")
+            .alias("ChargesSummary")
+        ]
+    )
+
+    charges = charges.select(
+        "Name",
+        "CaseNumber",
+        "Num",
+        "Code",
+        "Cite",
+        "Description",
+        "TypeDescription",
+        "Category",
+        "CourtAction",
+        "CourtActionDate",
+        "Conviction",
+        "Felony",
+        "CERVDisqCharge",
+        "CERVDisqConviction",
+        "PardonDisqCharge",
+        "PardonDisqConviction",
+        "PermanentDisqCharge",
+        "PermanentDisqConviction",
+        "Filing",
+        "Disposition",
+        "TotalBalance",
+        "PaymentToRestore",
+        "ChargesSummary",
+    )
+    charges = categorical(charges)
+    charges = charges.sort("CaseNumber")
+    dlog(charges.columns, cf=debug)
+
+    return charges if lazy else charges.collect()
+
+
+def split_fees(df, debug=False):
+    lazy = isinstance(df, pl.lazyframe.frame.LazyFrame)
+    df = df.lazy().with_columns(
+        [
+            pl.col("CaseNumber"),
+            pl.col("Fees")
+            .str.replace(r"(?:\$\d{1,2})( )", "\2")
+            .str.split(" ")
+            .alias("SPACE_SEP"),
+            pl.col("Fees")
+            .str.strip()
+            .str.replace(" ", "")
+            .str.extract_all(r"\s\$\d+\.\d{2}")
+            .alias("FEE_SEP"),
+        ]
+    )
+    dlog(df.columns, cf=debug)
+    df = df.with_columns(
+        [
+            pl.col("CaseNumber"),
+            pl.col("SPACE_SEP").arr.get(0).alias("AdminFee1"),
+            pl.col("SPACE_SEP").arr.get(1).alias("FeeStatus1"),
+            pl.col("FEE_SEP").arr.get(0).str.replace(r"\$", "").alias("AmtDue"),  # good
+            pl.col("FEE_SEP")
+            .arr.get(1)
+            .str.replace(r"\$", "")
+            .alias("AmtPaid"),  # good
+            pl.col("FEE_SEP").arr.get(2).str.replace(r"\$", "").alias("Balance1"),
+            pl.col("SPACE_SEP").arr.get(5).alias("FeeCode"),
+            pl.col("Fees").str.extract(r"(\w00\d)").alias("Payor"),
+            pl.col("Fees").str.extract(r"\s(\d\d\d)\s").alias("Payee"),
+        ]
+    )
+    out = df.with_columns(
+        [
+            pl.col("CaseNumber"),
+            pl.when(pl.col("AdminFee1") != "ACTIVE")
+            .then(True)
+            .otherwise(False)
+            .alias("TOT"),
+            pl.when(pl.col("AdminFee1") == "Total")
+            .then(pl.lit(None))
+            .otherwise(pl.col("FeeStatus1"))
+            .alias("FeeStatus2"),
+            pl.when(pl.col("Balance1").is_in(["L", pl.Null]))
+            .then("$0.00")
+            .otherwise(pl.col("Balance1").str.replace_all(r"[A-Z]|\$", ""))
+            .alias("AmtHold2"),
+        ]
+    )
+    out = out.with_columns(
+        pl.when(pl.col("TOT") == True)
+        .then(pl.col("FEE_SEP").arr.get(-1).str.replace(r"\$", ""))
+        .otherwise(pl.col("FEE_SEP").arr.get(2).str.replace(r"\$", ""))
+        .alias("AmtHold"),
+        pl.when(pl.col("TOT") == False)
+        .then(pl.col("SPACE_SEP").arr.get(0))
+        .otherwise(pl.lit(""))
+        .alias("FeeStatus"),
+        pl.when(pl.col("TOT") == False)
+        .then(pl.col("SPACE_SEP").arr.get(1))
+        .otherwise(pl.lit(""))
+        .alias("AdminFee"),
+        pl.when(pl.col("TOT") == True)
+        .then(pl.lit("Total:"))
+        .otherwise(pl.lit(""))
+        .alias("Total"),
+    )
+    dlog(out.columns, cf=debug)
+    out = out.with_columns(
+        [
+            pl.col("AmtDue").str.strip().cast(pl.Float64, strict=False),
+            pl.col("AmtPaid").str.strip().cast(pl.Float64, strict=False),
+            pl.col("AmtHold").str.strip().cast(pl.Float64, strict=False),
+        ]
+    )
+    out = out.with_columns([pl.col("AmtDue").sub(pl.col("AmtPaid")).alias("Balance")])
+    out = out.select(
+        "CaseNumber",
+        "Total",
+        "FeeStatus",
+        "AdminFee",
+        "FeeCode",
+        "Payor",
+        "Payee",
+        "AmtDue",
+        "AmtPaid",
+        "Balance",
+        "AmtHold",
+    )
+    dlog(out.columns, cf=debug)
+    out = out.fill_null("")
+    out = out.drop_nulls("AmtDue")
+    out = categorical(out)
+    return out if lazy else out.collect()
+
+
+def explode_images(df, debug=False):
+    lazy = isinstance(df, pl.lazyframe.frame.LazyFrame)
+    images = case_sections(case_keys(df).lazy()).select(
+        [
+            pl.col("CaseNumber"),
+            pl.col("ImagesChunk").str.strip(),
+        ]
+    )
+    images = images.select(
+        [
+            pl.col("CaseNumber"),
+            pl.col("ImagesChunk")
+            .str.replace_all("© Alacourt.com", "", literal=True)
+            .str.split("\n")
+            .alias("Images"),
+        ]
+    )
+    images = images.explode("Images")
+    images = images.filter(pl.col("Images").str.contains(r"[A-Za-z0-9]"))
+    images = images.select(
+        [
+            pl.col("CaseNumber"),
+            pl.col("Images")
+            .str.replace_all(r"[A-Z][a-z]+", " ")
+            .str.replace_all(r"[\s\:]+", " ")
+            .str.strip(),
+        ]
+    )
+    return images if lazy else images.collect()
+
+
+def explode_case_action_summary(df, debug=False):
+    lazy = isinstance(df, pl.lazyframe.frame.LazyFrame)
+    cas = case_sections(case_keys(df).lazy()).select(
+        [
+            pl.col("CaseNumber"),
+            pl.col("CASChunk")
+            .str.replace_all(r"\s+", " ")
+            .alias("CASChunk"),
+        ]
+    )
+    cas = cas.select(
+        [
+            pl.col("CaseNumber"),
+            pl.col("CASChunk")
+            .str.replace(r"© Alacourt\.com|Date: Description Doc# Title|Operator", "")
+            .str.replace(r"Date\: Time Code CommentsCase Action Summary", "")
+            .str.strip()
+            .str.rstrip()
+            .str.split("\n")
+            .alias("CaseActionSummary"),
+        ]
+    )
+    cas = cas.explode("CaseActionSummary")
+    cas = cas.filter(pl.col("CaseActionSummary").str.contains(r"[A-Za-z0-9]"))
+    return cas if lazy else cas.collect()
+
+
+def explode_attorneys(df, debug=False):
+    lazy = isinstance(df, pl.lazyframe.frame.LazyFrame)
+    att = case_sections(case_keys(df).lazy()).select(
+        [
+            pl.col("CaseNumber"),
+            pl.col("AttorneysChunk")
+            .str.replace(r"Warrant.+", "")
+            .str.replace_all(r"[A-Z][a-z]+", " ")
+            .str.replace_all(r"[\s\:]+", " ")
+            .str.strip()
+            .alias("Attorneys"),
+        ]
+    )
+    att = att.drop_nulls()
+    return att if lazy else att.collect()
+
+
+def explode_witnesses(df, debug=False):
+    lazy = isinstance(df, pl.lazyframe.frame.LazyFrame)
+    wit = case_sections(case_keys(df).lazy()).select(
+        [
+            pl.col("CaseNumber"),
+            pl.col("WitnessesChunk")
+            .str.replace(r"\# Date Served Service Type Attorney Issued Type", "")
+            .str.replace(r"SJIS Witness List", "")
+            .str.replace("Date Issued", "")
+            .str.replace("Subpoena", "")
+            .str.replace("List", "")
+            .str.replace("Requesting Party Name Witness", "")
+            .str.replace("Date: Time Code Comments", "")
+            .str.replace(r"© Alacourt.com \d\d?/\d\d?/\d\d\d\d", "")
+            .str.replace(
+                r"Requesting Party Name Witness # Date Served Service Type Attorney Issued Type   Date Issued   Subpoena",
+                "",
+            )
+            .str.replace_all(r"[A-Z][a-z]+", " ")
+            .str.replace_all(r"[\s\:]+", " ")
+            .str.strip()
+            .alias("Witnesses"),
+        ]
+    )
+    wit = wit.drop_nulls()
+    return wit if lazy else wit.collect()
+
+
+def explode_settings(df, debug=False):
+    lazy = isinstance(df, pl.lazyframe.frame.LazyFrame)
+    settings = case_sections(case_keys(df).lazy()).select(
+        [
+            pl.col("CaseNumber"),
+            pl.col("SettingsChunk")
+            .str.replace(r"Settings", "")
+            .str.replace(r"Date\:", "")
+            .str.replace(r"Que\:", "")
+            .str.replace(r"Time\:", "")
+            .str.replace(r"Description\:", "")
+            .str.replace(
+                r"Disposition Charges   # Code Court Action Category Cite Court Action",
+                "",
+            )
+            .str.replace(r"Parties Party 1 - Plaintiff", "")
+            .str.replace(r"Court Action.+", "")
+            .str.strip()
+            .alias("SET1"),
+        ]
+    )
+    settings = settings.select(
+        [
+            pl.col("CaseNumber"),
+            pl.col("SET1")
+            .str.replace_all(r"[A-Z][a-z]+", " ")
+            .str.replace_all(r"[\s\:]+", " ")
+            .str.strip()
+            .alias("Settings"),
+        ]
+    )
+    settings = settings.drop_nulls()
+    return settings if lazy else settings.collect()
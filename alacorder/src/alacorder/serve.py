@@ -0,0 +1,269 @@
+"""
+Parse server: `serve()` keeps worker processes with the parsing engine loaded and answers table jobs over a local Unix socket or HTTP, and `request_table()` sends it jobs.
+"""
+
+import polars as pl
+import os, stat, time, json, signal, socket, threading, multiprocessing
+import http.client, socketserver
+from io import BytesIO
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from .logs import error, name, plog, version
+from .parse import CASE_FIELDS, parse_tables
+from .io import MULTI_SHEETS, load_tables, read
+
+print = plog
+
+SERVE_PORT = 8765
+SERVE_TABLES = MULTI_SHEETS + ["charges"]
+SERVE_FORMATS = {
+    "ipc": "application/vnd.apache.arrow.file",
+    "parquet": "application/vnd.apache.parquet",
+}
+QUIET = {"LOG": False, "DEBUG": False, "WINDOW": None, "FORCE": False, "PROFILE": None}
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=None):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+def check_job(job):
+    """
+    Return error message if `job` is not a valid table job (see `serve_job()`), else None.
+    """
+    if not isinstance(job, dict):
+        return "Job must be a JSON object."
+    if job.get("table", "cases") not in SERVE_TABLES:
+        return f"Table must be one of {', '.join(SERVE_TABLES)}."
+    if job.get("format", "ipc") not in SERVE_FORMATS:
+        return f"Format must be one of {', '.join(SERVE_FORMATS)}."
+    if ("input" in job) == ("texts" in job):
+        return "Job requires one of input (archive path) or texts (case texts)."
+    if "input" in job and not (
+        isinstance(job["input"], str) and os.path.exists(job["input"])
+    ):
+        return f"No archive or PDF directory at {job['input']}."
+    if "texts" in job and not (
+        isinstance(job["texts"], list) and all(isinstance(t, str) for t in job["texts"])
+    ):
+        return "Texts must be a list of case texts."
+    fields = job.get("fields") or []
+    if not isinstance(fields, list) or any(f not in CASE_FIELDS for f in fields):
+        return f"Fields must be a list of {', '.join(CASE_FIELDS)}."
+    return None
+
+
+def serve_job(job):
+    """
+    Return table selected by `job` as Arrow IPC or Parquet bytes, and its row count. Runs in a `serve()` worker process. Archive path inputs are loaded from their case database when it is current (see `load_tables()`), so repeat jobs on an archive skip parsing.
+
+    Args:
+        job (dict): Job with keys:
+            table (str, optional): Table to return (see `SERVE_TABLES`, default cases)
+            input (str): Path to archive or PDF directory, or
+            texts (List[str]): Case texts (AllPagesText)
+            fields (List[str], optional): Cases table columns to return (see `CASE_FIELDS`)
+            format (str, optional): "ipc" (default) or "parquet"
+    """
+    table = job.get("table", "cases")
+    fields = job.get("fields") or None
+    if "texts" in job:
+        df = read(
+            pl.DataFrame(
+                {"Timestamp": time.time(), "AllPagesText": job["texts"], "Path": ""}
+            )
+        )
+        out = parse_tables(df, cf=QUIET, fields=fields)[table]
+    else:
+        out = load_tables(job["input"], cf=QUIET)[table]
+        if fields and table == "cases":
+            out = out.select(fields)
+    f = BytesIO()
+    if job.get("format", "ipc") == "parquet":
+        out.write_parquet(f)
+    else:
+        out.write_ipc(f)
+    return f.getvalue(), out.shape[0]
+
+
+def serve_worker():
+    """
+    Warm up a `serve()` worker process by parsing an empty case, so the first job does not pay for it.
+    """
+    serve_job({"table": "cases", "texts": [""]})
+
+
+def serve(socket_path=None, host="127.0.0.1", port=SERVE_PORT, workers=1, log=True):
+    """
+    Answer table jobs with `workers` worker processes until interrupted, listening on Unix socket at `socket_path` if given, else HTTP at `host`:`port`. POST a JSON job (see `serve_job()`) to `/table` to receive the table as Arrow IPC or Parquet, or GET `/health` for server status. Errors are returned as JSON `{"error": message}`.
+
+    Args:
+        socket_path (str, optional): Path to Unix socket to listen on
+        host (str, optional): HTTP host to listen on (default localhost only)
+        port (int, optional): HTTP port to listen on
+        workers (int, optional): Number of processes to parse jobs concurrently
+        log (bool, optional): Print each job to console
+    """
+    workers = max(workers, 1)
+    ctx = multiprocessing.get_context("spawn")  # polars is not fork-safe
+    pool = [None]
+    lock = threading.Lock()
+
+    def start_pool():
+        pool[0] = ProcessPoolExecutor(
+            max_workers=workers, mp_context=ctx, initializer=serve_worker
+        )
+        for fut in [pool[0].submit(time.sleep, 0) for _ in range(workers)]:
+            fut.result()  # start every worker now rather than on first job
+
+    def submit(job):
+        with lock:
+            try:
+                return pool[0].submit(serve_job, job)
+            except BrokenProcessPool:  # a worker died, i.e. out of memory
+                print("Restarting worker processes...", cf=log)
+                pool[0].shutdown(wait=False)
+                start_pool()
+                return pool[0].submit(serve_job, job)
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive for clients sending many jobs
+
+        def log_message(self, *args):
+            pass
+
+        def reply(self, status, body, content_type="application/json", rows=None):
+            if not isinstance(body, bytes):
+                body = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            if rows != None:
+                self.send_header("X-Alacorder-Rows", str(rows))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path != "/health":
+                return self.reply(404, {"error": f"No such path {self.path}."})
+            self.reply(200, {"name": name, "version": version, "workers": workers})
+
+        def do_POST(self):
+            if self.path != "/table":
+                return self.reply(404, {"error": f"No such path {self.path}."})
+            start = time.perf_counter()
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                job = json.loads(self.rfile.read(length))
+            except ValueError:
+                return self.reply(400, {"error": "Job must be JSON."})
+            message = check_job(job)
+            if message != None:
+                return self.reply(400, {"error": message})
+            table = job.get("table", "cases")
+            try:
+                body, rows = submit(job).result()
+            except Exception as e:
+                print(f"Failed {table} job: {e}", cf=log)
+                return self.reply(500, {"error": str(e)})
+            print(
+                f"Served {rows} {table} rows in {time.perf_counter() - start:.2f}s.",
+                cf=log,
+            )
+            self.reply(200, body, SERVE_FORMATS[job.get("format", "ipc")], rows)
+
+    print(f"Starting {workers} worker processes...", cf=log)
+    start_pool()
+    if socket_path:
+        if os.path.exists(socket_path):
+            if not stat.S_ISSOCK(os.stat(socket_path).st_mode):
+                error(f"Cannot listen on {socket_path} because it is not a socket.")
+            os.remove(socket_path)  # stale socket from an earlier server
+        server = UnixHTTPServer(socket_path, Handler)
+        print(f"Serving table jobs on {socket_path}.", cf=log)
+    else:
+        server = ThreadingHTTPServer((host, port), Handler)
+        url = f"http://{host}:{server.server_address[1]}"
+        print(f"Serving table jobs on {url}.", cf=log)
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, signal.default_int_handler)  # stop on kill too
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        pool[0].shutdown(cancel_futures=True)
+        if socket_path and os.path.exists(socket_path):
+            os.remove(socket_path)
+        print("Stopped serving table jobs.", cf=log)
+
+
+def request_table(
+    source,
+    table="cases",
+    fields=None,
+    format="ipc",
+    socket_path=None,
+    host="127.0.0.1",
+    port=SERVE_PORT,
+    timeout=None,
+):
+    """
+    Return `table` parsed from `source` by a running `serve()` server as a DataFrame. Categorical columns are encoded by the server's string cache, so cast them to `pl.Utf8` before comparing or joining with tables parsed in this process.
+
+    Args:
+        source (str | List[str] | pl.DataFrame): Path to archive or PDF directory readable by the server, list of case texts, or archive DataFrame with `AllPagesText` column
+        table (str, optional): Table to return (see `SERVE_TABLES`)
+        fields (List[str] | str, optional): Cases table columns to return (list or comma-separated, see `CASE_FIELDS`)
+        format (str, optional): Transfer format, "ipc" or "parquet"
+        socket_path (str, optional): Path to server Unix socket (default HTTP)
+        host (str, optional): Server HTTP host
+        port (int, optional): Server HTTP port
+        timeout (float, optional): Seconds to wait for the server
+    """
+    job = {"table": table, "format": format}
+    if isinstance(fields, str):  # i.e. "CaseNumber,Name,DOB"
+        fields = [f.strip() for f in fields.split(",") if f.strip()]
+    if fields:
+        job["fields"] = fields
+    if isinstance(source, str):
+        job["input"] = os.path.abspath(source)
+    elif isinstance(source, pl.dataframe.frame.DataFrame):
+        job["texts"] = source["AllPagesText"].to_list()
+    else:
+        job["texts"] = list(source)
+    if socket_path:
+        conn = UnixHTTPConnection(socket_path, timeout=timeout)
+    else:
+        conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        conn.request(
+            "POST",
+            "/table",
+            body=json.dumps(job).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        res = conn.getresponse()
+        body = res.read()
+    finally:
+        conn.close()
+    if res.status != 200:
+        message = json.loads(body)["error"]
+        error(f"Parse server could not complete {table} job: {message}")
+    if format == "parquet":
+        return pl.read_parquet(BytesIO(body))
+    return pl.read_ipc(BytesIO(body))
@@ -0,0 +1,277 @@
+"""
+Watch folder: `watch()` archives case PDFs as they arrive in a directory, tracking which files it has archived in a persistent file-state index.
+"""
+
+import polars as pl
+import os, time, signal, sqlite3, threading, multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+from .logs import error, plog
+from .parse import case_keys, parse_tables
+from .io import (
+    MULTI_SHEETS,
+    archive_parts,
+    archived_queue,
+    extend_or_write,
+    extract_text,
+    file_hash,
+    is_dataset,
+    parquet_options,
+    read,
+    read_paths,
+    stored_key,
+)
+
+print = plog
+
+
+def watch_index_path(path):
+    """
+    Return path to `watch()` file-state index for archive at `path` (i.e. `archive.watch.sqlite` beside `archive.parquet`).
+    """
+    return os.path.splitext(os.path.normpath(path))[0] + ".watch.sqlite"
+
+
+def open_watch_index(path):
+    """
+    Open `watch()` file-state index at `path`, creating it if needed, and return sqlite3 connection.
+    """
+    con = sqlite3.connect(path)
+    con.execute(
+        """
+        CREATE TABLE IF NOT EXISTS files (
+            path TEXT PRIMARY KEY, size INTEGER, mtime INTEGER, hash TEXT
+        )
+        """
+    )
+    return con
+
+
+def scan_pdfs(inputs, index, settle=1.0):
+    """
+    Return sorted list of (path, size, mtime) of PDFs under directory `inputs` whose size or mtime differ from `index`, skipping PDFs modified in the last `settle` seconds, which may still be being written. Only directory entries are read, so unchanged PDFs cost one stat each and are never opened.
+
+    Args:
+        inputs (str): PDF directory
+        index (dict): Path to (size, mtime, hash) of PDFs already seen
+        settle (float, optional): Seconds a PDF must be unmodified before it is returned
+    """
+    now = time.time_ns()
+    found = []
+    dirs = [inputs]
+    while len(dirs) > 0:
+        try:
+            entries = os.scandir(dirs.pop())
+        except OSError:  # removed since listed
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                    continue
+                if not entry.name.endswith(".pdf"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                row = index.get(entry.path)
+                if row != None and row[0] == st.st_size and row[1] == st.st_mtime_ns:
+                    continue
+                if now - st.st_mtime_ns < settle * 1e9:
+                    continue
+                found.append((entry.path, st.st_size, st.st_mtime_ns))
+    return sorted(found)
+
+
+def watch_extract(path):
+    """
+    Return full text and BLAKE2b hex digest of PDF at `path`, or None digest if it could not be read.
+    """
+    text = extract_text(path)
+    try:
+        return text, file_hash(path)
+    except OSError:
+        return text, None
+
+
+def archived_rows(stored, paths):
+    """
+    Return boolean Series, True where archive `Path` values `stored` are PDFs in absolute `paths`. Relative stored paths match by their trailing components, as in `archived_queue()`.
+    """
+    keys = {}
+    for pp in paths:
+        keys[pp] = True
+        parts = pp.split(os.sep)
+        for i in range(1, len(parts)):
+            keys[os.sep.join(parts[i:])] = True
+    return pl.Series([stored_key(pp) in keys for pp in stored], dtype=pl.Boolean)
+
+
+def watch_drop(path, column, match):
+    """
+    Remove rows from archive or table dataset at `path` where `match` (a function of the `column` Series returning a boolean Series) is True, rewriting only the files that hold them. Returns the removed rows.
+    """
+    if is_dataset(path):
+        files = archive_parts(path)
+    elif os.path.isfile(path):
+        files = [path]
+    else:
+        return pl.DataFrame()
+    removed = []
+    for fp in files:
+        csv = os.path.splitext(fp)[1] == ".csv"
+        if csv:
+            keys = pl.read_csv(fp, columns=[column], ignore_errors=True)[column]
+        else:
+            keys = pl.read_parquet(fp, columns=[column])[column]
+        hit = match(keys)
+        if not hit.any():
+            continue
+        df = pl.read_csv(fp, ignore_errors=True) if csv else pl.read_parquet(fp)
+        removed.append(df.filter(hit))
+        if fp != path and hit.all():  # dataset part holding only replaced rows
+            os.remove(fp)
+            continue
+        tmp = f"{fp}.{os.getpid()}.tmp"  # a crash never leaves a partial file
+        if csv:
+            df.filter(~hit).write_csv(tmp)
+        else:
+            df.filter(~hit).write_parquet(tmp, **parquet_options(dataset=fp != path))
+        os.replace(tmp, fp)
+    if len(removed) == 0:
+        return pl.DataFrame()
+    with pl.StringCache():  # categorical table parts written by separate batches
+        return pl.concat(removed, how="diagonal")
+
+
+def watch_batch(batch, executor, con, index, path, tables=None, log=True):
+    """
+    Extract text from PDFs in `batch` from `scan_pdfs()` with `executor`, append their cases to archive at `path` and tables in directory `tables` if given, then record them in file-state index `con` and `index`. PDFs changed during extraction are left for the next scan, and PDFs whose contents are unchanged (i.e. touched or copied again) are not appended twice.
+
+    A PDF whose contents changed since it was archived replaces its earlier cases: the archive rows with its `Path`, and the table rows with their `CaseNumber`, are removed (see `watch_drop()`) before the new rows are appended, so the archive and tables hold one copy of each PDF. Because the index is committed last, a batch interrupted between the two is replaced again on the next scan rather than duplicated. Returns number of cases archived.
+    """
+    seen = []
+    pending = []
+    for pp, size, mtime in batch:
+        old = index.get(pp)
+        if old != None and old[2] != None:
+            try:
+                if file_hash(pp) == old[2]:
+                    seen.append((pp, size, mtime, old[2]))
+                    continue
+            except OSError:
+                continue
+        pending.append((pp, size, mtime, executor.submit(watch_extract, pp)))
+    rows = []
+    for pp, size, mtime, fut in pending:
+        text, digest = fut.result()
+        try:
+            st = os.stat(pp)
+        except OSError:  # removed while extracting
+            continue
+        if st.st_size != size or st.st_mtime_ns != mtime:
+            continue
+        seen.append((pp, size, mtime, digest))
+        if text == "":
+            print(f"Could not read {pp}.", cf=log)
+            continue
+        rows.append((pp, text))
+    replaced = [pp for pp, text in rows if pp in index]
+    if len(replaced) > 0:
+        old = watch_drop(path, "Path", lambda s: archived_rows(s, replaced))
+        if old.shape[0] > 0:
+            print(f"Replacing {old.shape[0]} cases from changed PDFs.", cf=log)
+        if old.shape[0] > 0 and tables:
+            numbers = case_keys(old)["CaseNumber"].unique().to_list()
+            for sheet in MULTI_SHEETS:
+                table = os.path.join(tables, f"{sheet}.parquet")
+                watch_drop(table, "CaseNumber", lambda s: s.is_in(numbers))
+    if len(rows) > 0:
+        df = read(
+            pl.DataFrame(
+                {
+                    "Timestamp": time.time(),
+                    "AllPagesText": [text for pp, text in rows],
+                    "Path": [pp for pp, text in rows],
+                }
+            )
+        )
+        extend_or_write(df, path)
+        if tables:
+            quiet = {"LOG": False, "DEBUG": False, "WINDOW": None, "PROFILE": None}
+            parsed = parse_tables(df, cf=quiet)
+            for sheet in MULTI_SHEETS:
+                extend_or_write(parsed[sheet], os.path.join(tables, f"{sheet}.parquet"))
+        print(f"Archived {len(rows)} cases to {path}.", cf=log)
+    con.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", seen)
+    con.commit()  # after the archive, so a crash re-archives rather than loses cases
+    for pp, size, mtime, digest in seen:
+        index[pp] = (size, mtime, digest)
+    return len(rows)
+
+
+def watch(
+    inputs,
+    path,
+    tables=None,
+    interval=2.0,
+    settle=1.0,
+    workers=1,
+    batch_size=100,
+    once=False,
+    log=True,
+):
+    """
+    Archive case PDFs as they arrive in directory `inputs`, appending them to archive at `path` in batches, until interrupted. Every `interval` seconds the directory is scanned for new or changed PDFs against a file-state index kept beside the archive (see `watch_index_path()`), so restarts resume where they stopped and only new PDFs are extracted. PDFs whose contents change after they are archived replace their earlier cases (see `watch_batch()`). On first run with an existing archive, its PDFs are recorded in the index without extracting them again, matching relative archived paths as `archived_queue()` does.
+
+    Args:
+        inputs (str): PDF directory to watch
+        path (str): Path to new or existing archive
+        tables (str, optional): Directory to append each batch's multitable export tables to, as `<table>.parquet` datasets
+        interval (float, optional): Seconds between scans
+        settle (float, optional): Seconds a PDF must be unmodified before it is archived
+        workers (int, optional): Number of processes to use for PDF text extraction
+        batch_size (int, optional): Maximum PDFs per archive append
+        once (bool, optional): Scan and archive once, then return
+        log (bool, optional): Print logs to console
+    """
+    if not os.path.isdir(inputs):
+        error(f"No PDF directory at {inputs}.")
+    inputs = os.path.abspath(inputs)
+    if tables:
+        os.makedirs(tables, exist_ok=True)
+    con = open_watch_index(watch_index_path(path))
+    index = {
+        r[0]: r[1:] for r in con.execute("SELECT path, size, mtime, hash FROM files")
+    }
+    if len(index) == 0 and os.path.exists(path):
+        found = scan_pdfs(inputs, index, settle=0)
+        done = archived_queue(read_paths(path), [pp for pp, size, mtime in found])
+        rows = [(pp, size, mtime, None) for pp, size, mtime in found if pp in done]
+        con.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)", rows)
+        con.commit()
+        index = {r[0]: r[1:] for r in rows}
+        print(f"Found {len(index)} PDFs already in archive at {path}.", cf=log)
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGTERM, signal.default_int_handler)  # stop on kill too
+    total = 0
+    ctx = multiprocessing.get_context("spawn")  # polars is not fork-safe
+    executor = ProcessPoolExecutor(max_workers=max(workers, 1), mp_context=ctx)
+    print(f"Watching {inputs} for case PDFs...", cf=log)
+    try:
+        while True:
+            found = scan_pdfs(inputs, index, settle)
+            for i in range(0, len(found), batch_size):
+                batch = found[i : i + batch_size]
+                total += watch_batch(batch, executor, con, index, path, tables, log)
+            if once:
+                break
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        executor.shutdown(cancel_futures=True)
+        con.close()
+    print(f"Stopped watching {inputs} after archiving {total} cases.", cf=log)
+    return total